@@ -1,10 +1,15 @@
-from app.core.database import SessionLocal
-from fastapi import Depends, HTTPException
+import math
+
+from app.core.database import AsyncSessionLocal, SessionLocal
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.security import SECRET_KEY, ALGORITHM
+from app.services.rate_limit_service import check_rate_limit
+from app.utils.client_ip import client_ip
 
 security = HTTPBearer()
 
@@ -15,6 +20,10 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -24,3 +33,35 @@ def get_current_admin(
         return payload
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+
+
+def rate_limit(rule: str, identifier_field: str | None = None):
+    """
+    Dependency: token buckets per client IP and, with identifier_field,
+    per value of that JSON body field (mobile / email / username).
+
+    Runs before the endpoint body; an empty bucket answers 429 with
+    Retry-After. Behind a proxy, set TRUSTED_PROXIES so the per-IP bucket
+    is the real client and not the proxy.
+    """
+    async def check(request: Request, db: AsyncSession = Depends(get_async_db)):
+        identifier = None
+        if identifier_field:
+            try:
+                body = await request.json()  # body bytes are cached for the endpoint
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and isinstance(body.get(identifier_field), str):
+                identifier = body[identifier_field].strip().lower()
+
+        ip = client_ip(request)
+
+        retry_after = await check_rate_limit(db, rule, ip, identifier)
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests, please try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+
+    return check
@@ -1,28 +1,42 @@
 from datetime import datetime
 from app.services.membership_service import generate_membership_id
-from app.schemas.admin_bulk import BulkUserActionRequest
+from app.schemas.admin_bulk import BulkUserActionRequest, RegenerateCertificatesRequest
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.schemas.admin import AdminLoginRequest, AdminLoginResponse
 
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import (
+    PASSWORD_RETRY_AFTER_SECONDS,
+    PasswordHashBusy,
+    create_access_token,
+    hash_password_async,
+    verify_and_update_password_async
+)
 from app.models.admin_user import AdminUser
 from app.models.user_verified import UserVerified
-from app.api.deps import get_db
+from app.api.deps import get_async_db, get_db, rate_limit
 from app.api.deps import get_current_admin
-import io
-import csv
-from io import StringIO
 from fastapi.responses import StreamingResponse
 from app.models.admin_audit_log import AdminAuditLog
 from app.services.email_service import send_approval_email
-from app.services.email_service import send_rejection_email
 from app.models.user_pending import UserPending
-from app.models.user_rejected import UserRejected
-from app.models.admin_audit_log import AdminAuditLog
 from fastapi import BackgroundTasks
 from app.api.admin_permissions import require_roles
 from app.schemas.admin_manage import AdminCreateRequest, AdminResetPasswordRequest, AdminUpdateRoleRequest
+from app.utils.pagination import keyset_paginate
+from app.services.count_service import COUNT_STRATEGIES, count_rows
+from app.services.rollup_service import record_transition, get_status_summary, get_daily_trend
+from app.utils.csv_stream import iter_csv
+from app.services.job_service import enqueue_job
+from app.models.admin_job import AdminJob
+from app.services.certificate_service import certificate_query
+from app.services.pdf_cache import cache_stats
+from app.core.database import db_pool_stats
+from app.utils.language import normalize_language
+from app.services.font_service import certificate_language
+import uuid
 
 #---
 from datetime import date
@@ -30,6 +44,8 @@ from sqlalchemy import func
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+EXPORT_YIELD_PER = 1000
+
 
 def build_user_query(
     db: Session,
@@ -60,16 +76,40 @@ def build_user_query(
     return query
 
 
-@router.post("/login", response_model=AdminLoginResponse)
-def admin_login(
+async def _password_work(hashing):
+    try:
+        return await hashing
+    except PasswordHashBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many logins right now, please try again shortly",
+            headers={"Retry-After": str(PASSWORD_RETRY_AFTER_SECONDS)}
+        )
+
+
+@router.post("/login", response_model=AdminLoginResponse, dependencies=[Depends(rate_limit("admin_login", "username"))])
+async def admin_login(
     data: AdminLoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    admin = db.query(AdminUser).filter(AdminUser.username == data.username).first()
+    admin = await db.scalar(select(AdminUser).where(AdminUser.username == data.username))
 
-    if not admin or not verify_password(data.password, admin.password_hash):
+    if not admin:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    # bcrypt is CPU work: on the bounded password executor, off the event loop / threadpool
+    valid, new_hash = await _password_work(
+        verify_and_update_password_async(data.password, admin.password_hash)
+    )
+
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # Stored with another BCRYPT_ROUNDS: upgrade it now that the password is known
+    if new_hash:
+        admin.password_hash = new_hash
+        await db.commit()
+
     token = create_access_token({
         "sub": str(admin.id),
         "role": admin.role
@@ -85,9 +125,9 @@ def admin_login(
 
 
 @router.post("/create-admin")
-def create_admin(
+async def create_admin(
     payload: AdminCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: dict = Depends(get_current_admin)
 ):
     require_roles(current_admin, ["super_admin"])
@@ -95,9 +135,9 @@ def create_admin(
     if payload.role not in ["super_admin", "verifier", "readonly"]:
         raise HTTPException(400, "Invalid role")
 
-    existing = db.query(AdminUser).filter(
+    existing = await db.scalar(select(AdminUser.id).where(
         AdminUser.username == payload.username
-    ).first()
+    ))
 
     if existing:
         raise HTTPException(400, "Admin already exists")
@@ -107,12 +147,12 @@ def create_admin(
 
     new_admin = AdminUser(
         username=payload.username,
-        password_hash=hash_password(payload.password),
+        password_hash=await _password_work(hash_password_async(payload.password)),
         role=payload.role
     )
 
     db.add(new_admin)
-    db.commit()
+    await db.commit()
 
     return {"message": "Admin created successfully"}
 
@@ -189,10 +229,10 @@ def update_admin_role(
 #     return {"message": "Password reset successful"}
 
 @router.put("/admins/{username}/reset-password")
-def reset_admin_password(
+async def reset_admin_password(
     username: str,
     payload: AdminResetPasswordRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: dict = Depends(get_current_admin)
 ):
     require_roles(current_admin, ["super_admin"])
@@ -200,7 +240,7 @@ def reset_admin_password(
     if len(payload.new_password) < 8:
         raise HTTPException(400, "Password must be at least 8 characters")
 
-    admin = db.query(AdminUser).filter(AdminUser.username == username).first()
+    admin = await db.scalar(select(AdminUser).where(AdminUser.username == username))
 
     if not admin:
         raise HTTPException(404, "Admin not found")
@@ -208,8 +248,8 @@ def reset_admin_password(
     if admin.username == current_admin.get("username"):
         raise HTTPException(400, "You cannot reset your own password")
 
-    admin.password_hash = hash_password(payload.new_password)
-    db.commit()
+    admin.password_hash = await _password_work(hash_password_async(payload.new_password))
+    await db.commit()
 
     return {"message": "Password reset successful"}
 
@@ -335,8 +375,6 @@ def list_admins(
 
 
 
-from sqlalchemy import and_
-from app.models.user_pending import UserPending
 from typing import Optional
 
 
@@ -382,9 +420,12 @@ from typing import Optional
 
 
 @router.get("/pending-users")
-def get_pending_users(
+async def get_pending_users(
     page: int = 1,
     size: int = 20,
+    after: Optional[str] = None,
+    count: bool = True,
+    count_strategy: str = "exact",
 
     # Filters
     desired_name: Optional[str] = None,
@@ -394,7 +435,7 @@ def get_pending_users(
     gothram: Optional[str] = None,
     surname: Optional[str] = None,
 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: dict = Depends(get_current_admin)
 ):
     require_roles(current_admin, ["super_admin", "verifier"])
@@ -412,70 +453,98 @@ def get_pending_users(
             detail=f"Size must be between 1 and {MAX_PAGE_SIZE}"
         )
 
-    # =========================
-    # BASE QUERY (ONLY PENDING)
-    # =========================
-    query = db.query(UserPending).filter(UserPending.status == "pending")
+    if count_strategy not in COUNT_STRATEGIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"count_strategy must be one of {', '.join(COUNT_STRATEGIES)}"
+        )
 
-    # =========================
-    # FILTERS
-    # =========================
-    
+    # Query helpers are sync (Query API): run them on the async
+    # connection through run_sync, the event loop is never blocked
+    def load(db: Session):
+        # =========================
+        # BASE QUERY (ONLY PENDING)
+        # =========================
+        query = db.query(UserPending).filter(UserPending.status == "pending")
 
-    if state:
-        query = query.filter(UserPending.current_state == state)
+        # =========================
+        # FILTERS
+        # =========================
 
-    if desired_name:
-        query = query.filter(UserPending.desired_name.ilike(f"%{desired_name}%"))
 
-    if district:
-        query = query.filter(UserPending.current_district == district)
+        if state:
+            query = query.filter(UserPending.current_state == state)
 
-    if mandal:
-        query = query.filter(UserPending.current_mandal == mandal)
+        if desired_name:
+            query = query.filter(UserPending.desired_name.ilike(f"%{desired_name}%"))
 
-    if gothram:
-        query = query.filter(UserPending.gothram.ilike(f"%{gothram}%"))
+        if district:
+            query = query.filter(UserPending.current_district == district)
 
-    if surname:
-        query = query.filter(UserPending.surname == surname)
+        if mandal:
+            query = query.filter(UserPending.current_mandal == mandal)
 
-    # =========================
-    # TOTAL COUNT
-    # =========================
-    total_records = query.count()
+        if gothram:
+            query = query.filter(UserPending.gothram.ilike(f"%{gothram}%"))
 
-    # =========================
-    # PAGINATION
-    # =========================
-    offset = (page - 1) * size
+        if surname:
+            query = query.filter(UserPending.surname == surname)
 
-    users = (
-        query
-        .order_by(UserPending.created_at.desc())
-        .offset(offset)
-        .limit(size)
-        .all()
-    )
+        # =========================
+        # TOTAL COUNT (OPTIONAL)
+        # =========================
+        total_records = None
+        if count:
+            total_records = count_rows(
+                db,
+                query,
+                count_strategy,
+                cache_key=("pending", desired_name, state, district, mandal, gothram, surname)
+            )
+
+        # =========================
+        # PAGINATION (CURSOR OR PAGE)
+        # =========================
+        try:
+            users, next_cursor = keyset_paginate(
+                query,
+                UserPending.created_at,
+                UserPending.id,
+                size,
+                after=after,
+                offset=(page - 1) * size
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        return total_records, users, next_cursor
 
-    total_pages = (total_records + size - 1) // size
+    total_records, users, next_cursor = await db.run_sync(load)
+
+    total_pages = None
+    if total_records is not None:
+        total_pages = (total_records + size - 1) // size
 
     # =========================
     # RESPONSE
     # =========================
     return {
-        "page": page,
+        "page": None if after else page,
         "size": size,
         "total_records": total_records,
         "total_pages": total_pages,
+        "next_cursor": next_cursor,
         "data": users
     }
 
 
 @router.get("/approved-users")
-def get_approved_users(
+async def get_approved_users(
     page: int = 1,
     size: int = 20,
+    after: Optional[str] = None,
+    count: bool = True,
+    count_strategy: str = "exact",
     # Filters
     surname: Optional[str] = None,
     gothram: Optional[str] = None,
@@ -484,7 +553,7 @@ def get_approved_users(
     mandal: Optional[str] = None,
     registration_id: Optional[str] = None,
 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_admin: dict = Depends(get_current_admin)
 ):
     
@@ -503,60 +572,85 @@ def get_approved_users(
             detail=f"Size must be between 1 and {MAX_PAGE_SIZE}"
         )
 
-    # =========================
-    # BASE QUERY (IMPORTANT)
-    # =========================
-    query = db.query(UserVerified)
-
-    # =========================
-    # FILTERS
-    # =========================
-    if surname:
-        query = query.filter(UserVerified.surname == surname)
-
-    if gothram:
-        query = query.filter(UserVerified.gothram.ilike(f"%{gothram}%"))
-
-    if state:
-        query = query.filter(UserVerified.current_state == state)
-
-
-    if district:
-        query = query.filter(UserVerified.current_district == district)
+    if count_strategy not in COUNT_STRATEGIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"count_strategy must be one of {', '.join(COUNT_STRATEGIES)}"
+        )
 
-    if mandal:
-        query = query.filter(UserVerified.current_mandal == mandal)
-    if registration_id:
-        query = query.filter(UserVerified.registration_id == registration_id)
+    # Query helpers are sync (Query API): run them on the async
+    # connection through run_sync, the event loop is never blocked
+    def load(db: Session):
+        # =========================
+        # BASE QUERY (IMPORTANT)
+        # =========================
+        query = db.query(UserVerified)
+
+        # =========================
+        # FILTERS
+        # =========================
+        if surname:
+            query = query.filter(UserVerified.surname == surname)
+
+        if gothram:
+            query = query.filter(UserVerified.gothram.ilike(f"%{gothram}%"))
+
+        if state:
+            query = query.filter(UserVerified.current_state == state)
+
+
+        if district:
+            query = query.filter(UserVerified.current_district == district)
+
+        if mandal:
+            query = query.filter(UserVerified.current_mandal == mandal)
+        if registration_id:
+            query = query.filter(UserVerified.registration_id == registration_id)
+
+        # =========================
+        # TOTAL COUNT (OPTIONAL)
+        # =========================
+        total_records = None
+        if count:
+            total_records = count_rows(
+                db,
+                query,
+                count_strategy,
+                cache_key=("approved", surname, gothram, state, district, mandal, registration_id)
+            )
 
-    # =========================
-    # TOTAL COUNT
-    # =========================
-    total_records = query.count()
+        # =========================
+        # PAGINATION (CURSOR OR PAGE)
+        # =========================
+        try:
+            users, next_cursor = keyset_paginate(
+                query,
+                UserVerified.approved_at,
+                UserVerified.id,
+                size,
+                after=after,
+                offset=(page - 1) * size
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    # =========================
-    # PAGINATION
-    # =========================
-    offset = (page - 1) * size
+        return total_records, users, next_cursor
 
-    users = (
-        query
-        .order_by(UserVerified.approved_at.desc())
-        .offset(offset)
-        .limit(size)
-        .all()
-    )
+    total_records, users, next_cursor = await db.run_sync(load)
 
-    total_pages = (total_records + size - 1) // size
+    total_pages = None
+    if total_records is not None:
+        total_pages = (total_records + size - 1) // size
 
     # =========================
     # RESPONSE
     # =========================
     return {
-        "page": page,
+        "page": None if after else page,
         "size": size,
         "total_records": total_records,
         "total_pages": total_pages,
+        "next_cursor": next_cursor,
         "data": users
     }
 
@@ -564,9 +658,9 @@ def get_approved_users(
 
 
 @router.get("/user/{user_id}")
-def get_user_detail(user_id: str, db: Session = Depends(get_db),current_admin: dict = Depends(get_current_admin)):
+async def get_user_detail(user_id: str, db: AsyncSession = Depends(get_async_db),current_admin: dict = Depends(get_current_admin)):
     require_roles(current_admin, ["super_admin", "verifier"])
-    user = db.query(UserPending).filter(UserPending.id == user_id).first()
+    user = await db.scalar(select(UserPending).where(UserPending.id == user_id))
     if not user:
         raise HTTPException(404, "User not found")
     return user
@@ -632,6 +726,7 @@ def approve_user(user_id: str,
         referred_by_name=user.referred_by_name,
         referred_mobile=user.referred_mobile,
         feedback=user.feedback,
+        language=user.language,
 
         # Approval Info
         approved_by=current_admin.get("sub"),
@@ -653,13 +748,15 @@ def approve_user(user_id: str,
         send_approval_email,
         user.email,
         user.desired_name or user.full_name,
-        membership_id
+        membership_id,
+        user.language
         )
 
         
 
         db.add(audit)
         db.delete(user)
+        record_transition(db, "pending", "approved")
         db.commit()
     except Exception as e:
         db.rollback()
@@ -714,16 +811,35 @@ def export_users_csv(
     if registration_id:
         query = query.filter(UserPending.registration_id == registration_id)    
 
-    users = query.order_by(UserPending.created_at.desc()).all()
-
     # =========================
-    # CSV GENERATION
+    # SERVER-SIDE CURSOR (ONLY EXPORTED COLUMNS)
     # =========================
-    output = StringIO()
-    writer = csv.writer(output)
+    rows = (
+        query
+        .with_entities(
+            UserPending.registration_id,
+            UserPending.full_name,
+            UserPending.surname,
+            UserPending.gothram,
+            UserPending.mobile_number,
+            UserPending.email,
+            UserPending.current_house_number,
+            UserPending.current_village_city,
+            UserPending.current_state,
+            UserPending.current_district,
+            UserPending.current_mandal,
+            UserPending.current_pin_code,
+            UserPending.status,
+            UserPending.created_at,
+        )
+        .order_by(UserPending.created_at.desc())
+        .yield_per(EXPORT_YIELD_PER)
+    )
 
-    # Header
-    writer.writerow([
+    # =========================
+    # CSV GENERATION (STREAMED)
+    # =========================
+    header = [
         
         "Registration ID",
         "Full Name",
@@ -739,33 +855,30 @@ def export_users_csv(
         "Status",
         "Registered Date",
         "Approved Date"
-    ])
-
-    for user in users:
-        writer.writerow([
-            
-            getattr(user, "registration_id", ""),
-            getattr(user, "full_name", ""),
-            getattr(user, "surname", ""),
-            getattr(user, "gothram", ""),
-            getattr(user, "mobile_number", ""),
-            getattr(user, "email", ""),
-            #getattr(user, "current_house_number", "") + " " + getattr(user, "current_village_city", ""),
-            f"{user.current_house_number or ''} {user.current_village_city or ''}".strip(),
+    ]
 
-            getattr(user, "current_state", ""),
-            getattr(user, "current_district", ""),
-            getattr(user, "current_mandal", ""),
-            getattr(user, "current_pin_code", ""),
-            getattr(user, "status", ""),
+    csv_rows = (
+        [
+            user.registration_id,
+            user.full_name,
+            user.surname,
+            user.gothram,
+            user.mobile_number,
+            user.email,
+            f"{user.current_house_number or ''} {user.current_village_city or ''}".strip(),
+            user.current_state,
+            user.current_district,
+            user.current_mandal,
+            user.current_pin_code,
+            user.status,
             user.created_at.strftime("%Y-%m-%d %H:%M:%S") if user.created_at else "",
-            user.approved_at.strftime("%Y-%m-%d %H:%M:%S") if hasattr(user, "approved_at") and user.approved_at else ""
-        ])
-
-    output.seek(0)
+            ""  # pending users have no approval date
+        ]
+        for user in rows
+    )
 
     return StreamingResponse(
-        output,
+        iter_csv(header, csv_rows),
         media_type="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=users_export.csv"
@@ -775,10 +888,31 @@ def export_users_csv(
 
 
 
-@router.post("/users/bulk-approve")
+def validate_pending_selection(db: Session, user_ids: list[str], error_detail: str) -> list[str]:
+    # Normalise + de-duplicate ids, then one COUNT to confirm all are pending
+    try:
+        normalized = list(dict.fromkeys(str(uuid.UUID(user_id)) for user_id in user_ids))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid user id")
+
+    pending_count = (
+        db.query(func.count(UserPending.id))
+        .filter(
+            UserPending.id.in_(normalized),
+            UserPending.status == "pending"
+        )
+        .scalar()
+    )
+
+    if pending_count != len(normalized):
+        raise HTTPException(status_code=400, detail=error_detail)
+
+    return normalized
+
+
+@router.post("/users/bulk-approve", status_code=202)
 def bulk_approve_users(
     payload: BulkUserActionRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_admin: dict = Depends(get_current_admin)
 ):
@@ -788,110 +922,25 @@ def bulk_approve_users(
     if not payload.user_ids:
         raise HTTPException(status_code=400, detail="No users selected")
 
-    users = (
-        db.query(UserPending)
-        .filter(
-            UserPending.id.in_(payload.user_ids),
-            UserPending.status == "pending"
-        )
-        .all()
+    user_ids = validate_pending_selection(
+        db, payload.user_ids, "Some users are not in pending status"
     )
 
-    if len(users) != len(payload.user_ids):
-        raise HTTPException(
-            status_code=400,
-            detail="Some users are not in pending status"
-        )
-
-    try:
-        for user in users:
-            membership_id = generate_membership_id(db)
-
-            verified_user = UserVerified(
-                membership_id=membership_id,
-                registration_id=user.registration_id,
-                verification_type=user.verification_type,
-                mobile_number=user.mobile_number,
-                email=user.email,
-                full_name=user.full_name,
-                surname=user.surname, # Mothers Maiden Name as Surname
-                desired_name=user.desired_name,
-                father_or_husband_name=user.father_or_husband_name,
-                mother_name=user.mother_name,
-                date_of_birth=user.date_of_birth,
-                gender=user.gender,
-                marital_status=user.marital_status,
-                blood_group=user.blood_group,
-                gothram=user.gothram,
-                aaradhya_daiva=user.aaradhya_daiva,
-                kula_devata=user.kula_devata,
-                education=user.education,
-                occupation=user.occupation,
-                # Current Address
-                current_house_number=user.current_house_number,
-                current_village_city=user.current_village_city,
-                current_mandal=user.current_mandal,
-                current_district=user.current_district,
-                current_state=user.current_state,
-                current_country=user.current_country,
-                current_pin_code=user.current_pin_code,
-                # Native Address
-                native_house_number=user.native_house_number,
-                native_village_city=user.native_village_city,
-                native_mandal=user.native_mandal,
-                native_district=user.native_district,
-                native_state=user.native_state,
-                native_country=user.native_country,
-                native_pin_code=user.native_pin_code,
-                # Photo
-                photo_url=user.photo_url,
-                pdf_url=user.pdf_url,
-                referred_by_name=user.referred_by_name,
-                referred_mobile=user.referred_mobile,
-                feedback=user.feedback,
-                approved_by=current_admin.get("sub"),
-                approved_at=datetime.utcnow()
-            )
-
-            db.add(verified_user)
-            
-            # ✅ ADD AUDIT LOG ENTRY
-            audit = AdminAuditLog(
-                admin_id=current_admin.get("sub"),
-                action="APPROVE",
-                target_type="user",
-                target_id=user.id,
-                reason=payload.reason
-            )
-            db.add(audit)
-
-
-            # 📧 SEND APPROVAL EMAIL (safe)
-            try:
-                            
-                            
-                            background_tasks.add_task(
-                send_approval_email,
-                user.email,
-                user.desired_name or user.full_name,
-                membership_id
-            )
-
-            except Exception as e:
-                print("EMAIL ERROR:", str(e))  # do NOT fail approval
-
-            db.delete(user)
-
-        db.commit()
-
-    except Exception as e:
-        db.rollback()
-        print("BULK APPROVE ERROR:", str(e))
-        raise HTTPException(status_code=500, detail=str(e))
-
+    # =========================
+    # QUEUE JOB (SET-BASED MOVE + EMAILS RUN IN WORKER)
+    # =========================
+    job = enqueue_job(
+        db,
+        "bulk_approve",
+        {"user_ids": user_ids, "reason": payload.reason},
+        current_admin.get("sub"),
+        len(user_ids)
+    )
 
     return {
-        "message": f"{len(users)} users approved successfully"
+        "message": f"Approval of {len(user_ids)} users queued",
+        "job_id": str(job.id),
+        "status": job.status
     }
 
 
@@ -951,7 +1000,7 @@ def bulk_approve_users(
 #         "message": f"{len(users)} users rejected and via email notified"
 #     }
 
-@router.post("/users/bulk-reject")
+@router.post("/users/bulk-reject", status_code=202)
 def bulk_reject_users(
     payload: BulkUserActionRequest,
     db: Session = Depends(get_db),
@@ -961,115 +1010,36 @@ def bulk_reject_users(
     if not payload.reason:
         raise HTTPException(status_code=400, detail="Reject reason required")
 
-    # users = (
-    #     db.query(UserPending)
-    #     .filter(
-    #         UserPending.id.in_(payload.user_ids),
-    #         UserPending.status == "pending"
-    #     )
-    #     .all()
-    # )
-
-    users = (
-    db.query(UserPending)
-    .filter(
-        UserPending.status == "pending",
-        UserPending.id.in_(payload.user_ids[:10000])
-    )
-    .all()
-    )
-
-    for user in users:
-        if user.status != "pending":
-            raise HTTPException(status_code=400, detail="Some users are not in pending state")
-
-
+    if not payload.user_ids:
+        raise HTTPException(status_code=400, detail="No users selected")
 
-    if len(users) != len(payload.user_ids):
+    if len(payload.user_ids) > 10000:
         raise HTTPException(status_code=400, detail="Invalid selection")
 
-    for user in users:
-        # 1️⃣ MOVE TO users_rejected
-        rejected_user = UserRejected(
-            original_pending_id=user.id,
-            registration_id=user.registration_id,
-            mobile_number=user.mobile_number,
-            email=user.email,
-            full_name=user.full_name,
-            surname=user.surname,  # Mothers Maiden Name as Surname
-            desired_name=user.desired_name,
-            father_or_husband_name=user.father_or_husband_name,
-            mother_name=user.mother_name,
-            date_of_birth=user.date_of_birth,
-            gender=user.gender,
-            blood_group=user.blood_group,
-            marital_status=user.marital_status,
-            # Community
-            gothram=user.gothram,
-            aaradhya_daiva=user.aaradhya_daiva,
-            kula_devata=user.kula_devata,
-            education=user.education,
-            occupation=user.occupation,
-            # Current Address
-            current_house_number=user.current_house_number,
-            current_village_city=user.current_village_city,
-            current_mandal=user.current_mandal,
-            current_district=user.current_district,
-            current_state=user.current_state,
-            current_country=user.current_country,
-            current_pin_code=user.current_pin_code,
-            # Native Address
-            native_house_number=user.native_house_number,
-            native_village_city=user.native_village_city,
-            native_mandal=user.native_mandal,
-            native_district=user.native_district,
-            native_state=user.native_state,
-            native_country=user.native_country,
-            native_pin_code=user.native_pin_code,
-            # Photo
-            photo_url=user.photo_url,
-            # Referral
-            referred_by_name=user.referred_by_name,
-            referred_mobile=user.referred_mobile,
-            reject_reason=payload.reason,
-            rejected_by_admin_id=current_admin.get("sub"),
-            created_at=user.created_at
-        )
-
-        db.add(rejected_user)
-
-        # 2️⃣ AUDIT LOG
-        audit = AdminAuditLog(
-            admin_id=current_admin.get("sub"),
-            action="REJECT",
-            target_type="user",
-            target_id=user.id,
-            reason=payload.reason
-        )
-        db.add(audit)
-
-        # 3️⃣ SEND REJECTION EMAIL (if email exists)
-        if user.email:
-            send_rejection_email(
-                to_email=user.email,
-                full_name=user.full_name,
-                regisration_id=user.registration_id,
-                desired_name=user.desired_name,
-                reason=payload.reason
-            )
-
-        # 4️⃣ REMOVE FROM users_pending
-        db.delete(user)
+    user_ids = validate_pending_selection(
+        db, payload.user_ids, "Invalid selection"
+    )
 
-    db.commit()
+    # =========================
+    # QUEUE JOB (MOVE TO users_rejected + EMAILS RUN IN WORKER)
+    # =========================
+    job = enqueue_job(
+        db,
+        "bulk_reject",
+        {"user_ids": user_ids, "reason": payload.reason},
+        current_admin.get("sub"),
+        len(user_ids)
+    )
 
     return {
-        "message": f"{len(users)} users rejected and notified successfully"
+        "message": f"Rejection of {len(user_ids)} users queued",
+        "job_id": str(job.id),
+        "status": job.status
     }
 
 
 
-@router.post("/users/bulk-hold")
+@router.post("/users/bulk-hold", status_code=202)
 def bulk_hold_users(
     payload: BulkUserActionRequest,
     db: Session = Depends(get_db),
@@ -1079,142 +1049,199 @@ def bulk_hold_users(
     if not payload.reason:
         raise HTTPException(status_code=400, detail="Hold reason required")
 
-    users = (
-        db.query(UserPending)
-        .filter(
-            UserPending.id.in_(payload.user_ids),
-            UserPending.status == "pending"
-        )
-        .all()
+    if not payload.user_ids:
+        raise HTTPException(status_code=400, detail="No users selected")
+
+    user_ids = validate_pending_selection(
+        db, payload.user_ids, "Invalid selection"
     )
 
-    for user in users:
-        if user.status != "pending":
-            raise HTTPException(status_code=400, detail="Some users are not in pending state")
+    job = enqueue_job(
+        db,
+        "bulk_hold",
+        {"user_ids": user_ids, "reason": payload.reason},
+        current_admin.get("sub"),
+        len(user_ids)
+    )
 
-    if len(users) != len(payload.user_ids):
-        raise HTTPException(status_code=400, detail="Invalid selection")
+    return {
+        "message": f"Hold of {len(user_ids)} users queued",
+        "job_id": str(job.id),
+        "status": job.status
+    }
 
-    for user in users:
-        user.status = "hold"
-        user.hold_reason = payload.reason
-        # ADD AUDIT LOG ENTRY PER USER
-        audit = AdminAuditLog(
-        admin_id=current_admin.get("sub"),
-        action="HOLD",
-        target_type="user",
-        target_id=user.id,
-        reason=payload.reason
-        )
-        db.add(audit)
 
 
-    db.commit()
+@router.post("/certificates/regenerate", status_code=202)
+def regenerate_member_certificates(
+    payload: RegenerateCertificatesRequest,
+    db: Session = Depends(get_db),
+    current_admin: dict = Depends(get_current_admin)
+):
+    require_roles(current_admin, ["super_admin"])
+
+    user_ids = None
+    if payload.user_ids:
+        try:
+            user_ids = list(dict.fromkeys(str(uuid.UUID(user_id)) for user_id in payload.user_ids))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid selection")
+
+    # A job of Telugu renders would fail on every member without the font
+    language = normalize_language(payload.language)
+    if certificate_language(language) != language:
+        raise HTTPException(status_code=400, detail="Telugu certificates are not available on this server")
+
+    total = certificate_query(
+        db, user_ids, payload.approved_from, payload.approved_to
+    ).count()
+
+    if total == 0:
+        raise HTTPException(status_code=400, detail="No approved members match the filter")
+
+    job = enqueue_job(
+        db,
+        "regenerate_certificates",
+        {
+            "user_ids": user_ids,
+            "approved_from": payload.approved_from.isoformat() if payload.approved_from else None,
+            "approved_to": payload.approved_to.isoformat() if payload.approved_to else None,
+            "force": payload.force,
+            "language": language,
+        },
+        current_admin.get("sub"),
+        total
+    )
 
     return {
-        "message": f"{len(users)} users moved to hold"
+        "message": f"Regeneration of {total} certificates queued",
+        "job_id": str(job.id),
+        "status": job.status
     }
 
 
 
-@router.get("/dashboard/summary")
-def admin_dashboard_summary(
+@router.get("/jobs/{job_id}")
+def get_job_status(
+    job_id: str,
     db: Session = Depends(get_db),
     current_admin: dict = Depends(get_current_admin)
 ):
-    
     require_roles(current_admin, ["super_admin", "verifier"])
-    today = date.today()
 
-    # =========================
-    # STATUS COUNTS
-    # =========================
+    try:
+        job_uuid = uuid.UUID(job_id)
+    except ValueError:
+        raise HTTPException(404, "Job not found")
 
-    pending_count = (
-        db.query(func.count())
-        .select_from(UserPending)
-        .filter(UserPending.status == "pending")
-        .scalar()
-    )
+    job = db.query(AdminJob).filter(AdminJob.id == job_uuid).first()
+    if not job:
+        raise HTTPException(404, "Job not found")
 
-    hold_count = (
-        db.query(func.count())
-        .select_from(UserPending)
-        .filter(UserPending.status == "hold")
-        .scalar()
-    )
+    return {
+        "job_id": str(job.id),
+        "job_type": job.job_type,
+        "status": job.status,
+        "progress": {
+            "total": job.total,
+            "processed": job.processed,
+            "succeeded": job.succeeded,
+            "failed": job.failed,
+            "percent": round(job.processed * 100 / job.total, 1) if job.total else 100.0
+        },
+        "failures": job.failures,
+        "result": (job.payload or {}).get("result"),
+        "retry": {
+            "attempts": job.attempts,
+            "max_attempts": job.max_attempts,
+            "next_run_at": job.next_run_at,
+            "last_error": job.last_error
+        },
+        "created_by": job.created_by,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at
+    }
 
-    # rejected_count = (
-    #     db.query(func.count())
-    #     .select_from(UserPending)
-    #     .filter(UserPending.status == "rejected")
-    #     .scalar()
-    # )
-
-    rejected_count = (
-    db.query(func.count())
-    .select_from(UserRejected)
-    .scalar()
-    )
 
 
-    approved_count = (
-        db.query(func.count())
-        .select_from(UserVerified)
-        .scalar()
-    )
+@router.get("/metrics/pdf-cache")
+def pdf_cache_metrics(
+    current_admin: dict = Depends(get_current_admin)
+):
+    require_roles(current_admin, ["super_admin"])
 
-    total_registrations = (
-        pending_count + hold_count + rejected_count + approved_count
-    )
+    # Hit / miss counters are for this API process since it started
+    return cache_stats()
 
-    # =========================
-    # TODAY ACTIVITY
-    # =========================
 
-    today_registrations = (
-        db.query(func.count())
-        .select_from(UserPending)
-        .filter(func.date(UserPending.created_at) == today)
-        .scalar()
-    )
 
-    today_approvals = (
-        db.query(func.count())
-        .select_from(UserVerified)
-        .filter(func.date(UserVerified.approved_at) == today)
-        .scalar()
-    )
+@router.get("/metrics/db-pool")
+def db_pool_metrics(
+    current_admin: dict = Depends(get_current_admin)
+):
+    require_roles(current_admin, ["super_admin"])
 
-    today_rejections = (
-        db.query(func.count())
-        .select_from(UserPending)
-        .filter(
-            UserPending.status == "rejected",
-            func.date(UserPending.created_at) == today
+    # Pools are per process: multiply by workers x replicas when sizing
+    return db_pool_stats()
+
+
+
+@router.get("/dashboard/summary")
+async def admin_dashboard_summary(
+    trend_days: int = 0,
+    db: AsyncSession = Depends(get_async_db),
+    current_admin: dict = Depends(get_current_admin)
+):
+    
+    require_roles(current_admin, ["super_admin", "verifier"])
+
+    MAX_TREND_DAYS = 365
+
+    if trend_days < 0 or trend_days > MAX_TREND_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"trend_days must be between 0 and {MAX_TREND_DAYS}"
         )
-        .scalar()
-    )
+
+    today = date.today()
+
+    # =========================
+    # STATUS COUNTS + TODAY ACTIVITY (ONE QUERY)
+    # =========================
+    rollup = await db.run_sync(get_status_summary, today)
+    totals = rollup["totals"]
+    today_counts = rollup["today"]
+
+    total_registrations = sum(totals.values())
 
     # =========================
     # RESPONSE
     # =========================
 
-    return {
+    response = {
         "summary": {
             "total_registrations": total_registrations,
-            "approved": approved_count,
-            "pending": pending_count,
-            "hold": hold_count,
-            "rejected": rejected_count
+            "approved": totals["approved"],
+            "pending": totals["pending"],
+            "hold": totals["hold"],
+            "rejected": totals["rejected"]
         },
         "today": {
-            "new_registrations": today_registrations,
-            "approvals": today_approvals,
-            "rejections": today_rejections
+            "new_registrations": today_counts["pending"],
+            "approvals": today_counts["approved"],
+            "rejections": today_counts["rejected"]
         }
     }
 
+    # =========================
+    # HISTORIC TREND (OPTIONAL)
+    # =========================
+    if trend_days:
+        response["trend"] = await db.run_sync(get_daily_trend, trend_days, today)
+
+    return response
+
 
 
 @router.get("/export-approved-users")
@@ -1224,24 +1251,36 @@ def export_approved_users(
 ):
     require_roles(current_admin, ["super_admin", "verifier"])
     # =========================
-    # FETCH APPROVED USERS
+    # FETCH APPROVED USERS (SERVER-SIDE CURSOR)
     # =========================
-    users = (
-        db.query(UserVerified)
+    rows = (
+        db.query(
+            UserVerified.membership_id,
+            UserVerified.registration_id,
+            UserVerified.full_name,
+            UserVerified.surname,
+            UserVerified.desired_name,
+            UserVerified.gothram,
+            UserVerified.mobile_number,
+            UserVerified.email,
+            UserVerified.current_house_number,
+            UserVerified.current_village_city,
+            UserVerified.current_mandal,
+            UserVerified.current_district,
+            UserVerified.current_state,
+            UserVerified.current_country,
+            UserVerified.current_pin_code,
+            UserVerified.approved_by,
+            UserVerified.approved_at,
+        )
         .order_by(UserVerified.approved_at.desc())
-        .all()
+        .yield_per(EXPORT_YIELD_PER)
     )
 
-    # =========================
-    # CSV IN-MEMORY BUFFER
-    # =========================
-    output = io.StringIO()
-    writer = csv.writer(output)
-
     # =========================
     # CSV HEADER
     # =========================
-    writer.writerow([
+    header = [
         "Membership ID",
         "Registration ID",
         "Full Name",
@@ -1259,39 +1298,13 @@ def export_approved_users(
         "Current Pincode",
         "Approved By",
         "Approved Date"
-    ])
-
-    # =========================
-    # CSV ROWS
-    # =========================
-    for user in users:
-        writer.writerow([
-            user.membership_id,
-            user.registration_id,
-            user.full_name,
-            user.surname,
-            user.desired_name,
-            user.gothram,
-            user.mobile_number,
-            user.email,
-            user.current_house_number,
-            user.current_village_city,
-            user.current_mandal,
-            user.current_district,
-            user.current_state,
-            user.current_country,
-            user.current_pin_code,
-            user.approved_by,
-            user.approved_at
-        ])
-
-    output.seek(0)
+    ]
 
     # =========================
     # STREAM RESPONSE
     # =========================
     return StreamingResponse(
-        output,
+        iter_csv(header, rows),
         media_type="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=approved_users.csv"
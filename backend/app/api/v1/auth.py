@@ -1,19 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, EmailStr
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
+import math
 
 from app.services.otp_service import generate_otp, get_expiry_time
-from app.models.otp_verification import OTPVerification
-from app.api.deps import get_db
+from app.services.otp_store import get_otp_store
+from app.api.deps import get_async_db, rate_limit
+from app.core.security import VERIFICATION_TOKEN_EXPIRE_MINUTES, create_verification_token
 from app.services.sms_service import send_otp_sms
 from app.services.email_service import send_otp_email
-from app.models.user_pending import UserPending
-from app.models.user_verified import UserVerified
+from app.services.duplicate_service import find_duplicate
 from fastapi import BackgroundTasks
 
-from app.services.otp_cleanup_service import cleanup_expired_otps
-
 
 router = APIRouter(prefix="/auth")
 
@@ -24,6 +23,7 @@ router = APIRouter(prefix="/auth")
 class SendOTPRequest(BaseModel):
     type: str  # mobile | email
     value: str
+    language: str = "en"  # OTP email language (en / te)
 
 class VerifyOTPRequest(BaseModel):
     type: str
@@ -70,38 +70,25 @@ class VerifyOTPRequest(BaseModel):
     # }
 
 
-@router.post("/send-otp")
-def send_otp(payload: SendOTPRequest, 
+@router.post("/send-otp", dependencies=[Depends(rate_limit("send_otp", "value"))])
+async def send_otp(payload: SendOTPRequest, 
              background_tasks: BackgroundTasks,
-             db: Session = Depends(get_db)):
-    
-    # 🧹 CLEAN EXPIRED OTPs FIRST
-    cleanup_expired_otps(db)
+             db: AsyncSession = Depends(get_async_db)):
     
+    # 🧹 Expired OTPs are deleted by the background sweeper (otp_cleanup_service)
 
     if payload.type not in ["mobile", "email"]:
         raise HTTPException(status_code=400, detail="Invalid verification type")
     
     
-    # 🚫 BLOCK OTP IF USER ALREADY REGISTERED (PENDING / VERIFIED)
+    # 🚫 BLOCK OTP IF USER ALREADY REGISTERED (PENDING / VERIFIED, ONE QUERY; REJECTED MAY RETRY)
     if payload.type == "mobile":
-        exists_pending = db.query(UserPending).filter(
-            UserPending.mobile_number == payload.value
-        ).first()
-        exists_verified = db.query(UserVerified).filter(
-            UserVerified.mobile_number == payload.value
-        ).first()
-
-    elif payload.type == "email":
-        exists_pending = db.query(UserPending).filter(
-            UserPending.email == payload.value
-        ).first()
-        exists_verified = db.query(UserVerified).filter(
-            UserVerified.email == payload.value
-        ).first()
-
+        duplicate = await find_duplicate(db, mobile_number=payload.value)
     else:
-        raise HTTPException(status_code=400, detail="Invalid verification type")
+        duplicate = await find_duplicate(db, email=payload.value)
+
+    exists_pending = duplicate is not None and duplicate.source == "pending"
+    exists_verified = duplicate is not None and duplicate.source == "verified"
 
     if exists_pending:
         raise HTTPException(
@@ -121,17 +108,10 @@ def send_otp(payload: SendOTPRequest,
 
 
 
+    otp_store = get_otp_store()
+
     # 1️⃣ FETCH LATEST UNVERIFIED OTP
-    last_otp = (
-        db.query(OTPVerification)
-        .filter(
-            OTPVerification.identifier == payload.value,
-            OTPVerification.verification_type == payload.type,
-            OTPVerification.verified == False
-        )
-        .order_by(OTPVerification.created_at.desc())
-        .first()
-    )
+    last_otp = await otp_store.latest(db, payload.type, payload.value)
 
     # 2️⃣ COOLDOWN CHECK (60 seconds)
     if last_otp:
@@ -139,7 +119,8 @@ def send_otp(payload: SendOTPRequest,
         if seconds_since_last < 60:
             raise HTTPException(
                 status_code=429,
-                detail="Please wait 60 seconds before requesting another OTP"
+                detail="Please wait 60 seconds before requesting another OTP",
+                headers={"Retry-After": str(math.ceil(60 - seconds_since_last))}
             )
     
     
@@ -149,15 +130,7 @@ def send_otp(payload: SendOTPRequest,
     otp = generate_otp()
     expiry = get_expiry_time()
 
-    otp_entry = OTPVerification(
-        identifier=payload.value,
-        verification_type=payload.type,
-        otp=otp,
-        expires_at=expiry
-    )
-
-    db.add(otp_entry)
-    db.commit()
+    await otp_store.save(db, payload.type, payload.value, otp, expiry)
 
     # 4️⃣ SEND OTP
     if payload.type == "mobile":
@@ -166,7 +139,7 @@ def send_otp(payload: SendOTPRequest,
 
     elif payload.type == "email":
         #send_otp_email(payload.value, otp)
-        background_tasks.add_task(send_otp_email, payload.value, otp)
+        background_tasks.add_task(send_otp_email, payload.value, otp, payload.language)
 
     return {
         "message": f"OTP sent successfully via {payload.type}"
@@ -213,18 +186,10 @@ def send_otp(payload: SendOTPRequest,
 
 MAX_OTP_ATTEMPTS = 5
 
-@router.post("/verify-otp")
-def verify_otp(payload: VerifyOTPRequest, db: Session = Depends(get_db)):
-    otp_record = (
-        db.query(OTPVerification)
-        .filter(
-            OTPVerification.identifier == payload.value,
-            OTPVerification.verification_type == payload.type,
-            OTPVerification.verified == False
-        )
-        .order_by(OTPVerification.created_at.desc())
-        .first()
-    )
+@router.post("/verify-otp", dependencies=[Depends(rate_limit("verify_otp", "value"))])
+async def verify_otp(payload: VerifyOTPRequest, db: AsyncSession = Depends(get_async_db)):
+    otp_store = get_otp_store()
+    otp_record = await otp_store.latest(db, payload.type, payload.value)
 
     if not otp_record:
         raise HTTPException(status_code=404, detail="OTP not found")
@@ -242,10 +207,9 @@ def verify_otp(payload: VerifyOTPRequest, db: Session = Depends(get_db)):
 
     # ❌ Wrong OTP
     if otp_record.otp != payload.otp:
-        otp_record.attempts += 1
-        db.commit()
+        attempts = await otp_store.add_attempt(db, otp_record)
 
-        remaining = MAX_OTP_ATTEMPTS - otp_record.attempts
+        remaining = MAX_OTP_ATTEMPTS - attempts
         if remaining <= 0:
             raise HTTPException(
                 status_code=400,
@@ -257,11 +221,14 @@ def verify_otp(payload: VerifyOTPRequest, db: Session = Depends(get_db)):
             detail=f"Invalid OTP. {remaining} attempts remaining."
         )
 
-    # ✅ Correct OTP
-    otp_record.verified = True
-    db.commit()
+    # ✅ Correct OTP (a concurrent request with the same code may have used it)
+    if not await otp_store.mark_verified(db, otp_record):
+        raise HTTPException(status_code=400, detail="OTP already used")
 
     return {
         "message": "OTP verified successfully",
-        "verified": True
+        "verified": True,
+        # Send it with /users/register: proves this mobile / email, no DB lookup there
+        "verification_token": create_verification_token(payload.type, payload.value),
+        "expires_in": VERIFICATION_TOKEN_EXPIRE_MINUTES * 60
     }
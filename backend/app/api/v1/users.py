@@ -1,13 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.user import UserRegistrationRequest
 from app.models.user_pending import UserPending
-from app.services.pdf_service import generate_pdf
-from app.api.deps import get_db
-from app.models.user_verified import UserVerified
+from app.services.pdf_render_service import (
+    PDF_RETRY_AFTER_SECONDS,
+    PDF_STORAGE,
+    release_render_slot,
+    render_in_memory_async,
+    reserve_render_slot,
+    submit_render
+)
+from app.services.certificate_service import certificate_for_registration
+from app.services.pdf_cache import get_bytes, put_bytes
+from app.services.certificate_content import certificate_url, content_hash
+from app.services.font_service import certificate_language
+from app.utils.language import normalize_language
+from app.api.deps import get_async_db
+from app.services.rollup_service import record_transition
+from app.services.duplicate_service import BLOCKING_SOURCES, find_duplicate
+from app.core.security import decode_verification_token
+import os
 import uuid
-from fastapi import BackgroundTasks
+
+CERTIFICATE_MAX_AGE_SECONDS = int(os.getenv("CERTIFICATE_MAX_AGE_SECONDS", "300"))
+CERTIFICATE_CHUNK_BYTES = 64 * 1024
+
+# Registration needs the verify-otp token for its mobile / email
+# (false only while clients that don't send it are being updated)
+REGISTRATION_REQUIRES_VERIFICATION = os.getenv("REGISTRATION_REQUIRES_VERIFICATION", "true").lower() == "true"
+
+DUPLICATE_MESSAGES = {
+    ("pending", "mobile"): "Mobile number already registered, wait for approval/rejection",
+    ("pending", "email"): "Email already registered, wait for approval/rejection",
+    ("verified", "mobile"): "Mobile number already registered and approved",
+    ("verified", "email"): "Email already registered and approved",
+}
 
 
 
@@ -15,10 +45,23 @@ from fastapi import BackgroundTasks
 
 router = APIRouter(prefix="/users")
 
+
+def _is_verified(payload: UserRegistrationRequest, mobile_number: str | None, email: str | None) -> bool:
+    token = decode_verification_token(payload.verification_token) if payload.verification_token else None
+    if not token or token.get("type") != payload.verification_type.value:
+        return False
+
+    identifier = (token.get("sub") or "").strip()
+
+    if payload.verification_type.value == "mobile":
+        return bool(mobile_number) and identifier == mobile_number
+
+    return bool(email) and identifier.lower() == email.lower()
+
+
 @router.post("/register")
-def register_user(payload: UserRegistrationRequest,
-                  background_tasks: BackgroundTasks,
-                  db: Session = Depends(get_db)):
+async def register_user(payload: UserRegistrationRequest,
+                  db: AsyncSession = Depends(get_async_db)):
 
     # =========================
     # NORMALIZE INPUT (CRITICAL)
@@ -32,48 +75,38 @@ def register_user(payload: UserRegistrationRequest,
     email = email or None
 
     # =========================
-    # DUPLICATE CHECK (PENDING)
+    # OTP VERIFIED? (SIGNED TOKEN, NO DB QUERY)
     # =========================
-    if mobile_number:
-        if db.query(UserPending).filter(UserPending.mobile_number == mobile_number).first():
-            raise HTTPException(
-                status_code=400,
-                detail="Mobile number already registered, wait for approval/rejection"
-            )
-
-    if email:
-        if db.query(UserPending).filter(UserPending.email == email).first():
-            raise HTTPException(
-                status_code=400,
-                detail="Email already registered, wait for approval/rejection"
-            )
+    if REGISTRATION_REQUIRES_VERIFICATION and not _is_verified(payload, mobile_number, email):
+        raise HTTPException(
+            status_code=403,
+            detail="Please verify your mobile number or email with an OTP before registering"
+        )
 
     # =========================
-    # DUPLICATE CHECK (VERIFIED)
+    # DUPLICATE CHECK (PENDING + VERIFIED + REJECTED, ONE QUERY)
     # =========================
-    if mobile_number:
-        if db.query(UserVerified).filter(UserVerified.mobile_number == mobile_number).first():
-            raise HTTPException(
-                status_code=400,
-                detail="Mobile number already registered and approved"
-            )
-
-    if email:
-        if db.query(UserVerified).filter(UserVerified.email == email).first():
-            raise HTTPException(
-                status_code=400,
-                detail="Email already registered and approved"
-            )
+    # A previous rejection does not block a new registration
+    duplicate = await find_duplicate(db, mobile_number=mobile_number, email=email)
+    if duplicate and duplicate.source in BLOCKING_SOURCES:
+        raise HTTPException(
+            status_code=400,
+            detail=DUPLICATE_MESSAGES[(duplicate.source, duplicate.field)]
+        )
 
     # =========================
     # PDF GENERATION
     # =========================
     #pdf_path = generate_pdf(payload.dict(), language="en")
-    payload_dict = payload.dict()
+    payload_dict = payload.dict(exclude={"language", "verification_token"})
+    language = certificate_language(payload.language)  # en when no Telugu font is installed
     registration_id = f"KGC-{uuid.uuid4().hex[:8].upper()}"
     payload_dict["registration_id"] = registration_id
 
-    pdf_path = f"/media/pdfs/{registration_id}.pdf"
+    if PDF_STORAGE == "stream":
+        pdf_path = certificate_url(registration_id, language)
+    else:
+        pdf_path = f"/media/pdfs/{registration_id}.pdf"
 
     #pdf_path = generate_pdf(payload_dict, language="en")
 
@@ -91,23 +124,128 @@ def register_user(payload: UserRegistrationRequest,
 
     user = UserPending(
     registration_id=registration_id,   # ✅ ADD HERE
-    **payload.dict(exclude={"mobile_number", "email"}),
+    **payload.dict(exclude={"mobile_number", "email", "language", "verification_token"}),
     mobile_number=mobile_number,
     email=email,
     pdf_url=pdf_path,
+    language=normalize_language(payload.language),  # approval / rejection emails
     is_verified=True
 )
 
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-
-    # ✅ move PDF to background
-    background_tasks.add_task(generate_pdf, payload_dict)
+    # =========================
+    # PDF QUEUE (BACKPRESSURE)
+    # =========================
+    # Disk mode: reserve the render slot first so a full queue rejects the
+    # request before anything is written. Stream mode renders on request.
+    queue_render = PDF_STORAGE != "stream"
+
+    if queue_render and not reserve_render_slot():
+        raise HTTPException(
+            status_code=503,
+            detail="Too many registrations right now, please try again shortly",
+            headers={"Retry-After": str(PDF_RETRY_AFTER_SECONDS)}
+        )
+
+    if not queue_render:
+        user.pdf_status = "ready"
+
+    try:
+        db.add(user)
+        await db.run_sync(record_transition, None, "pending")
+        await db.commit()
+        await db.refresh(user)
+    except Exception:
+        if queue_render:
+            release_render_slot()
+        raise
+
+    # ✅ PDF renders on the process pool, off the API workers
+    if queue_render:
+        # Persisted created_at, as the on-demand certificate uses: same PDF either way
+        payload_dict["submitted_at"] = user.created_at
+        submit_render(registration_id, payload_dict, language)
 
     return {
         "message": "Registration submitted successfully",
         "status": "pending",
-        "pdf_url": pdf_path
+        "pdf_url": pdf_path,
+        "pdf_status": user.pdf_status
+    }
+
+
+@router.get("/{registration_id}/pdf-status")
+async def get_pdf_status(registration_id: str, db: AsyncSession = Depends(get_async_db)):
+    row = (
+        await db.execute(
+            select(UserPending.pdf_status, UserPending.pdf_url)
+            .where(UserPending.registration_id == registration_id)
+        )
+    ).first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Registration not found")
+
+    return {
+        "registration_id": registration_id,
+        "pdf_status": row.pdf_status,
+        "pdf_url": row.pdf_url if row.pdf_status == "ready" else None
+    }
+
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+@router.get("/{registration_id}/certificate")
+async def download_certificate(
+    registration_id: str,
+    request: Request,
+    language: str = "en",
+    db: AsyncSession = Depends(get_async_db)
+):
+    data = await db.run_sync(certificate_for_registration, registration_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Registration not found")
+
+    language = certificate_language(language)
+    digest = content_hash(data, language)
+
+    # Same content → same ETag on every replica, no shared storage needed
+    headers = {
+        "ETag": f'"{digest}"',
+        "Cache-Control": f"private, max-age={CERTIFICATE_MAX_AGE_SECONDS}",
     }
+
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    pdf = get_bytes(digest)
+
+    if pdf is None:
+        if not reserve_render_slot():
+            raise HTTPException(
+                status_code=503,
+                detail="Certificate service busy, please try again shortly",
+                headers={"Retry-After": str(PDF_RETRY_AFTER_SECONDS)}
+            )
+
+        pdf = await render_in_memory_async(data, language)
+        put_bytes(digest, pdf)
+
+    return StreamingResponse(
+        (pdf[start:start + CERTIFICATE_CHUNK_BYTES] for start in range(0, len(pdf), CERTIFICATE_CHUNK_BYTES)),
+        media_type="application/pdf",
+        headers={
+            **headers,
+            "Content-Length": str(len(pdf)),
+            "Content-Disposition": f'inline; filename="{registration_id}.pdf"',
+        }
+    )
@@ -1,9 +1,13 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from dotenv import load_dotenv
-from typing import Generator
+from typing import AsyncGenerator, Generator
 import os
 
+from app.core.db_pool import engine_options, pool_settings, pool_status
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -11,18 +15,67 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set")
 
+# Pool size / overflow / recycle / health check / statement timeout
+# come from the DB_* env vars, see app/core/db_pool.py
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,
+    **engine_options(DATABASE_URL),
+)
+
+
+# =========================
+# ASYNC ENGINE (ASYNCPG)
+# =========================
+
+def _async_database_url(url: str) -> str:
+    """Same database as DATABASE_URL, through the asyncpg driver."""
+    url = make_url(url)
+
+    if url.get_backend_name() != "postgresql":
+        return url.render_as_string(hide_password=False)
+
+    # asyncpg takes ssl=, not libpq's sslmode= / channel_binding=
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    query.pop("channel_binding", None)
+
+    return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+
+# Async routes wait on Postgres on the event loop instead of holding
+# a threadpool thread per request
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    **engine_options(ASYNC_DATABASE_URL, is_async=True),
 )
 
 
+def db_pool_stats() -> dict:
+    """
+    Live pool numbers for this process.
+
+    Size the pools so that processes x max_connections_per_process stays
+    under the server's max_connections (minus superuser / admin slots).
+    """
+    pools = {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.sync_engine.pool),
+    }
+
+    return {
+        "settings": pool_settings(),
+        "max_connections_per_process": sum(pool["max_connections"] for pool in pools.values()),
+        **pools,
+    }
+
+
 # ✅ THIS IMPORT REGISTERS ALL MODELS
 from app.models import Base
 
-from app.models.base import Base
-# Create tables on startup (ONLY if not exists)
-Base.metadata.create_all(bind=engine)
+# No DDL at startup: the schema is managed by migrations (alembic upgrade head)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -30,9 +83,21 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# expire_on_commit=False: attributes read after commit must not
+# trigger an implicit (sync) reload
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
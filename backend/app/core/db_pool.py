@@ -0,0 +1,156 @@
+# app/core/db_pool.py
+
+import os
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Per engine and per process. Each process has two engines (sync + async),
+# so it can open up to 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds waiting for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))  # seconds, -1 = never
+
+# pre_ping: test every checkout with a round trip (survives any dropped connection)
+# recycle:  no round trip; retire connections after DB_POOL_RECYCLE, set it
+#           below the server / proxy idle timeout
+DB_POOL_HEALTH = os.getenv("DB_POOL_HEALTH", "pre_ping")
+DB_POOL_HEALTH_CHECKS = ("pre_ping", "recycle")
+
+if DB_POOL_HEALTH not in DB_POOL_HEALTH_CHECKS:
+    raise RuntimeError(f"DB_POOL_HEALTH must be one of {', '.join(DB_POOL_HEALTH_CHECKS)}")
+
+if DB_POOL_HEALTH == "recycle" and DB_POOL_RECYCLE <= 0:
+    raise RuntimeError("DB_POOL_HEALTH=recycle needs DB_POOL_RECYCLE (seconds) to be set")
+
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))  # 0 = server default
+
+DB_POOL_WAIT_SAMPLES = int(os.getenv("DB_POOL_WAIT_SAMPLES", "1000"))
+
+
+# =========================
+# CHECKOUT WAIT TIME
+# =========================
+
+class _WaitStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=DB_POOL_WAIT_SAMPLES)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self._recent.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            checkouts, timeouts = self.checkouts, self.timeouts
+            total, longest = self.total_seconds, self.max_seconds
+
+        def percentile(p):
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(len(recent) * p))] * 1000, 2)
+
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "avg_ms": round(total / checkouts * 1000, 2) if checkouts else 0.0,
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(longest * 1000, 2),
+        }
+
+
+class _TimedCheckout:
+    """
+    Times every checkout: the wait for a free connection (plus opening
+    one when the pool grows). Timeouts are counted before re-raising.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = _WaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+
+        self.wait_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+# =========================
+# ENGINE OPTIONS
+# =========================
+
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """create_engine / create_async_engine keyword arguments for `url`."""
+    options = {
+        "poolclass": TimedAsyncQueuePool if is_async else TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_HEALTH == "pre_ping",
+    }
+
+    if DB_STATEMENT_TIMEOUT_MS and make_url(url).get_backend_name() == "postgresql":
+        # Set once per connection at connect time, no per-query SET
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+
+    return options
+
+
+def pool_settings() -> dict:
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout_seconds": DB_POOL_TIMEOUT,
+        "pool_recycle_seconds": DB_POOL_RECYCLE,
+        "health_check": DB_POOL_HEALTH,
+        "statement_timeout_ms": DB_STATEMENT_TIMEOUT_MS or None,
+    }
+
+
+def pool_status(pool) -> dict:
+    """Live numbers for one engine's pool."""
+    max_overflow = getattr(pool, "_max_overflow", 0)
+
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "max_connections": pool.size() + max(0, max_overflow),
+        "wait": pool.wait_stats.snapshot() if hasattr(pool, "wait_stats") else None,
+    }
@@ -1,5 +1,17 @@
+import os
 import secrets
 import base64
 
-# Generate a secure random key (64 bytes = 512 bits)
-SECRET_KEY = base64.urlsafe_b64encode(secrets.token_bytes(64)).decode()
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Admin JWTs and OTP verification tokens are signed with it: every worker
+# and replica needs the same SECRET_KEY. Without one a random per-process
+# key is generated (single dev process only; tokens die on restart).
+SECRET_KEY = os.getenv("SECRET_KEY")
+
+if not SECRET_KEY:
+    # Generate a secure random key (64 bytes = 512 bits)
+    SECRET_KEY = base64.urlsafe_b64encode(secrets.token_bytes(64)).decode()
+    print("⚠️ SECRET_KEY is not set, using a random per-process key")
@@ -1,7 +1,10 @@
-from passlib.context import CryptContext
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from app.core.secret_key import SECRET_KEY
+from app.services.registry import get_service, service
 
 import os
 from dotenv import load_dotenv
@@ -12,13 +15,66 @@ SECRET_KEY = SECRET_KEY
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# verify-otp -> register: long enough to fill in the registration form
+VERIFICATION_TOKEN_EXPIRE_MINUTES = int(os.getenv("VERIFICATION_TOKEN_EXPIRE_MINUTES", "30"))
+VERIFICATION_TOKEN_AUDIENCE = "registration"
+
+# bcrypt cost; hashes made with another cost are re-hashed on the next login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# bcrypt runs on its own threads (it releases the GIL), never on the
+# threadpool / event loop that serves every other request
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "32"))  # queued + hashing
+PASSWORD_RETRY_AFTER_SECONDS = int(os.getenv("PASSWORD_RETRY_AFTER_SECONDS", "2"))
+
+_hash_slots = threading.BoundedSemaphore(PASSWORD_HASH_QUEUE_LIMIT)
+
+
+class PasswordHashBusy(Exception):
+    """PASSWORD_HASH_QUEUE_LIMIT hashes are already queued / running."""
+
+
+@service("pwd_context")
+def _pwd_context():
+    # passlib + bcrypt load with the first login / password change
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+@service("password_executor")
+def _password_executor():
+    return ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
 
 def verify_password(plain, hashed):
-    return pwd_context.verify(plain, hashed)
+    return get_service("pwd_context").verify(plain, hashed)
+
+def verify_and_update_password(plain, hashed):
+    """(valid, new_hash): new_hash is set when `hashed` used another BCRYPT_ROUNDS."""
+    return get_service("pwd_context").verify_and_update(plain, hashed)
 
 def hash_password(password):
-    return pwd_context.hash(password)
+    return get_service("pwd_context").hash(password)
+
+
+async def _run_hashing(fn, *args):
+    # Bounded: a login flood gets PasswordHashBusy (503) instead of an ever-growing queue
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashBusy()
+
+    try:
+        future = get_service("password_executor").submit(fn, *args)
+    except Exception:
+        _hash_slots.release()
+        raise
+
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(future)
+
+async def verify_and_update_password_async(plain, hashed):
+    return await _run_hashing(verify_and_update_password, plain, hashed)
+
+async def hash_password_async(password):
+    return await _run_hashing(hash_password, password)
 
 def create_access_token(data: dict):
     to_encode = data.copy()
@@ -27,3 +83,31 @@ def create_access_token(data: dict):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+# =========================
+# OTP VERIFICATION TOKEN
+# =========================
+
+def create_verification_token(verification_type: str, identifier: str) -> str:
+    """Signed proof that `identifier` passed OTP verification (checked without a DB query)."""
+    expire = datetime.utcnow() + timedelta(minutes=VERIFICATION_TOKEN_EXPIRE_MINUTES)
+
+    return jwt.encode({
+        "sub": identifier,
+        "type": verification_type,
+        # Admin tokens have no audience; jose rejects this one wherever none is expected
+        "aud": VERIFICATION_TOKEN_AUDIENCE,
+        "exp": expire
+    }, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_verification_token(token: str) -> dict | None:
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], audience=VERIFICATION_TOKEN_AUDIENCE)
+    except JWTError:
+        return None
+
+    # jose skips the audience check for tokens without one (e.g. an admin token)
+    if payload.get("aud") != VERIFICATION_TOKEN_AUDIENCE:
+        return None
+
+    return payload
@@ -1,18 +1,37 @@
 from fastapi import FastAPI
 from app.api.v1.router import api_router
-from app.core.database import engine
-from app.models.base import Base
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+from app.services.job_service import start_job_workers, stop_job_workers
+from app.services.template_service import warm_templates
+from app.services.pdf_render_service import start_pdf_workers, stop_pdf_workers
+from app.services.otp_cleanup_service import start_otp_sweeper, stop_otp_sweeper
 import os
 
 
+# Schema changes run as migrations (alembic upgrade head), never at startup
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile email / certificate templates before the first request
+    warm_templates()
 
-Base.metadata.create_all(bind=engine)
+    # Certificate rendering on other cores
+    start_pdf_workers()
 
+    # Background workers for bulk admin jobs
+    start_job_workers()
 
-app = FastAPI(title="Community Registration API")
+    # Expired OTP cleanup (one replica at a time, advisory lock)
+    start_otp_sweeper()
+    yield
+    stop_otp_sweeper()
+    stop_job_workers()
+    stop_pdf_workers()
+
+
+app = FastAPI(title="Community Registration API", lifespan=lifespan)
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MEDIA_DIR = os.path.join(BASE_DIR, "media")
@@ -0,0 +1,34 @@
+import uuid
+from sqlalchemy import Column, String, DateTime, Integer, Text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+
+from app.models.base import Base
+
+
+class AdminJob(Base):
+    __tablename__ = "admin_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_type = Column(String(50), nullable=False)  # bulk_approve / bulk_reject / bulk_hold
+    status = Column(String(20), nullable=False, default="queued")  # queued / running / retrying / completed / failed
+    payload = Column(JSONB, nullable=False)
+
+    # Progress
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    succeeded = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    failures = Column(JSONB, nullable=False, default=list)  # [{user_id, stage, error, attempts}]
+
+    # Retry state
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    last_error = Column(Text)
+    next_run_at = Column(DateTime)
+
+    created_by = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # worker heartbeat
+    finished_at = Column(DateTime)
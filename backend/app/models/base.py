@@ -1,3 +1,11 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
+
+# The gin_trgm_ops indexes need pg_trgm (migration 0003 creates it too)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
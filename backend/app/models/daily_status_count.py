@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Date, Integer
+
+from app.models.base import Base
+
+
+class DailyStatusCount(Base):
+    __tablename__ = "daily_status_counts"
+
+    # One row per (day, status). Current total of a status is
+    # SUM(entered - exited); activity for a day is its `entered`.
+    day = Column(Date, primary_key=True)
+    status = Column(String(20), primary_key=True)  # pending / hold / approved / rejected
+
+    entered = Column(Integer, nullable=False, default=0)
+    exited = Column(Integer, nullable=False, default=0)
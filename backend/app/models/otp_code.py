@@ -0,0 +1,32 @@
+from sqlalchemy import Column, String, DateTime, Integer, Index, DDL, event
+from datetime import datetime
+
+from app.models.base import Base
+
+
+class OTPCode(Base):
+    """
+    Latest OTP per identifier for OTP_STORE=unlogged.
+
+    UNLOGGED: no WAL for short-lived codes. Postgres empties the table
+    after a crash, which only means asking for a new OTP.
+    """
+    __tablename__ = "otp_codes"
+    __table_args__ = (
+        Index("ix_otp_codes_expires_at", "expires_at"),
+    )
+
+    verification_type = Column(String, primary_key=True)
+    identifier = Column(String, primary_key=True)
+    otp = Column(String, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+# Migration 0005 creates it UNLOGGED; same for create_all() on Postgres
+event.listen(
+    OTPCode.__table__,
+    "after_create",
+    DDL("ALTER TABLE otp_codes SET UNLOGGED").execute_if(dialect="postgresql")
+)
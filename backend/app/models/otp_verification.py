@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
@@ -9,6 +9,15 @@ from app.models.base import Base
 
 class OTPVerification(Base):
     __tablename__ = "otp_verifications"
+    __table_args__ = (
+        # send-otp cooldown / verify-otp: latest unverified OTP of an identifier
+        Index(
+            "ix_otp_verifications_lookup", "identifier", "verification_type", "created_at",
+            postgresql_where=text("verified = false")
+        ),
+        # Sweeper: expires_at < now() range, batch by batch
+        Index("ix_otp_verifications_expires_at", "expires_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     identifier = Column(String, nullable=False)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, DateTime, Float, Index, DDL, event
+
+from app.models.base import Base
+
+
+class RateLimitBucket(Base):
+    """Token bucket state for RATE_LIMIT_BACKEND=postgres, one row per key."""
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = (
+        Index("ix_rate_limit_buckets_expires_at", "expires_at"),
+    )
+
+    key = Column(String, primary_key=True)  # <rule>:<ip|id>:<value>
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    # When the bucket is full again: past that the row means nothing and the sweeper drops it
+    expires_at = Column(DateTime, nullable=False)
+
+
+# Hot, disposable counters: no WAL (migration 0006 creates it UNLOGGED too)
+event.listen(
+    RateLimitBucket.__table__,
+    "after_create",
+    DDL("ALTER TABLE rate_limit_buckets SET UNLOGGED").execute_if(dialect="postgresql")
+)
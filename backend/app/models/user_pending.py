@@ -1,5 +1,5 @@
 from pydantic import BaseModel, model_validator
-from sqlalchemy import Column, String, Boolean, Date, Text, Enum, DateTime
+from sqlalchemy import Column, String, Boolean, Date, Text, Enum, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -8,6 +8,24 @@ from app.models.base import Base
 
 class UserPending(Base):
     __tablename__ = "users_pending"
+    __table_args__ = (
+        # Admin list: status = 'pending' ORDER BY created_at DESC, id DESC (keyset)
+        Index("ix_users_pending_status_created_at", "status", "created_at", "id"),
+        # district / mandal filters, each usable on its own (list and CSV export);
+        # state alone is too broad for an index to help
+        Index("ix_users_pending_district_mandal", "current_district", "current_mandal"),
+        Index("ix_users_pending_mandal", "current_mandal"),
+        Index("ix_users_pending_surname", "surname"),
+        # ilike('%...%') needs trigram GIN, a btree can't serve a leading wildcard
+        Index(
+            "ix_users_pending_gothram_trgm", "gothram",
+            postgresql_using="gin", postgresql_ops={"gothram": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_users_pending_desired_name_trgm", "desired_name",
+            postgresql_using="gin", postgresql_ops={"desired_name": "gin_trgm_ops"}
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -67,6 +85,8 @@ class UserPending(Base):
 
     photo_url = Column(Text, nullable=False)
     pdf_url = Column(Text, nullable=False)
+    pdf_status = Column(String(20), nullable=False, default="queued", server_default="queued")  # queued / ready / failed
+    language = Column(String(5), nullable=False, default="en", server_default="en")  # emails (en / te)
 
     referred_by_name = Column(String(150), nullable=False)
     referred_mobile = Column(String(10), nullable=False)
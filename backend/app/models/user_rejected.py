@@ -64,6 +64,7 @@ class UserRejected(Base):
 
     # Media
     photo_url = Column(Text)
+    language = Column(String(5), nullable=False, default="en", server_default="en")  # emails (en / te)
 
     # Referral
     referred_by_name = Column(String(120))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, Text, DateTime, Enum
+from sqlalchemy import Column, String, Date, Text, DateTime, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -7,6 +7,17 @@ from app.models.base import Base
 
 class UserVerified(Base):
     __tablename__ = "users_verified"
+    __table_args__ = (
+        # Admin list: ORDER BY approved_at DESC, id DESC (keyset)
+        Index("ix_users_verified_approved_at", "approved_at", "id"),
+        Index("ix_users_verified_district_mandal", "current_district", "current_mandal"),
+        Index("ix_users_verified_mandal", "current_mandal"),
+        Index("ix_users_verified_surname", "surname"),
+        Index(
+            "ix_users_verified_gothram_trgm", "gothram",
+            postgresql_using="gin", postgresql_ops={"gothram": "gin_trgm_ops"}
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     membership_id = Column(String(30), unique=True, nullable=False)
@@ -60,6 +71,8 @@ class UserVerified(Base):
 
     photo_url = Column(Text, nullable=False)
     pdf_url = Column(Text, nullable=False)
+    pdf_content_hash = Column(String(64))  # content_hash() of the certificate on disk
+    language = Column(String(5), nullable=False, default="en", server_default="en")  # emails (en / te)
 
     referred_by_name = Column(String(150), nullable=False)
     referred_mobile = Column(String(10), nullable=False)
@@ -1,6 +1,15 @@
 from pydantic import BaseModel
 from typing import List, Optional
+from datetime import date
 
 class BulkUserActionRequest(BaseModel):
     user_ids: List[str]
     reason: Optional[str] = None
+
+
+class RegenerateCertificatesRequest(BaseModel):
+    user_ids: Optional[List[str]] = None      # none = every approved member
+    approved_from: Optional[date] = None
+    approved_to: Optional[date] = None
+    force: bool = False                       # re-render even if unchanged
+    language: str = "en"
@@ -53,3 +53,9 @@ class UserRegistrationRequest(BaseModel):
     referred_by_name: str
     referred_mobile: str
     feedback: Optional[str]
+
+    # Certificate and email language (en / te); stored on the user for later emails
+    language: Optional[str] = "en"
+
+    # From /auth/verify-otp, proves the mobile / email was verified; not stored
+    verification_token: Optional[str] = None
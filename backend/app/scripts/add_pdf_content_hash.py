@@ -0,0 +1,26 @@
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+
+# Superseded by the 0002_backlog_additions migration (alembic upgrade head);
+# kept for databases that are not on migrations yet.
+# NULL hash = never regenerated, so the first run re-renders everyone.
+STATEMENTS = [
+    "ALTER TABLE users_verified ADD COLUMN IF NOT EXISTS pdf_content_hash VARCHAR(64)",
+]
+
+db = SessionLocal()
+
+try:
+    for statement in STATEMENTS:
+        db.execute(text(statement))
+
+    db.commit()
+    print("✅ users_verified.pdf_content_hash added")
+
+except Exception as e:
+    db.rollback()
+    print("❌ Migration failed:", str(e))
+
+finally:
+    db.close()
@@ -0,0 +1,27 @@
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+
+# Superseded by the 0002_backlog_additions migration (alembic upgrade head);
+# kept for databases that are not on migrations yet.
+# Rows that exist already had their PDF rendered in-process, so they start as "ready".
+STATEMENTS = [
+    "ALTER TABLE users_pending ADD COLUMN IF NOT EXISTS pdf_status VARCHAR(20) NOT NULL DEFAULT 'ready'",
+    "ALTER TABLE users_pending ALTER COLUMN pdf_status SET DEFAULT 'queued'",
+]
+
+db = SessionLocal()
+
+try:
+    for statement in STATEMENTS:
+        db.execute(text(statement))
+
+    db.commit()
+    print("✅ users_pending.pdf_status added")
+
+except Exception as e:
+    db.rollback()
+    print("❌ Migration failed:", str(e))
+
+finally:
+    db.close()
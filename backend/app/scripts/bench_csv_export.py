@@ -0,0 +1,61 @@
+"""
+Peak memory of the CSV export, buffered vs streamed.
+
+Rows are synthetic tuples shaped like the approved-users export, so no
+database is needed:
+
+    python -m app.scripts.bench_csv_export
+"""
+import csv
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from io import StringIO
+
+from app.utils.csv_stream import iter_csv
+
+HEADER = [f"col_{i}" for i in range(17)]
+
+
+def fake_rows(count: int):
+    for i in range(count):
+        yield (
+            f"MEM-{i:06d}", f"KGC-{i:08X}", "Full Name Example", "Surname",
+            "Desired Name", "Gothram", "9876543210", f"user{i}@example.com",
+            "12-3-45", "Village", "Mandal", "District", "State", "India",
+            "500001", uuid.uuid4(), datetime.utcnow(),
+        )
+
+
+def buffered_export(count: int) -> int:
+    # Previous behaviour: load every row, then write one big StringIO
+    users = list(fake_rows(count))
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(HEADER)
+    for user in users:
+        writer.writerow(user)
+    return len(output.getvalue())
+
+
+def streamed_export(count: int) -> int:
+    return sum(len(chunk) for chunk in iter_csv(HEADER, fake_rows(count)))
+
+
+def measure(fn, count: int):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = fn(count)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak, elapsed
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>8} {'mode':>9} {'csv MB':>8} {'peak MB':>8} {'seconds':>8}")
+    for count in (10_000, 50_000, 100_000):
+        for name, fn in (("buffered", buffered_export), ("streamed", streamed_export)):
+            size, peak, elapsed = measure(fn, count)
+            print(f"{count:>8} {name:>9} {size / 1e6:>8.1f} {peak / 1e6:>8.1f} {elapsed:>8.2f}")
@@ -0,0 +1,87 @@
+"""
+Render cost of the approval email, old f-string path vs compiled templates.
+
+    python -m app.scripts.bench_email_render
+"""
+import time
+
+from app.services.template_service import get_template, render_many, render_template, warm_templates
+
+
+def legacy_approval_html(desired_name: str, membership_id: str) -> str:
+    # Previous email_service body (trimmed to the same markup as the template)
+    return f"""
+    <html>
+      <body style="font-family: Arial, sans-serif; background:#f6f6f6; padding:20px;">
+        <div style="max-width:600px; margin:auto; background:#ffffff; padding:20px; border-radius:6px;">
+          <h2 style="color:#2c3e50;">🎉 Membership Approved</h2>
+          <p style="font-size:16px; font-weight:bold; color:#2c3e50;">
+            Welcome to <span style="color:#27ae60;">KANAGALA CHARITABLE TRUST</span>
+          </p>
+          <p>Dear <b>{desired_name}</b>,</p>
+          <p>Congratulations! Your registration has been <b>successfully approved</b>.</p>
+          <p><b>Your Membership Details:</b></p>
+          <ul>
+            <li><b>Membership ID:</b> {membership_id}</li>
+            <li><b>Name:</b> {desired_name}</li>
+          </ul>
+          <p>You are now an official member of our community.</p>
+          <hr>
+          <p>📞 Support: +91-XXXXXXXXXX<br>📧 Email: support@community.org</p>
+          <p>Warm regards,<br><b>Community Admin Team</b></p>
+        </div>
+      </body>
+    </html>
+    """
+
+
+def contexts(count: int) -> list[dict]:
+    return [
+        {"desired_name": f"Member <{i}> & Family", "membership_id": f"MEM-{i:06d}"}
+        for i in range(count)
+    ]
+
+
+def run_legacy(items):
+    return [legacy_approval_html(**item) for item in items]
+
+
+def run_per_call(items):
+    return [render_template("email/approval", "en", **item) for item in items]
+
+
+def run_render_many(items):
+    return render_many("email/approval", items, "en")
+
+
+def run_placeholder_once(items):
+    # params mode: one body for the whole batch, Brevo fills in the rest
+    return [render_template(
+        "email/approval", "en",
+        desired_name="{{ params.desired_name }}",
+        membership_id="{{ params.membership_id }}"
+    )]
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    warm_templates()
+    print(f"warm-up (compile all templates): {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    started = time.perf_counter()
+    get_template("email/approval", "te")
+    print(f"cached lookup after warm-up:     {(time.perf_counter() - started) * 1e6:.1f} us\n")
+
+    print(f"{'bodies':>8} {'mode':>18} {'ms':>9} {'us/body':>9}")
+    for count in (100, 1_000, 10_000):
+        items = contexts(count)
+        for name, fn in (
+            ("f-string", run_legacy),
+            ("render per call", run_per_call),
+            ("render_many", run_render_many),
+            ("params (1 body)", run_placeholder_once),
+        ):
+            started = time.perf_counter()
+            fn(items)
+            elapsed = time.perf_counter() - started
+            print(f"{count:>8} {name:>18} {elapsed * 1000:>9.1f} {elapsed * 1e6 / count:>9.2f}")
@@ -0,0 +1,135 @@
+"""
+Admin login latency under concurrent load: bcrypt on the shared
+threadpool (old) vs the bounded password executor.
+
+Runs the app in-process. While `concurrency` clients log in, as many
+others keep calling a sync endpoint, which needs a threadpool thread
+just like every other sync route. Needs DATABASE_URL; a bench admin is
+created and removed again:
+
+    python -m app.scripts.bench_login [logins] [concurrency]
+"""
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+from fastapi.concurrency import run_in_threadpool
+
+import app.api.v1.admin as admin_api
+from app.core.database import SessionLocal, async_engine
+from app.core.security import (
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    hash_password,
+    verify_and_update_password,
+    verify_and_update_password_async
+)
+from app.main import app
+from app.models.admin_user import AdminUser
+from app.services.rate_limit_service import NoRateLimiter, set_rate_limiter
+
+USERNAME = "bench_login_admin"
+PASSWORD = "bench-login-password"
+
+
+async def threadpool_verify(plain, hashed):
+    # Previous admin_login: bcrypt on the threadpool every sync route shares
+    return await run_in_threadpool(verify_and_update_password, plain, hashed)
+
+
+def percentile(values: list, pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def timed(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> tuple[float, int]:
+    started = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    return (time.perf_counter() - started) * 1000, response.status_code
+
+
+async def run(mode: str, logins: int, concurrency: int) -> dict:
+    admin_api.verify_and_update_password_async = (
+        threadpool_verify if mode == "threadpool" else verify_and_update_password_async
+    )
+
+    login_times, other_times, statuses = [], [], {}
+    remaining = iter(range(logins))
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def login_worker():
+            for _ in remaining:
+                elapsed, status = await timed(
+                    client, "POST", "/api/v1/admin/login",
+                    json={"username": USERNAME, "password": PASSWORD}
+                )
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == 200:
+                    login_times.append(elapsed)
+
+        async def other_worker():
+            while not done.is_set():
+                elapsed, _ = await timed(client, "GET", "/")
+                other_times.append(elapsed)
+
+        others = [asyncio.create_task(other_worker()) for _ in range(concurrency)]
+
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+        done.set()
+        await asyncio.gather(*others)
+
+    return {
+        "wall": wall,
+        "statuses": statuses,
+        "login_p50": statistics.median(login_times) if login_times else 0,
+        "login_p99": percentile(login_times, 99) if login_times else 0,
+        "other_p99": percentile(other_times, 99) if other_times else 0,
+    }
+
+
+if __name__ == "__main__":
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+
+    # Measure bcrypt, not the login rate limit
+    set_rate_limiter(NoRateLimiter())
+
+    db = SessionLocal()
+    try:
+        db.query(AdminUser).filter(AdminUser.username == USERNAME).delete()
+        db.add(AdminUser(username=USERNAME, password_hash=hash_password(PASSWORD), role="readonly"))
+        db.commit()
+
+        print(f"{logins} logins, {concurrency} concurrent, BCRYPT_ROUNDS={BCRYPT_ROUNDS}, "
+              f"PASSWORD_HASH_WORKERS={PASSWORD_HASH_WORKERS}")
+
+        # One event loop for both runs: the async engine's pool is bound to it
+        async def run_all():
+            try:
+                return [(mode, await run(mode, logins, concurrency)) for mode in ("threadpool", "executor")]
+            finally:
+                await async_engine.dispose()
+
+        for mode, result in asyncio.run(run_all()):
+            print(
+                f"{mode:>10}: login p50 {result['login_p50']:.0f} ms, p99 {result['login_p99']:.0f} ms | "
+                f"sync endpoint p99 {result['other_p99']:.0f} ms | "
+                f"{logins / result['wall']:.0f} logins/s | statuses {result['statuses']}"
+            )
+
+        db.query(AdminUser).filter(AdminUser.username == USERNAME).delete()
+        db.commit()
+        print("✅ Bench admin removed")
+
+    except Exception as e:
+        db.rollback()
+        print("❌ Error:", e)
+
+    finally:
+        db.close()
@@ -0,0 +1,106 @@
+"""
+Registration PDF throughput, in PDFs per second per core.
+
+Runs single-threaded and divides by CPU time, so the number is per core
+whatever else the machine is doing. Also compares size and latency of
+the English and Telugu certificates. Telugu needs Noto Sans Telugu (or
+another font with Telugu glyphs) at TELUGU_FONT_PATH:
+
+    python -m app.scripts.bench_pdf [count]
+"""
+import os
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+from fontTools.ttLib import TTFont
+
+from app.services.font_service import TELUGU_FONT_PATH, telugu_fonts_available
+from app.services.pdf_service import build_pdf, generate_attractive_pdf, paragraph_styles, render_pdf_bytes
+
+
+def sample_data(i: int) -> dict:
+    return {
+        "registration_id": f"KGC-BENCH{i:06d}",
+        "full_name": "Kanagala Venkata Ramana",
+        "desired_name": "Ramana",
+        "father_or_husband_name": "Kanagala Subba Rao",
+        "mother_name": "Lakshmi",
+        "surname": "Kanagala",
+        "date_of_birth": "1985-04-12",
+        "gender": "Male",
+        "marital_status": "Married",
+        "blood_group": "B+",
+        "gothram": "Kasyapa",
+        "aaradhya_daiva": "Venkateswara",
+        "kula_devata": "Ankamma",
+        "education": "B.Tech",
+        "occupation": "Engineer",
+        "current_house_number": "12-3-45",
+        "current_village_city": "Guntur",
+        "current_mandal": "Guntur",
+        "current_district": "Guntur",
+        "current_state": "Andhra Pradesh",
+        "current_country": "India",
+        "current_pin_code": "522001",
+        "native_house_number": "1-2",
+        "native_village_city": "Tenali",
+        "native_mandal": "Tenali",
+        "native_district": "Guntur",
+        "native_state": "Andhra Pradesh",
+        "native_country": "India",
+        "native_pin_code": "522201",
+        "email": f"member{i}@example.com",
+        "mobile_number": "9876543210",
+        "referred_by_name": "Srinivas",
+        "referred_mobile": "9123456780",
+        "feedback": "Happy to join the community.",
+    }
+
+
+def covers_telugu(path: str) -> bool:
+    # A stand-in font without Telugu glyphs would time .notdef boxes
+    return 0x0C15 in TTFont(path, lazy=True).getBestCmap()  # TELUGU LETTER KA
+
+
+def bench(render, count: int):
+    render(sample_data(0))  # warm-up (font metrics, imports)
+
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    for i in range(count):
+        render(sample_data(i))
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+
+    return count / cpu, wall / count * 1000
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # generate_attractive_pdf writes under ./media/pdfs
+        per_core, ms = bench(generate_attractive_pdf, count)
+        print(f"disk   {count} PDFs: {per_core:.1f} PDFs/s/core, {ms:.2f} ms each")
+
+    per_core, ms = bench(lambda data: build_pdf(data, BytesIO()), count)
+    print(f"memory {count} PDFs: {per_core:.1f} PDFs/s/core, {ms:.2f} ms each")
+
+    languages = ["en"]
+    if not telugu_fonts_available():
+        print(f"\nTelugu skipped: no font at {TELUGU_FONT_PATH}")
+    elif not covers_telugu(TELUGU_FONT_PATH):
+        print(f"\nTelugu skipped: {TELUGU_FONT_PATH} has no Telugu glyphs")
+    else:
+        started = time.perf_counter()
+        paragraph_styles("te")
+        print(f"\nTelugu font register + subset (once per process): {(time.perf_counter() - started) * 1000:.0f} ms")
+        languages.append("te")
+
+    print(f"\n{'lang':>5} {'KB':>7} {'ms each':>8} {'PDFs/s/core':>12}")
+    for language in languages:
+        size = len(render_pdf_bytes(sample_data(0), language))
+        per_core, ms = bench(lambda data: render_pdf_bytes(data, language), count)
+        print(f"{language:>5} {size / 1024:>7.1f} {ms:>8.2f} {per_core:>12.1f}")
@@ -0,0 +1,64 @@
+"""
+Cold start time of `import app.main`, each run in a fresh interpreter.
+
+Also reports how many DB connections the import opened (should be 0:
+no DDL at startup). With --create-all the old create_all() call is timed
+on top, which needs a reachable DATABASE_URL:
+
+    python -m app.scripts.bench_startup [runs] [--create-all]
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, time
+
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter() - started
+
+from app.core.database import async_engine, engine
+
+checkouts = engine.pool.wait_stats.checkouts + async_engine.sync_engine.pool.wait_stats.checkouts
+
+create_all = None
+if {create_all}:
+    from app.models import Base
+    started = time.perf_counter()
+    Base.metadata.create_all(bind=engine)
+    create_all = time.perf_counter() - started
+
+print(json.dumps({{"import": imported, "checkouts": checkouts, "create_all": create_all}}))
+"""
+
+
+def run_once(create_all: bool) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(create_all=create_all)],
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode != 0:
+        lines = [line for line in result.stderr.strip().splitlines() if not line.startswith("(Background")]
+        raise RuntimeError(lines[-1])
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    runs = int(args[0]) if args else 10
+    create_all = "--create-all" in sys.argv
+
+    results = [run_once(create_all) for _ in range(runs)]
+    imports = [result["import"] * 1000 for result in results]
+
+    print(f"import app.main, {runs} cold runs: median {statistics.median(imports):.0f} ms, min {min(imports):.0f} ms")
+    print(f"DB connections opened during import: {max(result['checkouts'] for result in results)}")
+
+    if create_all:
+        ddl = [result["create_all"] * 1000 for result in results]
+        print(f"create_all() it used to run (x2 per process): median {statistics.median(ddl):.0f} ms")
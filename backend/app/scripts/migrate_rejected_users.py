@@ -1,6 +1,7 @@
 from app.core.database import SessionLocal
 from app.models.user_pending import UserPending
 from app.models.user_rejected import UserRejected
+from app.services.rollup_service import record_transition
 
 db = SessionLocal()
 
@@ -48,6 +49,9 @@ try:
         db.add(rejected)
         db.delete(user)
 
+    # Rejected pending rows were never in the rollups; count them as rejected now
+    record_transition(db, None, "rejected", len(rejected_users))
+
     db.commit()
     print("✅ Migration completed successfully")
 
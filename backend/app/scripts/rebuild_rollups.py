@@ -0,0 +1,16 @@
+from app.core.database import SessionLocal
+from app.services.rollup_service import rebuild_rollups
+
+db = SessionLocal()
+
+try:
+    rebuild_rollups(db)
+    db.commit()
+    print("✅ Dashboard rollups rebuilt successfully")
+
+except Exception as e:
+    db.rollback()
+    print("❌ Rollup rebuild failed:", str(e))
+
+finally:
+    db.close()
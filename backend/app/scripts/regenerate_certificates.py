@@ -0,0 +1,63 @@
+"""
+Re-render approved members' certificates on the PDF render pool
+(PDF_RENDER_WORKERS processes; --workers renders in flight).
+
+    python -m app.scripts.regenerate_certificates                 # everything that changed
+    python -m app.scripts.regenerate_certificates --force         # everything
+    python -m app.scripts.regenerate_certificates --from 2025-01-01 --to 2025-03-31
+    python -m app.scripts.regenerate_certificates --user-id <uuid> --user-id <uuid>
+"""
+import argparse
+from datetime import date
+
+from app.core.database import SessionLocal
+from app.services.certificate_service import certificate_query, regenerate_certificates
+from app.services.pdf_render_service import PDF_RENDER_WORKERS, stop_pdf_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate approved member certificates")
+    parser.add_argument("--user-id", action="append", dest="user_ids")
+    parser.add_argument("--from", dest="approved_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="approved_to", type=date.fromisoformat)
+    parser.add_argument("--force", action="store_true", help="re-render unchanged certificates too")
+    parser.add_argument("--language", default="en")
+    # Nothing else renders in this process: keep the whole pool busy
+    parser.add_argument("--workers", type=int, default=PDF_RENDER_WORKERS)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+
+    def on_batch(rendered, skipped, failures):
+        print(f"  batch: {rendered} rendered, {skipped} unchanged, {len(failures)} failed")
+
+    try:
+        query = certificate_query(db, args.user_ids, args.approved_from, args.approved_to)
+        stats = regenerate_certificates(
+            db,
+            query,
+            force=args.force,
+            language=args.language,
+            workers=args.workers,
+            on_batch=on_batch
+        )
+
+        print(
+            f"✅ {stats['rendered']} rendered ({stats['cached']} from cache, {stats['deferred']} on next download), "
+            f"{stats['skipped']} unchanged, {stats['failed']} failed "
+            f"in {stats['seconds']}s ({stats['per_second']} certificates/s on {args.workers} workers)"
+        )
+        for failure in stats["failures"]:
+            print("❌", failure["user_id"], failure["error"])
+
+    except Exception as e:
+        db.rollback()
+        print("❌ Regeneration failed:", str(e))
+
+    finally:
+        db.close()
+        stop_pdf_workers()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Text, cast, delete, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.models.admin_audit_log import AdminAuditLog
+from app.models.user_pending import UserPending
+from app.models.user_rejected import UserRejected
+from app.models.user_verified import UserVerified
+
+# Every column the two tables share (id included, so the verified row keeps
+# the pending id that the audit log points at).
+APPROVE_COPY_COLUMNS = [
+    column.name
+    for column in UserVerified.__table__.columns
+    if column.name in UserPending.__table__.columns
+]
+
+
+def _membership_id_expr(sequence_value):
+    # Same format as generate_membership_id(): MEM-000042, never truncated
+    seq_text = cast(sequence_value, Text)
+    return literal("MEM-") + func.lpad(
+        seq_text,
+        func.greatest(6, func.length(seq_text)),
+        "0"
+    )
+
+
+def _insert_audit_logs(db: Session, admin_id: str, action: str, target_ids: list, reason: str | None):
+    if not target_ids:
+        return
+
+    db.execute(
+        insert(AdminAuditLog),
+        [
+            {
+                "admin_id": admin_id,
+                "action": action,
+                "target_type": "user",
+                "target_id": target_id,
+                "reason": reason,
+            }
+            for target_id in target_ids
+        ]
+    )
+
+
+# =========================
+# BULK APPROVE (SET-BASED)
+# =========================
+
+def bulk_approve_pending(db: Session, user_ids: list, admin_id: str, reason: str | None = None) -> list:
+    """
+    Move pending users to users_verified with three statements:
+
+    1. INSERT INTO users_verified ... SELECT ... FROM users_pending
+       (membership ids drawn inline from membership_id_seq)
+    2. one multi-row INSERT into admin_audit_logs
+    3. DELETE FROM users_pending ... RETURNING id
+
+    Runs in the caller's transaction. Returns one row per approved user
+    with id, membership_id, email, desired_name, full_name and language.
+    """
+    pending = UserPending.__table__
+    verified = UserVerified.__table__
+
+    numbered = (
+        select(
+            *[pending.c[name] for name in APPROVE_COPY_COLUMNS],
+            func.nextval("membership_id_seq").label("membership_seq"),
+        )
+        .where(
+            pending.c.id.in_(user_ids),
+            pending.c.status == "pending"
+        )
+        .subquery()
+    )
+
+    approved_by = uuid.UUID(admin_id) if admin_id else None
+
+    approved = db.execute(
+        insert(verified)
+        .from_select(
+            [*APPROVE_COPY_COLUMNS, "membership_id", "approved_by", "approved_at"],
+            select(
+                *[numbered.c[name] for name in APPROVE_COPY_COLUMNS],
+                _membership_id_expr(numbered.c.membership_seq),
+                literal(approved_by, UUID(as_uuid=True)),
+                literal(datetime.utcnow()),
+            )
+        )
+        .returning(
+            verified.c.id,
+            verified.c.membership_id,
+            verified.c.email,
+            verified.c.desired_name,
+            verified.c.full_name,
+            verified.c.language,
+        )
+    ).all()
+
+    approved_ids = [row.id for row in approved]
+
+    _insert_audit_logs(db, admin_id, "APPROVE", approved_ids, reason)
+
+    if approved_ids:
+        deleted = db.execute(
+            delete(pending)
+            .where(pending.c.id.in_(approved_ids))
+            .returning(pending.c.id)
+        ).all()
+
+        if len(deleted) != len(approved_ids):
+            raise RuntimeError("Pending users changed during approval")
+
+    return approved
+
+
+# =========================
+# BULK REJECT (SET-BASED)
+# =========================
+
+REJECT_COPY_COLUMNS = [
+    column.name
+    for column in UserRejected.__table__.columns
+    if column.name in UserPending.__table__.columns
+    and column.name not in ("id", "reject_reason")
+]
+
+
+def _as_rejected_column(source, target):
+    # users_rejected stores dob / marital status as plain text
+    if type(source.type) is not type(target.type):
+        return cast(source, target.type)
+    return source
+
+
+def bulk_reject_pending(db: Session, user_ids: list, admin_id: str, reason: str) -> list:
+    """
+    Move pending users to users_rejected (INSERT ... SELECT), write one
+    audit row each and delete them from users_pending.
+
+    Returns one row per rejected user with original_pending_id,
+    registration_id, email, full_name, desired_name and language.
+    """
+    pending = UserPending.__table__
+    rejected = UserRejected.__table__
+
+    rejected_by = uuid.UUID(admin_id) if admin_id else None
+
+    moved = db.execute(
+        insert(rejected)
+        .from_select(
+            ["id", "original_pending_id", *REJECT_COPY_COLUMNS, "reject_reason", "rejected_by_admin_id"],
+            select(
+                func.gen_random_uuid(),
+                pending.c.id,
+                *[_as_rejected_column(pending.c[name], rejected.c[name]) for name in REJECT_COPY_COLUMNS],
+                literal(reason, Text),
+                literal(rejected_by, UUID(as_uuid=True)),
+            )
+            .where(
+                pending.c.id.in_(user_ids),
+                pending.c.status == "pending"
+            )
+        )
+        .returning(
+            rejected.c.original_pending_id,
+            rejected.c.registration_id,
+            rejected.c.email,
+            rejected.c.full_name,
+            rejected.c.desired_name,
+            rejected.c.language,
+        )
+    ).all()
+
+    rejected_ids = [row.original_pending_id for row in moved]
+
+    _insert_audit_logs(db, admin_id, "REJECT", rejected_ids, reason)
+
+    if rejected_ids:
+        deleted = db.execute(
+            delete(pending)
+            .where(pending.c.id.in_(rejected_ids))
+            .returning(pending.c.id)
+        ).all()
+
+        if len(deleted) != len(rejected_ids):
+            raise RuntimeError("Pending users changed during rejection")
+
+    return moved
+
+
+# =========================
+# BULK HOLD (SET-BASED)
+# =========================
+
+def bulk_hold_pending(db: Session, user_ids: list, admin_id: str, reason: str) -> list:
+    """Put pending users on hold with one UPDATE ... RETURNING. Returns their ids."""
+    pending = UserPending.__table__
+
+    held = db.execute(
+        update(pending)
+        .where(
+            pending.c.id.in_(user_ids),
+            pending.c.status == "pending"
+        )
+        .values(status="hold", hold_reason=reason)
+        .returning(pending.c.id)
+    ).all()
+
+    held_ids = [row.id for row in held]
+
+    _insert_audit_logs(db, admin_id, "HOLD", held_ids, reason)
+
+    return held_ids
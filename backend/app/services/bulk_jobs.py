@@ -0,0 +1,232 @@
+import os
+import time
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.models.admin_job import AdminJob
+from app.services.bulk_action_service import bulk_approve_pending, bulk_hold_pending, bulk_reject_pending
+from app.services.certificate_service import certificate_query, regenerate_certificates
+from app.services.email_service import send_approval_emails, send_rejection_emails
+from app.services.job_service import add_failures, job_handler, record_progress
+from app.services.rollup_service import record_transition
+
+JOB_CHUNK_SIZE = int(os.getenv("JOB_CHUNK_SIZE", "100"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "3"))
+
+
+def _with_retries(fn, *args, **kwargs):
+    """Returns (error or None, attempts used)."""
+    error = None
+
+    for attempt in range(1, EMAIL_MAX_ATTEMPTS + 1):
+        try:
+            fn(*args, **kwargs)
+            return None, attempt
+        except Exception as e:
+            error = str(e)
+            if attempt < EMAIL_MAX_ATTEMPTS:
+                time.sleep(2 ** (attempt - 1))
+
+    return error, EMAIL_MAX_ATTEMPTS
+
+
+def _failure(user_id, stage: str, error: str, attempts: int = 1) -> dict:
+    return {"user_id": str(user_id), "stage": stage, "error": error, "attempts": attempts}
+
+
+# =========================
+# CHUNKED PROCESSING
+# =========================
+
+def _move_chunk(db: Session, job: AdminJob, move, to_status: str, chunk: list) -> list:
+    rows, done_ids = move(db, chunk)
+
+    done = {str(user_id) for user_id in done_ids}
+    skipped = [
+        _failure(user_id, "move", "User not in pending state")
+        for user_id in chunk
+        if user_id not in done
+    ]
+
+    record_transition(db, "pending", to_status, len(done))
+    record_progress(job, len(done), skipped)
+    db.commit()
+
+    return rows
+
+
+def _move_one_by_one(db: Session, job: AdminJob, move, to_status: str, chunk: list) -> list:
+    # The set-based chunk failed: retry users alone to isolate the bad ones
+    rows = []
+
+    for user_id in chunk:
+        try:
+            rows.extend(_move_chunk(db, job, move, to_status, [user_id]))
+        except Exception as e:
+            db.rollback()
+            record_progress(job, 0, [_failure(user_id, "move", str(e))])
+            db.commit()
+
+    return rows
+
+
+def _process_in_chunks(db: Session, job: AdminJob, move, to_status: str, notify=None):
+    """
+    Work through job.payload["user_ids"] JOB_CHUNK_SIZE at a time.
+
+    Each chunk commits together with the job progress, so a retried job
+    resumes at job.processed and never moves a user twice.
+    """
+    user_ids = job.payload["user_ids"]
+
+    while job.processed < len(user_ids):
+        chunk = user_ids[job.processed:job.processed + JOB_CHUNK_SIZE]
+
+        try:
+            rows = _move_chunk(db, job, move, to_status, chunk)
+        except Exception as e:
+            db.rollback()
+            print("JOB CHUNK ERROR:", job.id, str(e))
+            rows = _move_one_by_one(db, job, move, to_status, chunk)
+
+        if notify and rows:
+            add_failures(job, notify(rows))
+            db.commit()
+
+
+# =========================
+# NOTIFICATIONS
+# =========================
+
+def _notify_approved(rows) -> list:
+    recipients = [row for row in rows if row.email]
+    if not recipients:
+        return []
+
+    # One Brevo batch call for the whole chunk
+    error, attempts = _with_retries(
+        send_approval_emails,
+        [
+            {
+                "email": row.email,
+                "desired_name": row.desired_name or row.full_name,
+                "membership_id": row.membership_id,
+                "language": row.language,
+            }
+            for row in recipients
+        ]
+    )
+
+    if not error:
+        return []
+
+    return [_failure(row.id, "email", error, attempts) for row in recipients]
+
+
+def _notify_rejected(reason: str):
+    def notify(rows) -> list:
+        recipients = [row for row in rows if row.email]
+        if not recipients:
+            return []
+
+        error, attempts = _with_retries(
+            send_rejection_emails,
+            [
+                {
+                    "email": row.email,
+                    "full_name": row.full_name,
+                    "desired_name": row.desired_name,
+                    "registration_id": row.registration_id,
+                    "language": row.language,
+                }
+                for row in recipients
+            ],
+            reason
+        )
+
+        if not error:
+            return []
+
+        return [_failure(row.original_pending_id, "email", error, attempts) for row in recipients]
+
+    return notify
+
+
+# =========================
+# HANDLERS
+# =========================
+
+@job_handler("bulk_approve")
+def run_bulk_approve(db: Session, job: AdminJob):
+    reason = job.payload.get("reason")
+
+    def move(db, user_ids):
+        rows = bulk_approve_pending(db, user_ids, job.created_by, reason)
+        return rows, [row.id for row in rows]
+
+    _process_in_chunks(db, job, move, "approved", _notify_approved)
+
+
+@job_handler("bulk_reject")
+def run_bulk_reject(db: Session, job: AdminJob):
+    reason = job.payload["reason"]
+
+    def move(db, user_ids):
+        rows = bulk_reject_pending(db, user_ids, job.created_by, reason)
+        return rows, [row.original_pending_id for row in rows]
+
+    _process_in_chunks(db, job, move, "rejected", _notify_rejected(reason))
+
+
+@job_handler("bulk_hold")
+def run_bulk_hold(db: Session, job: AdminJob):
+    reason = job.payload["reason"]
+
+    def move(db, user_ids):
+        held_ids = bulk_hold_pending(db, user_ids, job.created_by, reason)
+        return held_ids, held_ids
+
+    _process_in_chunks(db, job, move, "hold")
+
+
+# =========================
+# CERTIFICATES
+# =========================
+
+def _parse_date(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value else None
+
+
+@job_handler("regenerate_certificates")
+def run_regenerate_certificates(db: Session, job: AdminJob):
+    payload = job.payload
+
+    # Certificates already rendered are skipped by hash, so a retried
+    # job simply starts over instead of resuming
+    job.processed = job.succeeded = job.failed = 0
+    job.failures = []
+    db.commit()
+
+    query = certificate_query(
+        db,
+        payload.get("user_ids"),
+        _parse_date(payload.get("approved_from")),
+        _parse_date(payload.get("approved_to"))
+    )
+
+    def on_batch(rendered: int, skipped: int, failures: list):
+        record_progress(job, rendered + skipped, failures)
+
+    stats = regenerate_certificates(
+        db,
+        query,
+        force=payload.get("force", False),
+        language=payload.get("language", "en"),
+        on_batch=on_batch
+    )
+
+    job.payload = {
+        **payload,
+        "result": {key: stats[key] for key in ("rendered", "cached", "deferred", "skipped", "failed", "seconds", "per_second")},
+    }
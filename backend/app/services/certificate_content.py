@@ -0,0 +1,40 @@
+# app/services/certificate_content.py
+#
+# What identifies a certificate, without importing ReportLab: the API
+# process hashes and caches certificates, only PDF workers render them.
+
+import json
+import os
+from hashlib import sha256
+
+# Bump whenever the layout changes so stored certificates get re-rendered
+TEMPLATE_VERSION = "2"
+
+# Every field build_pdf reads (besides status / submitted_at / membership_id / approved_at)
+CERTIFICATE_FIELDS = (
+    "registration_id",
+    "full_name", "desired_name", "father_or_husband_name", "mother_name", "surname",
+    "date_of_birth", "gender", "marital_status", "blood_group",
+    "gothram", "aaradhya_daiva", "kula_devata",
+    "education", "occupation",
+    "current_house_number", "current_village_city", "current_mandal", "current_district",
+    "current_state", "current_country", "current_pin_code",
+    "native_house_number", "native_village_city", "native_mandal", "native_district",
+    "native_state", "native_country", "native_pin_code",
+    "email", "mobile_number", "referred_by_name", "referred_mobile", "feedback",
+)
+
+
+def content_hash(data: dict, language: str = "en") -> str:
+    """Identifies a rendered certificate: same hash, same PDF content."""
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return sha256(f"{TEMPLATE_VERSION}:{language}:{payload}".encode()).hexdigest()
+
+
+def pdf_file_path(registration_id: str) -> str:
+    return os.path.join("media", "pdfs", f"{registration_id}.pdf")
+
+
+def certificate_url(registration_id: str, language: str = "en") -> str:
+    """The on-demand certificate endpoint (PDF_STORAGE=stream)."""
+    return f"/api/v1/users/{registration_id}/certificate?language={language}"
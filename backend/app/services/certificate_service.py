@@ -0,0 +1,219 @@
+# app/services/certificate_service.py
+
+import os
+import threading
+import time
+from concurrent.futures import wait
+from datetime import date, datetime, time as day_time
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.models.user_pending import UserPending
+from app.models.user_verified import UserVerified
+from app.services.certificate_content import CERTIFICATE_FIELDS, certificate_url, content_hash, pdf_file_path
+from app.services.pdf_cache import fetch, store
+from app.services.pdf_render_service import PDF_RENDER_WORKERS, PDF_STORAGE, submit_job_render
+
+# Renders a regeneration keeps in flight on the shared PDF pool: half of
+# it by default, so registrations still get workers during a run
+CERT_REGEN_WORKERS = int(os.getenv("CERT_REGEN_WORKERS", str(max(1, PDF_RENDER_WORKERS // 2))))
+CERT_REGEN_BATCH_SIZE = int(os.getenv("CERT_REGEN_BATCH_SIZE", "200"))
+
+_CERTIFICATE_COLUMNS = [
+    UserVerified.id,
+    UserVerified.pdf_content_hash,
+    UserVerified.membership_id,
+    UserVerified.approved_at,
+    *[getattr(UserVerified, name) for name in CERTIFICATE_FIELDS],
+]
+
+
+def certificate_data(row) -> dict:
+    """Everything the approved certificate shows, taken from a users_verified row."""
+    data = {name: getattr(row, name) for name in CERTIFICATE_FIELDS}
+    data["status"] = "approved"
+    data["membership_id"] = row.membership_id
+    data["approved_at"] = row.approved_at
+    return data
+
+
+def pending_certificate_data(row) -> dict:
+    """The provisional certificate of a users_pending row."""
+    data = {name: getattr(row, name) for name in CERTIFICATE_FIELDS}
+    data["status"] = "pending"
+    data["submitted_at"] = row.created_at
+    return data
+
+
+def certificate_for_registration(db: Session, registration_id: str) -> dict | None:
+    """Certificate data for a pending or approved registration (None if neither)."""
+    verified = (
+        db.query(*_CERTIFICATE_COLUMNS)
+        .filter(UserVerified.registration_id == registration_id)
+        .first()
+    )
+    if verified:
+        return certificate_data(verified)
+
+    pending = (
+        db.query(
+            UserPending.created_at,
+            *[getattr(UserPending, name) for name in CERTIFICATE_FIELDS]
+        )
+        .filter(UserPending.registration_id == registration_id)
+        .first()
+    )
+    if pending:
+        return pending_certificate_data(pending)
+
+    return None
+
+
+def certificate_query(
+    db: Session,
+    user_ids: list | None = None,
+    approved_from: date | None = None,
+    approved_to: date | None = None
+):
+    query = db.query(*_CERTIFICATE_COLUMNS)
+
+    if user_ids:
+        query = query.filter(UserVerified.id.in_(user_ids))
+    if approved_from:
+        query = query.filter(UserVerified.approved_at >= datetime.combine(approved_from, day_time.min))
+    if approved_to:
+        query = query.filter(UserVerified.approved_at <= datetime.combine(approved_to, day_time.max))
+
+    return query
+
+
+# =========================
+# REGENERATION PIPELINE
+# =========================
+
+def _next_batch(query, after_id):
+    # Keyset batches: every batch commits, so no cursor has to survive a commit
+    if after_id is not None:
+        query = query.filter(UserVerified.id > after_id)
+    return query.order_by(UserVerified.id).limit(CERT_REGEN_BATCH_SIZE).all()
+
+
+def _store_hashes(db: Session, rendered: list):
+    if not rendered:
+        return
+
+    db.execute(
+        update(UserVerified.__table__)
+        .where(UserVerified.__table__.c.id == bindparam("user_id"))
+        .values(pdf_content_hash=bindparam("content_hash"), pdf_url=bindparam("url")),
+        rendered
+    )
+
+
+def regenerate_certificates(
+    db: Session,
+    query,
+    force: bool = False,
+    language: str = "en",
+    workers: int = CERT_REGEN_WORKERS,
+    on_batch=None
+) -> dict:
+    """
+    Re-render approved certificates for every row of certificate_query().
+
+    Rows whose content hash matches users_verified.pdf_content_hash (and
+    whose file exists) are skipped unless `force`; otherwise a PDF cache hit
+    is copied into place ("cached" in the stats). Renders run on the
+    registration PDF pool, at most `workers` at a time, one batch of
+    CERT_REGEN_BATCH_SIZE rows at a time; each batch's hashes are committed
+    before the next is read.
+
+    With PDF_STORAGE=stream nothing is written: the new hash and the
+    certificate URL are stored and the download endpoint renders the new
+    content on request ("deferred" in the stats).
+
+    on_batch(rendered, skipped, failures) is called for every batch, inside
+    the batch's transaction.
+    """
+    stats = {"rendered": 0, "cached": 0, "deferred": 0, "skipped": 0, "failed": 0, "failures": []}
+    started = time.perf_counter()
+
+    inflight = threading.BoundedSemaphore(workers)
+    after_id = None
+
+    while True:
+        rows = _next_batch(query, after_id)
+        if not rows:
+            break
+        after_id = rows[-1].id
+
+        futures = {}
+        rendered = []
+        skipped = 0
+
+        for row in rows:
+            data = certificate_data(row)
+            digest = content_hash(data, language)
+
+            if (
+                not force
+                and digest == row.pdf_content_hash
+                and (PDF_STORAGE == "stream" or os.path.exists(pdf_file_path(row.registration_id)))
+            ):
+                skipped += 1
+                continue
+
+            if PDF_STORAGE == "stream":
+                # The ETag follows the hash, so clients fetch the new PDF
+                url = certificate_url(row.registration_id, language)
+                rendered.append({"user_id": row.id, "content_hash": digest, "url": url})
+                stats["deferred"] += 1
+                continue
+
+            # Same content rendered before, e.g. the file was lost
+            url = None if force else fetch(digest, row.registration_id)
+            if url:
+                rendered.append({"user_id": row.id, "content_hash": digest, "url": url})
+                stats["cached"] += 1
+                continue
+
+            inflight.acquire()
+            try:
+                future = submit_job_render(data, language)
+            except Exception:
+                inflight.release()
+                raise
+
+            future.add_done_callback(lambda done: inflight.release())
+            futures[future] = (row.id, row.registration_id, digest)
+
+        wait(futures)
+
+        failures = []
+        for future, (user_id, registration_id, digest) in futures.items():
+            error = future.exception()
+            if error:
+                failures.append({"user_id": str(user_id), "stage": "render", "error": str(error), "attempts": 1})
+            else:
+                store(digest, registration_id)
+                rendered.append({"user_id": user_id, "content_hash": digest, "url": future.result()})
+
+        _store_hashes(db, rendered)
+
+        stats["rendered"] += len(rendered)
+        stats["skipped"] += skipped
+        stats["failed"] += len(failures)
+        stats["failures"].extend(failures)
+
+        if on_batch:
+            on_batch(len(rendered), skipped, failures)
+
+        db.commit()
+
+    elapsed = time.perf_counter() - started
+    stats["total"] = stats["rendered"] + stats["skipped"] + stats["failed"]
+    stats["seconds"] = round(elapsed, 2)
+    stats["per_second"] = round(stats["rendered"] / elapsed, 1) if elapsed else 0.0
+
+    return stats
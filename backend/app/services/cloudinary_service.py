@@ -1,17 +1,27 @@
-import cloudinary
-import cloudinary.uploader
 import os
 import uuid
 
-cloudinary.config(
-    cloud_name=os.environ["CLOUDINARY_CLOUD_NAME"],
-    api_key=os.environ["CLOUDINARY_API_KEY"],
-    api_secret=os.environ["CLOUDINARY_API_SECRET"],
-    secure=True
-)
+from app.services.registry import get_service, service
+
+
+@service("cloudinary")
+def _cloudinary_uploader():
+    # Configured on the first upload: processes that never upload
+    # start without Cloudinary credentials
+    import cloudinary
+    import cloudinary.uploader
+
+    cloudinary.config(
+        cloud_name=os.environ["CLOUDINARY_CLOUD_NAME"],
+        api_key=os.environ["CLOUDINARY_API_KEY"],
+        api_secret=os.environ["CLOUDINARY_API_SECRET"],
+        secure=True
+    )
+
+    return cloudinary.uploader
 
 def upload_image_to_cloudinary(file_bytes: bytes, content_type: str):
-    result = cloudinary.uploader.upload(
+    result = get_service("cloudinary").upload(
         file_bytes,
         folder="community_uploads",
         public_id=str(uuid.uuid4()),
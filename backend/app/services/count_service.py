@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+COUNT_STRATEGIES = ("exact", "cached", "estimate")
+
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1000"))
+
+_count_cache: dict = {}
+_count_cache_lock = threading.Lock()
+
+
+# =========================
+# EXACT (CACHED) COUNT
+# =========================
+
+def _cached_count(query, cache_key: tuple) -> int:
+    now = time.monotonic()
+
+    with _count_cache_lock:
+        entry = _count_cache.get(cache_key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    total = query.count()
+
+    with _count_cache_lock:
+        if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.clear()
+        _count_cache[cache_key] = (now + COUNT_CACHE_TTL_SECONDS, total)
+
+    return total
+
+
+# =========================
+# PLANNER ESTIMATE
+# =========================
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) <statement> as one statement, so its bound
+    parameters go through the dialect (named for psycopg2, positional
+    $n for asyncpg) like any other query.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _estimated_count(db: Session, query) -> int:
+    plan = db.execute(Explain(query.statement)).scalar()
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(db: Session, query, strategy: str = "exact", cache_key: tuple | None = None) -> int:
+    """
+    Total rows for a listing query.
+
+    exact    -> SELECT count(*) every time
+    cached   -> exact count reused for COUNT_CACHE_TTL_SECONDS per cache_key
+    estimate -> planner row estimate from EXPLAIN, no table scan
+    """
+    if strategy == "cached":
+        return _cached_count(query, cache_key)
+
+    if strategy == "estimate":
+        return _estimated_count(db, query)
+
+    return query.count()
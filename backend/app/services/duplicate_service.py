@@ -0,0 +1,65 @@
+# app/services/duplicate_service.py
+
+from sqlalchemy import String, cast, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user_pending import UserPending
+from app.models.user_rejected import UserRejected
+from app.models.user_verified import UserVerified
+
+# A rejected mobile / email may register again (as before); only these block
+BLOCKING_SOURCES = ("pending", "verified")
+
+
+def _lookup(rank: int, source: str, field: str, column, status, value: str):
+    return select(
+        literal(rank).label("rank"),
+        literal(source, String).label("source"),
+        literal(field, String).label("field"),
+        status.label("status"),
+    ).where(column == value)
+
+
+async def find_duplicate(db: AsyncSession, mobile_number: str | None = None, email: str | None = None):
+    """
+    First existing registration for mobile_number / email, in one round trip.
+
+    Returns a row with `source` (pending / verified / rejected), `field`
+    (mobile / email) and `status` (pending / hold / rejected / approved),
+    or None. Pending wins over verified, verified over rejected and mobile
+    over email, the order the endpoints report them in. Each branch is an
+    index probe (UNIQUE on pending / verified, ix_users_rejected_* on
+    rejected).
+
+    Rejections are moved to users_rejected, so a "rejected" row only comes
+    back when nothing blocks: callers let it through (BLOCKING_SOURCES).
+    """
+    # users_verified and users_rejected have no status column
+    pending_status = cast(UserPending.status, String)
+    approved = literal("approved", String)
+    rejected = literal("rejected", String)
+
+    candidates = (
+        ("pending", "mobile", UserPending.mobile_number, pending_status, mobile_number),
+        ("pending", "email", UserPending.email, pending_status, email),
+        ("verified", "mobile", UserVerified.mobile_number, approved, mobile_number),
+        ("verified", "email", UserVerified.email, approved, email),
+        ("rejected", "mobile", UserRejected.mobile_number, rejected, mobile_number),
+        ("rejected", "email", UserRejected.email, rejected, email),
+    )
+
+    branches = [
+        _lookup(rank, source, field, column, status, value)
+        for rank, (source, field, column, status, value) in enumerate(candidates)
+        if value
+    ]
+
+    if not branches:
+        return None
+
+    if len(branches) == 1:
+        statement = branches[0]
+    else:
+        statement = union_all(*branches).order_by("rank").limit(1)
+
+    return (await db.execute(statement)).first()
@@ -1,116 +1,69 @@
 # app/services/email_service.py
 
 import os
-from sib_api_v3_sdk import ApiClient, Configuration, TransactionalEmailsApi
-from sib_api_v3_sdk.models import SendSmtpEmail
-
-BREVO_API_KEY = os.getenv("BREVO_API_KEY")
-SENDER_EMAIL = os.getenv("BREVO_SENDER_EMAIL")
-SENDER_NAME = os.getenv("BREVO_SENDER_NAME")
-
-def send_otp_email(to_email: str, otp: str):
-    configuration = Configuration()
-    configuration.api_key["api-key"] = BREVO_API_KEY
-
-    api_client = ApiClient(configuration)
-    api_instance = TransactionalEmailsApi(api_client)
-
-    html_content = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; background:#f6f6f6; padding:20px;">
-        <div style="max-width:600px; margin:auto; background:#ffffff; padding:20px; border-radius:6px;">
-          <h2 style="color:#2c3e50;">Community Registration</h2>
-          <p>Hello,</p>
-          <p>Your One-Time Password (OTP) is:</p>
-          <h1 style="letter-spacing:4px; color:#27ae60;">{otp}</h1>
-          <p>This OTP is valid for <b>5 minutes</b>.</p>
-          <p style="color:#e74c3c;">Do not share this OTP with anyone.</p>
-          <br>
-          <p>Regards,<br><b>Community Admin</b></p>
-        </div>
-      </body>
-    </html>
-    """
 
-    email = SendSmtpEmail(
-        to=[{"email": to_email}],
-        sender={"email": SENDER_EMAIL, "name": SENDER_NAME},
-        subject="Your OTP for Community Registration",
-        html_content=html_content
+from markupsafe import escape
+
+from app.services.mail_sender import get_mail_sender
+from app.services.template_service import render_many, render_template
+from app.utils.language import normalize_language
+
+# params: one shared body + Brevo params, one API call per batch
+# render: every body rendered here (autoescaped), one send per recipient
+EMAIL_BATCH_MODE = os.getenv("EMAIL_BATCH_MODE", "params")
+
+SUBJECTS = {
+    "otp": {
+        "en": "Your OTP for Community Registration",
+        "te": "సంఘ నమోదు కోసం మీ OTP",
+    },
+    "approval": {
+        "en": "🎉 Membership Approved – Welcome!",
+        "te": "🎉 సభ్యత్వం ఆమోదించబడింది – స్వాగతం!",
+    },
+    "rejection": {
+        "en": "Update on Your Community Registration",
+        "te": "మీ సంఘ నమోదుపై సమాచారం",
+    },
+}
+
+def _subject(kind: str, language: str | None) -> str:
+    return SUBJECTS[kind][normalize_language(language)]
+
+
+# =========================
+# SINGLE SENDS
+# =========================
+
+def send_otp_email(to_email: str, otp: str, language: str = "en"):
+    get_mail_sender().send(
+        to_email,
+        _subject("otp", language),
+        render_template("email/otp", language, otp=otp)
     )
 
-    api_instance.send_transac_email(email)
-
 
 
 def send_approval_email(
     to_email: str,
     desired_name: str,
-    membership_id: str
+    membership_id: str,
+    language: str = "en"
 ):
     if not to_email:
         return  # safety: skip if email not available
 
-    configuration = Configuration()
-    configuration.api_key["api-key"] = BREVO_API_KEY
-
-    api_client = ApiClient(configuration)
-    api_instance = TransactionalEmailsApi(api_client)
-
-    html_content = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; background:#f6f6f6; padding:20px;">
-        <div style="max-width:600px; margin:auto; background:#ffffff; padding:20px; border-radius:6px;">
-          
-          <h2 style="color:#2c3e50;">🎉 Membership Approved</h2>
-          <p style="font-size:16px; font-weight:bold; color:#2c3e50;">
-            Welcome to <span style="color:#27ae60;">KANAGALA CHARITABLE TRUST</span>
-          </p>
-
-          <p>Dear <b>{desired_name}</b>,</p>
-
-          <p>
-            Congratulations! Your registration has been <b>successfully approved</b>.
-          </p>
-
-          <p><b>Your Membership Details:</b></p>
-          <ul>
-            <li><b>Membership ID:</b> {membership_id}</li>
-            <li><b>Name:</b> {desired_name}</li>
-          </ul>
-
-          <p>
-            You are now an official member of our community.
-          </p>
-
-          <hr>
-
-          <p>
-            📞 Support: +91-XXXXXXXXXX<br>
-            📧 Email: support@community.org
-          </p>
-
-          <p>
-            Warm regards,<br>
-            <b>Community Admin Team</b>
-          </p>
-
-        </div>
-      </body>
-    </html>
-    """
-
-    email = SendSmtpEmail(
-        to=[{"email": to_email}],
-        sender={"email": SENDER_EMAIL, "name": SENDER_NAME},
-        subject="🎉 Membership Approved – Welcome!",
-        html_content=html_content
+    get_mail_sender().send(
+        to_email,
+        _subject("approval", language),
+        render_template(
+            "email/approval",
+            language,
+            desired_name=desired_name,
+            membership_id=membership_id
+        )
     )
 
-    api_instance.send_transac_email(email)
-
-
-
 
 
 def send_rejection_email(
@@ -118,61 +71,111 @@ def send_rejection_email(
     full_name: str,
     desired_name: str | None,
     regisration_id: str,
-    reason: str
+    reason: str,
+    language: str = "en"
 ):
-    configuration = Configuration()
-    configuration.api_key["api-key"] = BREVO_API_KEY
+    display_name = desired_name or full_name
 
-    api_client = ApiClient(configuration)
-    api_instance = TransactionalEmailsApi(api_client)
+    get_mail_sender().send(
+        to_email,
+        _subject("rejection", language),
+        render_template(
+            "email/rejection",
+            language,
+            display_name=display_name,
+            registration_id=regisration_id,
+            reason=reason
+        )
+    )
 
-    display_name = desired_name or full_name
 
-    html_content = f"""
-    <html>
-      <body style="font-family: Arial, sans-serif; background:#f6f6f6; padding:20px;">
-        <div style="max-width:600px; margin:auto; background:#ffffff; padding:20px; border-radius:6px;">
-          
-          <h2 style="color:#c0392b;">Community Registration Update</h2>
-
-          <p>Your Registration ID: <b>{regisration_id}</b></p>
-          <p>Dear <b>{display_name}</b>,</p>
-
-          <p>
-            Thank you for submitting your registration request to our community.
-            After careful review, we regret to inform you that your application
-            could not be approved at this time.
-          </p>
-
-          <p><b>Reason:</b></p>
-          <blockquote style="background:#f9f9f9; padding:10px; border-left:4px solid #e74c3c;">
-            {reason}
-          </blockquote>
-
-          <p>
-            If you believe this decision was made in error, or if you wish to
-            reapply after making the necessary corrections, please feel free
-            to contact our support team.
-          </p>
-
-          <p>
-            📧 Support Email: <b>support@community.org</b><br>
-            📞 Contact: <b>+91-XXXXXXXXXX</b>
-          </p>
-
-          <br>
-          <p>Regards,<br><b>Community Administration Team</b></p>
-
-        </div>
-      </body>
-    </html>
-    """
+# =========================
+# BATCH SENDS (BULK JOBS)
+# =========================
+
+def _send_rendered(kind: str, language: str, recipients: list[dict], shared: dict):
+    # Every body rendered in one loop over the compiled template,
+    # then sent over the pooled client one by one
+    sender = get_mail_sender()
+    subject = _subject(kind, language)
+    bodies = render_many(
+        f"email/{kind}",
+        [{**recipient["params"], **shared} for recipient in recipients],
+        language
+    )
+
+    for recipient, body in zip(recipients, bodies):
+        sender.send(recipient["email"], subject, body)
+
+
+def _send_with_params(kind: str, language: str, recipients: list[dict], shared: dict):
+    # Brevo messageVersions carry params but not their own HTML, so the
+    # body is rendered once with placeholders. Brevo inserts params as-is,
+    # hence the escaping here.
+    placeholders = {name: f"{{{{ params.{name} }}}}" for name in recipients[0]["params"]}
+
+    get_mail_sender().send_batch(
+        _subject(kind, language),
+        render_template(f"email/{kind}", language, **placeholders, **shared),
+        [
+            {
+                "to": recipient["email"],
+                "params": {name: str(escape(value)) for name, value in recipient["params"].items()},
+            }
+            for recipient in recipients
+        ]
+    )
 
-    email = SendSmtpEmail(
-        to=[{"email": to_email}],
-        sender={"email": SENDER_EMAIL, "name": SENDER_NAME},
-        subject="Update on Your Community Registration",
-        html_content=html_content
+
+def _send_batch(kind: str, recipients: list[dict], shared: dict | None = None):
+    """
+    recipients: [{"email", "language", "params": {...}}]
+    Values in `shared` are the same for everyone (e.g. the reject reason).
+    """
+    by_language = {}
+    for recipient in recipients:
+        if recipient.get("email"):
+            language = normalize_language(recipient.get("language"))
+            by_language.setdefault(language, []).append(recipient)
+
+    send = _send_rendered if EMAIL_BATCH_MODE == "render" else _send_with_params
+
+    for language, group in by_language.items():
+        send(kind, language, group, shared or {})
+
+
+def send_approval_emails(recipients: list[dict]):
+    """recipients: [{"email", "desired_name", "membership_id", "language"?}]"""
+    _send_batch(
+        "approval",
+        [
+            {
+                "email": recipient.get("email"),
+                "language": recipient.get("language"),
+                "params": {
+                    "desired_name": recipient["desired_name"],
+                    "membership_id": recipient["membership_id"],
+                },
+            }
+            for recipient in recipients
+        ]
     )
 
-    api_instance.send_transac_email(email)
+
+def send_rejection_emails(recipients: list[dict], reason: str):
+    """recipients: [{"email", "full_name", "desired_name", "registration_id", "language"?}]"""
+    _send_batch(
+        "rejection",
+        [
+            {
+                "email": recipient.get("email"),
+                "language": recipient.get("language"),
+                "params": {
+                    "display_name": recipient.get("desired_name") or recipient["full_name"],
+                    "registration_id": recipient["registration_id"],
+                },
+            }
+            for recipient in recipients
+        ],
+        {"reason": reason}
+    )
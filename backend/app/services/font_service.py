@@ -0,0 +1,127 @@
+# app/services/font_service.py
+
+import logging
+import os
+import threading
+from io import BytesIO
+
+from app.utils.language import DEFAULT_LANGUAGE, normalize_language
+
+# fontTools / ReportLab are imported where they are used: the API process
+# only calls telugu_fonts_available(), the PDF workers do the rest
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "fonts")
+
+# Noto Sans Telugu (static or variable) is the expected font; the bold
+# file is optional, a variable font provides both weights.
+TELUGU_FONT_PATH = os.getenv("TELUGU_FONT_PATH", os.path.join(FONTS_DIR, "NotoSansTelugu-Regular.ttf"))
+TELUGU_BOLD_FONT_PATH = os.getenv("TELUGU_BOLD_FONT_PATH", os.path.join(FONTS_DIR, "NotoSansTelugu-Bold.ttf"))
+
+TELUGU_FONT = "NotoSansTelugu"
+TELUGU_FONT_BOLD = "NotoSansTelugu-Bold"
+
+# Glyphs a certificate can need: the Telugu block, Latin for ids / emails /
+# numbers, punctuation, dandas, ZWNJ/ZWJ and the dotted circle
+TELUGU_UNICODES = [
+    *range(0x0C00, 0x0C80),
+    *range(0x0020, 0x007F),
+    *range(0x00A0, 0x0100),
+    *range(0x2000, 0x2070),
+    0x0964, 0x0965, 0x200C, 0x200D, 0x25CC,
+]
+
+# Subsetting warns about tables it drops (e.g. FFTM); nothing actionable
+logging.getLogger("fontTools.subset").setLevel(logging.ERROR)
+
+_registered = False
+_lock = threading.Lock()
+
+
+def _subset_font(path: str, weight: int) -> BytesIO:
+    """
+    Trim the font to TELUGU_UNICODES once per process.
+
+    Keeps every OpenType layout feature (conjuncts and vowel signs are
+    GSUB/GPOS work) and drops hinting. ReportLab then embeds only the
+    glyphs each document actually uses.
+    """
+    from fontTools import subset
+    from fontTools.ttLib import TTFont as FontToolsFont
+    from fontTools.varLib import instancer
+
+    font = FontToolsFont(path)
+
+    if "fvar" in font:
+        # ReportLab cannot read variable fonts: pin a static instance
+        axes = {axis.axisTag: axis.defaultValue for axis in font["fvar"].axes}
+        if "wght" in axes:
+            axes["wght"] = weight
+        font = instancer.instantiateVariableFont(font, axes)
+
+    options = subset.Options()
+    options.layout_features = ["*"]
+    options.hinting = False
+    options.notdef_outline = True
+    options.name_IDs = ["*"]
+
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=TELUGU_UNICODES)
+    subsetter.subset(font)
+
+    buffer = BytesIO()
+    font.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def register_telugu_fonts():
+    """
+    Register the Telugu regular / bold fonts with ReportLab (once).
+
+    Raises RuntimeError when the font file is missing.
+    """
+    global _registered
+
+    if _registered:
+        return
+
+    with _lock:
+        if _registered:
+            return
+
+        if not os.path.exists(TELUGU_FONT_PATH):
+            raise RuntimeError(f"Telugu font not found at {TELUGU_FONT_PATH}; set TELUGU_FONT_PATH")
+
+        from reportlab.lib.fonts import addMapping
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        bold_path = TELUGU_BOLD_FONT_PATH if os.path.exists(TELUGU_BOLD_FONT_PATH) else TELUGU_FONT_PATH
+
+        pdfmetrics.registerFont(TTFont(TELUGU_FONT, _subset_font(TELUGU_FONT_PATH, 400)))
+        pdfmetrics.registerFont(TTFont(TELUGU_FONT_BOLD, _subset_font(bold_path, 700)))
+
+        # <b> / <i> inside Paragraphs resolve to these
+        addMapping(TELUGU_FONT, 0, 0, TELUGU_FONT)
+        addMapping(TELUGU_FONT, 1, 0, TELUGU_FONT_BOLD)
+        addMapping(TELUGU_FONT, 0, 1, TELUGU_FONT)
+        addMapping(TELUGU_FONT, 1, 1, TELUGU_FONT_BOLD)
+
+        _registered = True
+
+
+def telugu_fonts_available() -> bool:
+    return os.path.exists(TELUGU_FONT_PATH)
+
+
+def certificate_language(language: str | None) -> str:
+    """
+    normalize_language for certificates: Telugu only when its font is
+    installed, English otherwise (a te render would fail in the worker).
+    """
+    language = normalize_language(language)
+
+    if language == "te" and not telugu_fonts_available():
+        return DEFAULT_LANGUAGE
+
+    return language
@@ -0,0 +1,264 @@
+import importlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, case, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.admin_job import AdminJob
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_SECONDS = int(os.getenv("JOB_POLL_SECONDS", "5"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BACKOFF_SECONDS = int(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "30"))
+JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", "600"))
+
+STALE_JOB_ERROR = "Worker stopped before the job finished"
+
+# Modules whose @job_handler functions must be registered before work starts
+JOB_HANDLER_MODULES = (
+    "app.services.bulk_jobs",
+)
+
+_handlers = {}
+
+_executor: ThreadPoolExecutor | None = None
+_poller: threading.Thread | None = None
+_stop_event = threading.Event()
+
+_inflight = set()
+_inflight_lock = threading.Lock()
+
+
+def job_handler(job_type: str):
+    def register(fn):
+        _handlers[job_type] = fn
+        return fn
+    return register
+
+
+# =========================
+# ENQUEUE
+# =========================
+
+def enqueue_job(db: Session, job_type: str, payload: dict, created_by: str, total: int) -> AdminJob:
+    job = AdminJob(
+        job_type=job_type,
+        payload=payload,
+        total=total,
+        failures=[],
+        max_attempts=JOB_MAX_ATTEMPTS,
+        created_by=created_by
+    )
+
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    # Picked up right away when this process runs workers,
+    # otherwise by the next poll of any worker process.
+    _submit(job.id)
+
+    return job
+
+
+def _submit(job_id):
+    if _executor is None:
+        return
+
+    with _inflight_lock:
+        if job_id in _inflight:
+            return
+        _inflight.add(job_id)
+
+    _executor.submit(run_job, job_id)
+
+
+# =========================
+# PROGRESS HELPERS (FOR HANDLERS)
+# =========================
+
+def record_progress(job: AdminJob, succeeded: int, failures: list | None = None):
+    failures = failures or []
+
+    job.processed += succeeded + len(failures)
+    job.succeeded += succeeded
+    job.failed += len(failures)
+
+    if failures:
+        job.failures = [*job.failures, *failures]
+
+
+def add_failures(job: AdminJob, failures: list):
+    """Failures that happen after a user was processed (e.g. email delivery)."""
+    if failures:
+        job.failures = [*job.failures, *failures]
+
+
+# =========================
+# WORKER
+# =========================
+
+def _claim(db: Session, job_id) -> AdminJob | None:
+    claimed = db.execute(
+        update(AdminJob)
+        .where(
+            AdminJob.id == job_id,
+            AdminJob.status.in_(("queued", "retrying")),
+            AdminJob.attempts < AdminJob.max_attempts
+        )
+        .values(
+            status="running",
+            attempts=AdminJob.attempts + 1,
+            started_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            next_run_at=None
+        )
+        .returning(AdminJob.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    db.commit()
+
+    if not claimed:
+        return None
+
+    return db.get(AdminJob, job_id)
+
+
+def run_job(job_id):
+    db = SessionLocal()
+
+    try:
+        job = _claim(db, job_id)
+        if job is None:
+            return  # already taken by another worker
+
+        try:
+            handler = _handlers.get(job.job_type)
+            if handler is None:
+                raise RuntimeError(f"No handler for job type {job.job_type}")
+
+            handler(db, job)
+
+            job.status = "completed"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+
+        except Exception as e:
+            db.rollback()
+            print("JOB ERROR:", job_id, str(e))
+
+            job = db.get(AdminJob, job_id)
+            job.last_error = str(e)
+
+            if job.attempts < job.max_attempts:
+                job.status = "retrying"
+                job.next_run_at = datetime.utcnow() + timedelta(
+                    seconds=JOB_RETRY_BACKOFF_SECONDS * job.attempts
+                )
+            else:
+                job.status = "failed"
+                job.finished_at = datetime.utcnow()
+
+            db.commit()
+
+    finally:
+        db.close()
+        with _inflight_lock:
+            _inflight.discard(job_id)
+
+
+# =========================
+# POLLER (RETRIES, RESTARTS, OTHER REPLICAS)
+# =========================
+
+def _requeue_stale_jobs(db: Session):
+    now = datetime.utcnow()
+
+    # A running job whose worker stopped heartbeating (crash / redeploy)
+    stale = and_(
+        AdminJob.status == "running",
+        AdminJob.updated_at < now - timedelta(seconds=JOB_STALE_SECONDS)
+    )
+    exhausted = AdminJob.attempts >= AdminJob.max_attempts
+
+    # Out of attempts: a job that keeps killing its worker must not run forever
+    db.execute(
+        update(AdminJob)
+        .where(or_(stale, AdminJob.status.in_(("queued", "retrying"))), exhausted)
+        .values(
+            status="failed",
+            finished_at=now,
+            last_error=case((AdminJob.status == "running", STALE_JOB_ERROR), else_=AdminJob.last_error)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    db.execute(
+        update(AdminJob)
+        .where(stale, ~exhausted)
+        .values(status="retrying", next_run_at=now, last_error=STALE_JOB_ERROR)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def _submit_due_jobs(db: Session):
+    due = (
+        db.query(AdminJob.id)
+        .filter(
+            AdminJob.status.in_(("queued", "retrying")),
+            AdminJob.attempts < AdminJob.max_attempts,
+            or_(AdminJob.next_run_at.is_(None), AdminJob.next_run_at <= datetime.utcnow())
+        )
+        .order_by(AdminJob.created_at)
+        .limit(JOB_WORKERS * 2)
+        .all()
+    )
+
+    for (job_id,) in due:
+        _submit(job_id)
+
+
+def _poll_jobs():
+    while not _stop_event.wait(JOB_POLL_SECONDS):
+        db = SessionLocal()
+        try:
+            _requeue_stale_jobs(db)
+            _submit_due_jobs(db)
+        except Exception as e:
+            db.rollback()
+            print("JOB POLL ERROR:", str(e))
+        finally:
+            db.close()
+
+
+def start_job_workers():
+    global _executor, _poller
+
+    if _executor is not None:
+        return
+
+    for module in JOB_HANDLER_MODULES:
+        importlib.import_module(module)
+
+    _stop_event.clear()
+    _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="admin-job")
+    _poller = threading.Thread(target=_poll_jobs, name="admin-job-poller", daemon=True)
+    _poller.start()
+
+
+def stop_job_workers():
+    global _executor, _poller
+
+    _stop_event.set()
+
+    if _executor is not None:
+        # Running jobs are picked up again through the stale check
+        _executor.shutdown(wait=False, cancel_futures=True)
+
+    _executor = None
+    _poller = None
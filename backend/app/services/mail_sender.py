@@ -0,0 +1,130 @@
+# app/services/mail_sender.py
+
+import os
+import re
+
+from app.services.registry import get_service, service, set_service
+
+MAIL_TRANSPORT = os.getenv("MAIL_TRANSPORT", "brevo")  # brevo | fake
+
+BREVO_API_KEY = os.getenv("BREVO_API_KEY")
+SENDER_EMAIL = os.getenv("BREVO_SENDER_EMAIL")
+SENDER_NAME = os.getenv("BREVO_SENDER_NAME")
+
+BREVO_POOL_MAXSIZE = int(os.getenv("BREVO_POOL_MAXSIZE", "8"))
+BREVO_BATCH_SIZE = int(os.getenv("BREVO_BATCH_SIZE", "100"))
+
+
+# =========================
+# BREVO (POOLED)
+# =========================
+
+class BrevoMailSender:
+    """
+    One long-lived Brevo client per process.
+
+    The SDK's ApiClient keeps a urllib3 pool, so every send after the
+    first reuses an open TLS connection.
+    """
+
+    def __init__(self, sdk):
+        # `sdk` is the sib_api_v3_sdk module, imported once by the factory
+        self._sdk = sdk
+
+        configuration = sdk.Configuration()
+        configuration.api_key["api-key"] = BREVO_API_KEY
+        configuration.connection_pool_maxsize = BREVO_POOL_MAXSIZE
+
+        self._api = sdk.TransactionalEmailsApi(sdk.ApiClient(configuration))
+        self._sender = {"email": SENDER_EMAIL, "name": SENDER_NAME}
+
+    def send(self, to_email: str, subject: str, html_content: str):
+        self._api.send_transac_email(self._sdk.SendSmtpEmail(
+            to=[{"email": to_email}],
+            sender=self._sender,
+            subject=subject,
+            html_content=html_content
+        ))
+
+    def send_batch(self, subject: str, html_content: str, versions: list[dict]):
+        """
+        One API call per BREVO_BATCH_SIZE recipients via messageVersions.
+
+        `versions` items are {"to": email, "params": {...}}; the shared
+        html_content refers to them as {{ params.<name> }}.
+        """
+        sdk = self._sdk
+
+        for start in range(0, len(versions), BREVO_BATCH_SIZE):
+            chunk = versions[start:start + BREVO_BATCH_SIZE]
+
+            self._api.send_transac_email(sdk.SendSmtpEmail(
+                sender=self._sender,
+                subject=subject,
+                html_content=html_content,
+                message_versions=[
+                    sdk.SendSmtpEmailMessageVersions(
+                        to=[sdk.SendSmtpEmailTo1(email=version["to"])],
+                        params=version["params"]
+                    )
+                    for version in chunk
+                ]
+            ))
+
+
+# =========================
+# FAKE (TESTS / LOCAL DEV)
+# =========================
+
+_PARAM_PATTERN = re.compile(r"{{\s*params\.(\w+)\s*}}")
+
+
+class FakeMailSender:
+    """Keeps every message in `sent` instead of calling Brevo."""
+
+    def __init__(self):
+        self.sent = []
+        self.api_calls = 0
+
+    def send(self, to_email: str, subject: str, html_content: str):
+        self.api_calls += 1
+        self.sent.append({"to": to_email, "subject": subject, "html_content": html_content})
+
+    def send_batch(self, subject: str, html_content: str, versions: list[dict]):
+        for start in range(0, len(versions), BREVO_BATCH_SIZE):
+            self.api_calls += 1
+
+            for version in versions[start:start + BREVO_BATCH_SIZE]:
+                params = version["params"]
+                self.sent.append({
+                    "to": version["to"],
+                    "subject": subject,
+                    "html_content": _PARAM_PATTERN.sub(
+                        lambda match: str(params.get(match.group(1), "")),
+                        html_content
+                    ),
+                })
+
+
+# =========================
+# PROCESS-WIDE INSTANCE
+# =========================
+
+@service("mail_sender")
+def _build_mail_sender():
+    if MAIL_TRANSPORT == "fake":
+        return FakeMailSender()
+
+    # The SDK (hundreds of generated modules) loads with the first sender
+    import sib_api_v3_sdk
+
+    return BrevoMailSender(sib_api_v3_sdk)
+
+
+def get_mail_sender():
+    return get_service("mail_sender")
+
+
+def set_mail_sender(sender):
+    """Swap the transport (e.g. a FakeMailSender in tests)."""
+    set_service("mail_sender", sender)
@@ -1,11 +1,128 @@
+import os
+import threading
 from datetime import datetime
-from sqlalchemy.orm import Session
 
+from sqlalchemy import delete, select, text, tuple_
+from sqlalchemy.engine import Connection
+
+from app.core.database import engine
 from app.models.otp_verification import OTPVerification
 
-def cleanup_expired_otps(db: Session):
-    db.query(OTPVerification).filter(
-        OTPVerification.expires_at < datetime.utcnow()
-    ).delete(synchronize_session=False)
+OTP_SWEEP_SECONDS = int(os.getenv("OTP_SWEEP_SECONDS", "60"))
+OTP_SWEEP_BATCH = int(os.getenv("OTP_SWEEP_BATCH", "1000"))
+
+# pg_try_advisory_lock key: one sweeper across all replicas / workers
+OTP_SWEEP_LOCK_KEY = 7_120_001
+
+_sweeper: threading.Thread | None = None
+_stop_event = threading.Event()
+
+
+def delete_expired_batch(conn: Connection, model=OTPVerification, batch_size: int = OTP_SWEEP_BATCH) -> int:
+    """Delete up to batch_size expired OTPs (index range on expires_at)."""
+    key = list(model.__table__.primary_key.columns)
+
+    expired = (
+        select(*key)
+        .where(model.expires_at < datetime.utcnow())
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    # otp_verifications has an id, otp_codes a (verification_type, identifier) key
+    target = key[0] if len(key) == 1 else tuple_(*key)
+
+    result = conn.execute(delete(model).where(target.in_(expired)))
+    conn.commit()
+
+    return result.rowcount
+
+
+def cleanup_expired_otps(conn: Connection, model=OTPVerification) -> int:
+    """
+    Delete every expired OTP in short batches.
+
+    Each batch is its own transaction, so send-otp / verify-otp never wait
+    on one long table-wide DELETE.
+    """
+    deleted = 0
+
+    while not _stop_event.is_set():
+        count = delete_expired_batch(conn, model)
+        deleted += count
+        if count < OTP_SWEEP_BATCH:
+            break
+
+    return deleted
+
+
+def _try_lock(conn: Connection) -> bool:
+    if conn.dialect.name != "postgresql":
+        return True
+
+    locked = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": OTP_SWEEP_LOCK_KEY}).scalar()
+    conn.commit()
+    return bool(locked)
+
+
+def _unlock(conn: Connection):
+    if conn.dialect.name != "postgresql":
+        return
+
+    try:
+        conn.rollback()
+        conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": OTP_SWEEP_LOCK_KEY})
+        conn.commit()
+    except Exception:
+        # Never hand a connection that still holds the lock back to the pool
+        conn.invalidate()
+        raise
+
+
+def sweep_once(model=OTPVerification) -> int | None:
+    """
+    One sweep if this process gets the leader lock, else None.
+
+    The advisory lock belongs to the connection, so the whole sweep
+    (every batch commit) runs on one checked-out connection.
+    """
+    with engine.connect() as conn:
+        if not _try_lock(conn):
+            return None
+
+        try:
+            return cleanup_expired_otps(conn, model)
+        finally:
+            _unlock(conn)
+
+
+def _sweep_loop():
+    # The configured backends decide what to sweep (table or in-process dict);
+    # refilled rate-limit buckets expire the same way as OTPs
+    from app.services.otp_store import get_otp_store
+    from app.services.rate_limit_service import get_rate_limiter
+
+    while not _stop_event.wait(OTP_SWEEP_SECONDS):
+        for backend in (get_otp_store, get_rate_limiter):
+            try:
+                backend().sweep()
+            except Exception as e:
+                print("OTP SWEEP ERROR:", str(e))
+
+
+def start_otp_sweeper():
+    global _sweeper
+
+    if _sweeper is not None:
+        return
+
+    _stop_event.clear()
+    _sweeper = threading.Thread(target=_sweep_loop, name="otp-sweeper", daemon=True)
+    _sweeper.start()
+
+
+def stop_otp_sweeper():
+    global _sweeper
 
-    db.commit()
+    _stop_event.set()
+    _sweeper = None
@@ -0,0 +1,214 @@
+# app/services/otp_store.py
+
+import os
+import threading
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.otp_code import OTPCode
+from app.models.otp_verification import OTPVerification
+from app.services.otp_cleanup_service import sweep_once
+from app.services.registry import get_service, service, set_service
+
+OTP_STORE = os.getenv("OTP_STORE", "postgres")  # postgres | unlogged | memory
+
+# Every store hands out objects with .otp, .expires_at, .attempts and
+# .created_at (OTPVerification / OTPCode rows); auth.py keeps the
+# cooldown, expiry and attempt rules. mark_verified() returns whether it
+# consumed the code: of two requests verifying the same OTP, one wins. The table stores run on the
+# request's session; the memory store never touches it, so no
+# connection is checked out.
+
+
+# =========================
+# POSTGRES (otp_verifications, one row per OTP sent)
+# =========================
+
+class PostgresOTPStore:
+    async def latest(self, db: AsyncSession, verification_type: str, identifier: str):
+        return await db.scalar(
+            select(OTPVerification)
+            .where(
+                OTPVerification.identifier == identifier,
+                OTPVerification.verification_type == verification_type,
+                OTPVerification.verified == False
+            )
+            .order_by(OTPVerification.created_at.desc())
+            .limit(1)
+        )
+
+    async def save(self, db: AsyncSession, verification_type: str, identifier: str, otp: str, expires_at: datetime):
+        db.add(OTPVerification(
+            identifier=identifier,
+            verification_type=verification_type,
+            otp=otp,
+            expires_at=expires_at
+        ))
+        await db.commit()
+
+    async def add_attempt(self, db: AsyncSession, record) -> int:
+        attempts = await db.scalar(
+            update(OTPVerification)
+            .where(OTPVerification.id == record.id)
+            .values(attempts=OTPVerification.attempts + 1)
+            .returning(OTPVerification.attempts)
+        )
+        await db.commit()
+        return attempts
+
+    async def mark_verified(self, db: AsyncSession, record) -> bool:
+        result = await db.execute(
+            update(OTPVerification)
+            .where(OTPVerification.id == record.id, OTPVerification.verified.is_(False))
+            .values(verified=True)
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+    def sweep(self):
+        return sweep_once(OTPVerification)
+
+
+# =========================
+# UNLOGGED (otp_codes, one row per identifier)
+# =========================
+
+class UnloggedOTPStore:
+    """
+    Latest OTP per identifier in the UNLOGGED otp_codes table.
+
+    Every call is a primary-key lookup / upsert / delete, and no WAL is
+    written. A verified code is deleted right away.
+    """
+
+    async def latest(self, db: AsyncSession, verification_type: str, identifier: str):
+        return await db.get(OTPCode, (verification_type, identifier))
+
+    async def save(self, db: AsyncSession, verification_type: str, identifier: str, otp: str, expires_at: datetime):
+        values = {"otp": otp, "expires_at": expires_at, "attempts": 0, "created_at": datetime.utcnow()}
+
+        await db.execute(
+            insert(OTPCode)
+            .values(verification_type=verification_type, identifier=identifier, **values)
+            .on_conflict_do_update(index_elements=["verification_type", "identifier"], set_=values)
+        )
+        await db.commit()
+
+    async def add_attempt(self, db: AsyncSession, record) -> int:
+        attempts = await db.scalar(
+            update(OTPCode)
+            .where(
+                OTPCode.verification_type == record.verification_type,
+                OTPCode.identifier == record.identifier
+            )
+            .values(attempts=OTPCode.attempts + 1)
+            .returning(OTPCode.attempts)
+        )
+        await db.commit()
+        return attempts
+
+    async def mark_verified(self, db: AsyncSession, record) -> bool:
+        result = await db.execute(
+            delete(OTPCode).where(
+                OTPCode.verification_type == record.verification_type,
+                OTPCode.identifier == record.identifier,
+                # A newer code may have replaced it since it was read
+                OTPCode.created_at == record.created_at
+            )
+        )
+        await db.commit()
+        return result.rowcount > 0
+
+    def sweep(self):
+        return sweep_once(OTPCode)
+
+
+# =========================
+# MEMORY (single-process deployments only)
+# =========================
+
+class MemoryOTPStore:
+    """
+    Latest OTP per identifier in a dict, no database round trip at all.
+
+    Only for one API process: with several workers or replicas the OTP
+    may be sent by one and verified by another. Codes are lost on restart.
+    """
+
+    def __init__(self):
+        self._codes = {}
+        self._lock = threading.Lock()
+
+    async def latest(self, db: AsyncSession, verification_type: str, identifier: str):
+        return self._codes.get((verification_type, identifier))
+
+    async def save(self, db: AsyncSession, verification_type: str, identifier: str, otp: str, expires_at: datetime):
+        # Transient row object: same attributes as the table-backed stores
+        record = OTPCode(
+            verification_type=verification_type,
+            identifier=identifier,
+            otp=otp,
+            expires_at=expires_at,
+            attempts=0,
+            created_at=datetime.utcnow()
+        )
+
+        with self._lock:
+            self._codes[(verification_type, identifier)] = record
+
+    async def add_attempt(self, db: AsyncSession, record) -> int:
+        with self._lock:
+            record.attempts += 1
+            return record.attempts
+
+    async def mark_verified(self, db: AsyncSession, record) -> bool:
+        key = (record.verification_type, record.identifier)
+
+        with self._lock:
+            # A newer code may have replaced it since it was read
+            if self._codes.get(key) is not record:
+                return False
+
+            del self._codes[key]
+            return True
+
+    def sweep(self):
+        now = datetime.utcnow()
+
+        with self._lock:
+            expired = [key for key, record in self._codes.items() if record.expires_at < now]
+            for key in expired:
+                del self._codes[key]
+
+        return len(expired)
+
+
+# =========================
+# PROCESS-WIDE INSTANCE
+# =========================
+
+OTP_STORES = {
+    "postgres": PostgresOTPStore,
+    "unlogged": UnloggedOTPStore,
+    "memory": MemoryOTPStore,
+}
+
+
+@service("otp_store")
+def _build_otp_store():
+    if OTP_STORE not in OTP_STORES:
+        raise RuntimeError(f"OTP_STORE must be one of {', '.join(OTP_STORES)}")
+
+    return OTP_STORES[OTP_STORE]()
+
+
+def get_otp_store():
+    return get_service("otp_store")
+
+
+def set_otp_store(store):
+    """Swap the backend (e.g. a MemoryOTPStore in tests)."""
+    set_service("otp_store", store)
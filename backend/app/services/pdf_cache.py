@@ -0,0 +1,187 @@
+# app/services/pdf_cache.py
+
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+
+from app.services.certificate_content import TEMPLATE_VERSION, pdf_file_path
+
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join("media", "pdfs", "cache"))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_MB", "512")) * 1024 * 1024
+PDF_CACHE_EVICT_EVERY = int(os.getenv("PDF_CACHE_EVICT_EVERY", "50"))  # stores between size checks
+PDF_MEMORY_CACHE_BYTES = int(os.getenv("PDF_MEMORY_CACHE_MB", "64")) * 1024 * 1024  # 0 = off
+
+# Counters are per process (API process / CLI run)
+_stats = {
+    "hits": 0, "misses": 0, "stores": 0, "evictions": 0, "evicted_bytes": 0,
+    "memory_hits": 0, "memory_misses": 0,
+}
+_stats_lock = threading.Lock()
+_stores_since_evict = 0
+
+
+def _count(name: str, amount: int = 1):
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def cache_path(digest: str) -> str:
+    # Template version in the name: old layouts are evicted first
+    return os.path.join(PDF_CACHE_DIR, f"v{TEMPLATE_VERSION}-{digest}.pdf")
+
+
+def _copy_atomic(source: str, target: str):
+    # Readers never see a half-written PDF
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f"{target}.{uuid.uuid4().hex}.tmp"
+    shutil.copyfile(source, tmp)
+    os.replace(tmp, target)
+
+
+# =========================
+# LOOKUP / STORE
+# =========================
+
+def fetch(digest: str, registration_id: str) -> str | None:
+    """
+    On a hit, put the cached PDF at the registration's public path and
+    return its URL without running ReportLab. None on a miss.
+    """
+    cached = cache_path(digest)
+
+    try:
+        _copy_atomic(cached, pdf_file_path(registration_id))
+        os.utime(cached)  # LRU: recently used entries survive eviction
+    except FileNotFoundError:
+        _count("misses")
+        return None
+
+    _count("hits")
+    return f"/media/pdfs/{registration_id}.pdf"
+
+
+def store(digest: str, registration_id: str):
+    """Copy a freshly rendered PDF into the cache."""
+    global _stores_since_evict
+
+    try:
+        _copy_atomic(pdf_file_path(registration_id), cache_path(digest))
+    except OSError as e:
+        print("PDF CACHE STORE ERROR:", registration_id, str(e))
+        return
+
+    _count("stores")
+
+    with _stats_lock:
+        _stores_since_evict += 1
+        due = _stores_since_evict >= PDF_CACHE_EVICT_EVERY
+        if due:
+            _stores_since_evict = 0
+
+    if due:
+        evict()
+
+
+# =========================
+# IN-MEMORY (STREAMED CERTIFICATES)
+# =========================
+
+_memory = OrderedDict()
+_memory_bytes = 0
+_memory_lock = threading.Lock()
+
+
+def get_bytes(digest: str) -> bytes | None:
+    with _memory_lock:
+        pdf = _memory.get(digest)
+        if pdf is not None:
+            _memory.move_to_end(digest)
+
+    _count("memory_hits" if pdf is not None else "memory_misses")
+    return pdf
+
+
+def put_bytes(digest: str, pdf: bytes):
+    """Keep a rendered PDF in this process, least recently used out first."""
+    global _memory_bytes
+
+    if len(pdf) > PDF_MEMORY_CACHE_BYTES:
+        return
+
+    with _memory_lock:
+        if digest in _memory:
+            return
+
+        _memory[digest] = pdf
+        _memory_bytes += len(pdf)
+
+        while _memory_bytes > PDF_MEMORY_CACHE_BYTES:
+            _, evicted = _memory.popitem(last=False)
+            _memory_bytes -= len(evicted)
+
+
+# =========================
+# EVICTION
+# =========================
+
+def _entries() -> list:
+    try:
+        with os.scandir(PDF_CACHE_DIR) as it:
+            return [
+                (entry.path, entry.name, entry.stat())
+                for entry in it
+                if entry.is_file() and entry.name.endswith(".pdf")
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def evict(max_bytes: int = PDF_CACHE_MAX_BYTES) -> int:
+    """Remove old template versions, then least recently used, until under max_bytes."""
+    entries = _entries()
+    current = f"v{TEMPLATE_VERSION}-"
+
+    # Other template versions first, then oldest access first
+    entries.sort(key=lambda item: (item[1].startswith(current), item[2].st_mtime))
+
+    total = sum(stat.st_size for _, _, stat in entries)
+    removed = 0
+
+    for path, name, stat in entries:
+        if total <= max_bytes and name.startswith(current):
+            break
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+        total -= stat.st_size
+        removed += 1
+        _count("evictions")
+        _count("evicted_bytes", stat.st_size)
+
+    return removed
+
+
+def cache_stats() -> dict:
+    entries = _entries()
+
+    with _stats_lock:
+        stats = dict(_stats)
+
+    lookups = stats["hits"] + stats["misses"]
+
+    return {
+        **stats,
+        "hit_rate": round(stats["hits"] / lookups, 3) if lookups else None,
+        "entries": len(entries),
+        "size_bytes": sum(stat.st_size for _, _, stat in entries),
+        "max_bytes": PDF_CACHE_MAX_BYTES,
+        "memory_entries": len(_memory),
+        "memory_bytes": _memory_bytes,
+        "memory_max_bytes": PDF_MEMORY_CACHE_BYTES,
+        "template_version": TEMPLATE_VERSION,
+    }
@@ -0,0 +1,282 @@
+# app/services/pdf_render_service.py
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.models.user_pending import UserPending
+from app.services.certificate_content import content_hash
+from app.services.pdf_cache import fetch, store
+from app.services.registry import get_service, service
+
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+PDF_QUEUE_LIMIT = int(os.getenv("PDF_QUEUE_LIMIT", "200"))  # queued + rendering
+PDF_RETRY_AFTER_SECONDS = int(os.getenv("PDF_RETRY_AFTER_SECONDS", "10"))
+PDF_RENDER_TIMEOUT_SECONDS = int(os.getenv("PDF_RENDER_TIMEOUT_SECONDS", "30"))
+
+# disk:   render at registration into media/pdfs, served by StaticFiles
+# stream: render on request into memory, nothing written (multi-replica)
+PDF_STORAGE = os.getenv("PDF_STORAGE", "disk")
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# One slot per render that is queued, running or waiting for its status
+# update; no slot = backpressure
+_slots = threading.BoundedSemaphore(PDF_QUEUE_LIMIT)
+
+# Finished renders: (registration_id, digest, store_in_cache, status).
+# Written by one thread, never by the pool's result-collection thread.
+_results: queue.Queue = queue.Queue()
+_result_writer: threading.Thread | None = None
+_result_writer_lock = threading.Lock()
+
+
+@service("pdf_renderer")
+def _pdf_renderer():
+    # ReportLab is imported by PDF workers only, never by the API process
+    from app.services import pdf_service
+    return pdf_service
+
+
+def render_file(data: dict, language: str = "en") -> str:
+    """Worker entry point: write the certificate to media/pdfs, return its URL."""
+    return get_service("pdf_renderer").generate_attractive_pdf(data, language)
+
+
+def render_bytes(data: dict, language: str = "en") -> bytes:
+    """Worker entry point: the certificate as PDF bytes."""
+    return get_service("pdf_renderer").render_pdf_bytes(data, language)
+
+
+def warm_pdf_worker():
+    # Runs once in each worker: imports ReportLab, builds the style
+    # registry and registers / subsets the Telugu font
+    from app.services.font_service import telugu_fonts_available
+
+    renderer = get_service("pdf_renderer")
+    if telugu_fonts_available():
+        renderer.paragraph_styles("te")
+
+
+def start_pdf_workers():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=PDF_RENDER_WORKERS,
+                # spawn: never fork the API process with its threads and DB pool
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_pdf_worker
+            )
+
+    return _executor
+
+
+def stop_pdf_workers():
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+
+    if executor is not None:
+        # Let queued certificates finish so their rows don't stay "queued"
+        executor.shutdown(wait=True)
+
+    _stop_result_writer()
+
+
+# =========================
+# BACKPRESSURE
+# =========================
+
+def reserve_render_slot() -> bool:
+    """Take a queue slot before accepting work; False means the queue is full."""
+    return _slots.acquire(blocking=False)
+
+
+def release_render_slot():
+    _slots.release()
+
+
+# =========================
+# SUBMIT
+# =========================
+
+def submit_render(registration_id: str, data: dict, language: str = "en", cache: bool = False) -> Future:
+    """
+    Render a registration PDF on the process pool.
+
+    The caller must hold a slot from reserve_render_slot(); it is released
+    when the render finishes and users_pending.pdf_status is updated.
+
+    With cache=True identical input already in the PDF cache completes
+    without rendering, and a fresh render is stored. A first-time
+    registration leaves it off: its registration_id and submitted_at are
+    new, so it can never hit and would only fill the cache.
+    """
+    digest = content_hash(data, language) if cache else None
+    url = None
+
+    try:
+        if cache:
+            url = fetch(digest, registration_id)
+
+        if url:
+            future = Future()
+            future.set_result(url)
+        else:
+            future = _submit_to_pool(data, language)
+    except Exception:
+        release_render_slot()
+        raise
+
+    future.add_done_callback(lambda done: _on_render_done(registration_id, digest, cache and not url, done))
+    return future
+
+
+def submit_job_render(data: dict, language: str = "en") -> Future:
+    """
+    Render a certificate file for a batch job (certificate regeneration).
+
+    Same pool and queue slots as registrations, but waits for a free slot
+    instead of failing; the slot is released when the render finishes.
+    """
+    _slots.acquire()
+
+    try:
+        future = _submit_to_pool(data, language)
+    except Exception:
+        release_render_slot()
+        raise
+
+    future.add_done_callback(lambda done: release_render_slot())
+    return future
+
+
+def render_in_memory(data: dict, language: str = "en") -> bytes:
+    """
+    Render on the process pool and return the PDF bytes.
+
+    The caller must hold a slot from reserve_render_slot(); it is
+    released here.
+    """
+    return _submit_in_memory(data, language).result(timeout=PDF_RENDER_TIMEOUT_SECONDS)
+
+
+async def render_in_memory_async(data: dict, language: str = "en") -> bytes:
+    """render_in_memory() for async routes: awaits the worker without blocking the event loop."""
+    future = _submit_in_memory(data, language)
+    return await asyncio.wait_for(asyncio.wrap_future(future), PDF_RENDER_TIMEOUT_SECONDS)
+
+
+def _submit_in_memory(data: dict, language: str) -> Future:
+    try:
+        future = _submit_to_pool(data, language, render_bytes)
+    except Exception:
+        release_render_slot()
+        raise
+
+    future.add_done_callback(lambda done: release_render_slot())
+    return future
+
+
+def _submit_to_pool(data: dict, language: str, render=render_file) -> Future:
+    try:
+        return start_pdf_workers().submit(render, data, language)
+    except BrokenProcessPool:
+        # A worker died (OOM / kill); start a fresh pool and try once more
+        _discard_broken_pool()
+        return start_pdf_workers().submit(render, data, language)
+
+
+def _discard_broken_pool():
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _on_render_done(registration_id: str, digest: str | None, store_in_cache: bool, future: Future):
+    # Runs on the pool's management thread (or inline for a cache hit):
+    # no file copy, no DB here, or one slow commit stalls every render
+    if future.cancelled():
+        release_render_slot()
+        return  # shutdown: row stays "queued"
+
+    error = future.exception()
+    if error:
+        print("PDF RENDER ERROR:", registration_id, str(error))
+
+    _start_result_writer()
+    _results.put((registration_id, digest, store_in_cache and not error, "failed" if error else "ready"))
+
+
+# =========================
+# RESULT WRITER
+# =========================
+
+def _write_results():
+    while True:
+        item = _results.get()
+        if item is None:
+            return
+
+        registration_id, digest, store_in_cache, status = item
+        try:
+            if store_in_cache:
+                store(digest, registration_id)
+            set_pdf_status(registration_id, status)
+        except Exception as e:
+            # Keep the writer alive for the next render
+            print("PDF RESULT ERROR:", registration_id, str(e))
+        finally:
+            release_render_slot()
+
+
+def _start_result_writer():
+    global _result_writer
+
+    with _result_writer_lock:
+        if _result_writer is None:
+            _result_writer = threading.Thread(target=_write_results, name="pdf-results", daemon=True)
+            _result_writer.start()
+
+
+def _stop_result_writer():
+    global _result_writer
+
+    with _result_writer_lock:
+        writer, _result_writer = _result_writer, None
+
+    if writer is not None:
+        # Statuses already queued are written first
+        _results.put(None)
+        writer.join()
+
+
+def set_pdf_status(registration_id: str, status: str):
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(UserPending)
+            .where(UserPending.registration_id == registration_id)
+            .values(pdf_status=status)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print("PDF STATUS ERROR:", registration_id, str(e))
+    finally:
+        db.close()
@@ -5,312 +5,550 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.units import inch
 from datetime import datetime
+from io import BytesIO
+from types import MappingProxyType
 import os
+import re
+import threading
+from xml.sax.saxutils import escape
 import uuid
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
+# Kept importable from here; the definitions live in a module without ReportLab
+from app.services.certificate_content import CERTIFICATE_FIELDS, TEMPLATE_VERSION, content_hash, pdf_file_path
+
 BASE_URL = "https://family-community-registration-production.up.railway.app"
 
+LABELS = {
+    "en": {
+        "title": "KANAGALA FAMILY COMMUNITY",
+        "subtitle": "Official Registration Certificate",
+        "registration_id": "Registration ID:",
+        "membership_id": "Membership ID:",
+        "approved_on": "Approved On:",
+        "submission_date": "Submission Date:",
+        "submission_time": "Submission Time:",
+        "status": "Status:",
+        "personal": "Personal Information",
+        "full_name": "Full Name:",
+        "desired_name": "Desired Name:",
+        "father_or_husband_name": "Father/Husband Name:",
+        "mother_name": "Mother Name:",
+        "surname": "Mother’s Maiden Name:",
+        "date_of_birth": "Date of Birth:",
+        "gender": "Gender:",
+        "marital_status": "Marital Status:",
+        "blood_group": "Blood Group:",
+        "gothram": "Gothram:",
+        "aaradhya_daiva": "Aaradhya Daiva:",
+        "kula_devata": "Kula Devata:",
+        "education_occupation": "Education & Occupation",
+        "education": "Education:",
+        "occupation": "Occupation:",
+        "current_address": "Current Address Details",
+        "native_address": "Native Address Details",
+        "house_number": "House Number:",
+        "village_city": "Village/City:",
+        "mandal": "Mandal:",
+        "district": "District:",
+        "state": "State:",
+        "country": "Country:",
+        "pin_code": "PIN Code:",
+        "contact": "Contact Information",
+        "email": "Email:",
+        "mobile_number": "Mobile Number:",
+        "referred_by_name": "Referred By:",
+        "referred_mobile": "Referrer Mobile:",
+        "feedback": "Member Feedback",
+    },
+    "te": {
+        "title": "కనగాల కుటుంబ సంఘం",
+        "subtitle": "అధికారిక నమోదు ధృవీకరణ పత్రం",
+        "registration_id": "నమోదు సంఖ్య:",
+        "membership_id": "సభ్యత్వ సంఖ్య:",
+        "approved_on": "ఆమోదించిన తేదీ:",
+        "submission_date": "సమర్పించిన తేదీ:",
+        "submission_time": "సమర్పించిన సమయం:",
+        "status": "స్థితి:",
+        "personal": "వ్యక్తిగత సమాచారం",
+        "full_name": "పూర్తి పేరు:",
+        "desired_name": "కోరుకున్న పేరు:",
+        "father_or_husband_name": "తండ్రి/భర్త పేరు:",
+        "mother_name": "తల్లి పేరు:",
+        "surname": "తల్లి ఇంటి పేరు:",
+        "date_of_birth": "పుట్టిన తేదీ:",
+        "gender": "లింగం:",
+        "marital_status": "వైవాహిక స్థితి:",
+        "blood_group": "రక్త వర్గం:",
+        "gothram": "గోత్రం:",
+        "aaradhya_daiva": "ఆరాధ్య దైవం:",
+        "kula_devata": "కుల దేవత:",
+        "education_occupation": "విద్య & వృత్తి",
+        "education": "విద్య:",
+        "occupation": "వృత్తి:",
+        "current_address": "ప్రస్తుత చిరునామా వివరాలు",
+        "native_address": "స్వస్థలం చిరునామా వివరాలు",
+        "house_number": "ఇంటి నంబర్:",
+        "village_city": "గ్రామం/నగరం:",
+        "mandal": "మండలం:",
+        "district": "జిల్లా:",
+        "state": "రాష్ట్రం:",
+        "country": "దేశం:",
+        "pin_code": "పిన్ కోడ్:",
+        "contact": "సంప్రదింపు సమాచారం",
+        "email": "ఇమెయిల్:",
+        "mobile_number": "మొబైల్ నంబర్:",
+        "referred_by_name": "సిఫార్సు చేసినవారు:",
+        "referred_mobile": "సిఫార్సుదారు మొబైల్:",
+        "feedback": "సభ్యుని అభిప్రాయం",
+    },
+}
+
+DATE_FORMATS = {
+    "en": ('%d %B, %Y', '%I:%M %p'),
+    "te": ('%d-%m-%Y', '%I:%M %p'),
+}
+
+STATUS_LABELS = {
+    "en": {
+        "pending": "<b><font color='green'>PENDING APPROVAL</font></b>",
+        "approved": "<b><font color='green'>APPROVED</font></b>",
+    },
+    "te": {
+        "pending": "<b><font color='green'>ఆమోదం కోసం వేచి ఉంది</font></b>",
+        "approved": "<b><font color='green'>ఆమోదించబడింది</font></b>",
+    },
+}
+
+FOOTER_NOTES = {
+    "en": {
+        "pending": """
+    <b>IMPORTANT NOTES:</b><br/>
+    1. This is a provisional registration certificate.<br/>
+    2. Your registration will be verified by the community committee.<br/>
+    3. Keep this certificate for future reference.<br/>
+    4. Contact community office for any updates or changes.<br/>
+    5. Registration ID must be quoted in all communications.<br/><br/>
+    <i>© 2025 Kanagala Charitable Trust. All rights reserved.</i>
+    """,
+        "approved": """
+    <b>IMPORTANT NOTES:</b><br/>
+    1. This certificate confirms your membership of the community.<br/>
+    2. Keep this certificate for future reference.<br/>
+    3. Contact community office for any updates or changes.<br/>
+    4. Membership ID must be quoted in all communications.<br/><br/>
+    <i>© 2025 Kanagala Charitable Trust. All rights reserved.</i>
+    """,
+    },
+    "te": {
+        "pending": """
+    <b>ముఖ్య గమనికలు:</b><br/>
+    1. ఇది తాత్కాలిక నమోదు ధృవీకరణ పత్రం.<br/>
+    2. మీ నమోదును సంఘ కమిటీ పరిశీలిస్తుంది.<br/>
+    3. భవిష్యత్ అవసరాల కోసం ఈ పత్రాన్ని భద్రపరచుకోండి.<br/>
+    4. ఏవైనా మార్పుల కోసం సంఘ కార్యాలయాన్ని సంప్రదించండి.<br/>
+    5. అన్ని సంప్రదింపులలో నమోదు సంఖ్యను తప్పనిసరిగా పేర్కొనండి.<br/><br/>
+    <i>© 2025 కనగాల ఛారిటబుల్ ట్రస్ట్. సర్వ హక్కులు ప్రత్యేకించబడ్డాయి.</i>
+    """,
+        "approved": """
+    <b>ముఖ్య గమనికలు:</b><br/>
+    1. ఈ పత్రం సంఘంలో మీ సభ్యత్వాన్ని ధృవీకరిస్తుంది.<br/>
+    2. భవిష్యత్ అవసరాల కోసం ఈ పత్రాన్ని భద్రపరచుకోండి.<br/>
+    3. ఏవైనా మార్పుల కోసం సంఘ కార్యాలయాన్ని సంప్రదించండి.<br/>
+    4. అన్ని సంప్రదింపులలో సభ్యత్వ సంఖ్యను తప్పనిసరిగా పేర్కొనండి.<br/><br/>
+    <i>© 2025 కనగాల ఛారిటబుల్ ట్రస్ట్. సర్వ హక్కులు ప్రత్యేకించబడ్డాయి.</i>
+    """,
+    },
+}
+
+_TELUGU_TEXT = re.compile("[\u0C00-\u0C7F]")
+
+
+# =========================
+# STYLE REGISTRY (BUILT ONCE PER PROCESS)
+# =========================
+
+def _build_paragraph_styles() -> MappingProxyType:
+    sample = getSampleStyleSheet()
+
+    styles = {
+        "Normal": sample["Normal"],
+        "TitleStyle": ParagraphStyle(
+            name='TitleStyle',
+            parent=sample['Title'],
+            fontSize=24,
+            textColor=colors.HexColor('#1e3a8a'),
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        "SubtitleStyle": ParagraphStyle(
+            name='SubtitleStyle',
+            parent=sample['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#059669'),
+            spaceAfter=20,
+            alignment=TA_CENTER
+        ),
+        "SectionHeader": ParagraphStyle(
+            name='SectionHeader',
+            parent=sample['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#1e40af'),
+            spaceAfter=12,
+            spaceBefore=20,
+            borderPadding=10,
+            borderColor=colors.HexColor('#3b82f6'),
+            borderWidth=1
+        ),
+        "FieldLabel": ParagraphStyle(
+            name='FieldLabel',
+            parent=sample['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#4b5563'),
+            spaceAfter=2
+        ),
+        "FieldValue": ParagraphStyle(
+            name='FieldValue',
+            parent=sample['Normal'],
+            fontSize=11,
+            textColor=colors.HexColor('#1f2937'),
+            spaceAfter=10,
+            leftIndent=20
+        ),
+        "FeedbackStyle": ParagraphStyle(
+            name='FeedbackStyle',
+            parent=sample['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#4b5563'),
+            backColor=colors.HexColor('#f8fafc'),
+            borderColor=colors.HexColor('#cbd5e1'),
+            borderWidth=1,
+            borderPadding=10,
+            leftIndent=20,
+            rightIndent=20,
+            spaceAfter=20
+        ),
+        "FooterStyle": ParagraphStyle(
+            name='FooterStyle',
+            parent=sample['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#6b7280'),
+            alignment=TA_CENTER,
+            spaceBefore=20
+        ),
+    }
+
+    return MappingProxyType(styles)
+
+
+def _section_table_style(
+    label_bg: str,
+    value_bg: str,
+    grid: str,
+    box: str,
+    font_size: int = 10,
+    padding: int = 8,
+    box_width: int = 1,
+    label_align: str = 'LEFT',
+    value_font: str | None = None,
+    middle: bool = False
+) -> TableStyle:
+    # Two-column label / value table, the layout every section shares
+    commands = [
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor(label_bg)),
+        ('BACKGROUND', (1, 0), (1, -1), colors.HexColor(value_bg)),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (0, -1), label_align),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ]
+
+    if value_font:
+        commands.append(('FONTNAME', (1, 0), (1, -1), value_font))
+
+    commands += [
+        ('FONTSIZE', (0, 0), (-1, -1), font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ('TOPPADDING', (0, 0), (-1, -1), padding),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(grid)),
+        ('BOX', (0, 0), (-1, -1), box_width, colors.HexColor(box)),
+    ]
+
+    if middle:
+        commands.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
+
+    return TableStyle(commands)
+
+
+def _build_table_styles() -> MappingProxyType:
+    address = _section_table_style('#dcfce7', '#f0fdf4', '#86efac', '#22c55e')
+
+    return MappingProxyType({
+        "registration": _section_table_style(
+            '#dbeafe', '#f0f9ff', '#93c5fd', '#1e3a8a',
+            padding=6, box_width=2, label_align='RIGHT', value_font='Helvetica', middle=True
+        ),
+        "personal": _section_table_style(
+            '#f3f4f6', '#ffffff', '#e5e7eb', '#9ca3af',
+            value_font='Helvetica', middle=True
+        ),
+        "education": _section_table_style(
+            '#fef3c7', '#fffbeb', '#fbbf24', '#f59e0b',
+            font_size=11, padding=10
+        ),
+        "current_address": address,
+        "native_address": address,
+        "contact": _section_table_style('#fae8ff', '#fdf4ff', '#e879f9', '#c026d3'),
+    })
+
+
+# Read-only: shared by every render in this process
+PARAGRAPH_STYLES = _build_paragraph_styles()
+TABLE_STYLES = _build_table_styles()
+
+# Telugu needs the font registered first, so it is built on first use
+_telugu_styles: MappingProxyType | None = None
+_telugu_styles_lock = threading.Lock()
+
+
+def _build_telugu_styles() -> MappingProxyType:
+    from app.services.font_service import TELUGU_FONT, TELUGU_FONT_BOLD, register_telugu_fonts
+
+    register_telugu_fonts()
+
+    # Same look as English, Telugu font, shaped with HarfBuzz
+    bold = {"TitleStyle", "SubtitleStyle", "SectionHeader"}
+    styles = {
+        name: ParagraphStyle(
+            name=f"{name}-te",
+            parent=style,
+            fontName=TELUGU_FONT_BOLD if name in bold else TELUGU_FONT,
+            shaping=1
+        )
+        for name, style in PARAGRAPH_STYLES.items()
+    }
+
+    # Table cells: labels bold, values as typed
+    styles["CellLabel"] = ParagraphStyle(
+        name="CellLabel-te",
+        parent=PARAGRAPH_STYLES["Normal"],
+        fontName=TELUGU_FONT_BOLD,
+        fontSize=10,
+        leading=13,
+        shaping=1
+    )
+    styles["CellValue"] = ParagraphStyle(
+        name="CellValue-te",
+        parent=PARAGRAPH_STYLES["Normal"],
+        fontName=TELUGU_FONT,
+        fontSize=10,
+        leading=13,
+        shaping=1
+    )
+
+    return MappingProxyType(styles)
+
+
+def paragraph_styles(language: str = "en") -> MappingProxyType:
+    global _telugu_styles
+
+    if language != "te":
+        return PARAGRAPH_STYLES
+
+    if _telugu_styles is None:
+        with _telugu_styles_lock:
+            if _telugu_styles is None:
+                _telugu_styles = _build_telugu_styles()
+
+    return _telugu_styles
+
+
+# =========================
+# RENDERING
+# =========================
+
 def generate_attractive_pdf(data: dict, language: str = "en") -> str:
     #file_name = f"{uuid.uuid4()}.pdf"
     registration_id = data["registration_id"]
     file_name = f"{registration_id}.pdf"
-    output_dir = os.path.join("media", "pdfs")
-    os.makedirs(output_dir, exist_ok=True)
-    file_path = os.path.join(output_dir, file_name)
+    file_path = pdf_file_path(registration_id)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    build_pdf(data, file_path, language)
+
+    # Return public URL
+    return f"/media/pdfs/{file_name}"
+
+
+def render_pdf_bytes(data: dict, language: str = "en") -> bytes:
+    """Render into memory (nothing touches the disk)."""
+    buffer = BytesIO()
+    build_pdf(data, buffer, language)
+    return buffer.getvalue()
+
 
-    # Create document
-    doc = SimpleDocTemplate(file_path, pagesize=A4,
+def build_pdf(data: dict, output, language: str = "en"):
+    """Render the registration PDF into `output` (a file path or a binary file object)."""
+    language = language if language in LABELS else "en"
+    text = LABELS[language]
+    styles = paragraph_styles(language)
+    telugu = language == "te"
+    date_format, time_format = DATE_FORMATS[language]
+
+    def label(key):
+        # Helvetica has no Telugu glyphs: Telugu labels go in shaped Paragraphs
+        return Paragraph(text[key], styles['CellLabel']) if telugu else text[key]
+
+    def value(key, default="N/A"):
+        item = data.get(key, default)
+        if telugu and isinstance(item, str) and _TELUGU_TEXT.search(item):
+            return Paragraph(escape(item), styles['CellValue'])
+        return item
+
+    doc = SimpleDocTemplate(output, pagesize=A4,
                             rightMargin=72, leftMargin=72,
                             topMargin=72, bottomMargin=72)
-    
+
     # Container for the 'Flowable' objects
     elements = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    styles.add(ParagraphStyle(
-        name='TitleStyle',
-        parent=styles['Title'],
-        fontSize=24,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SubtitleStyle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#059669'),
-        spaceAfter=20,
-        alignment=TA_CENTER
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#1e40af'),
-        spaceAfter=12,
-        spaceBefore=20,
-        borderPadding=10,
-        borderColor=colors.HexColor('#3b82f6'),
-        borderWidth=1
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='FieldLabel',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#4b5563'),
-        spaceAfter=2
-    ))
-    
-    styles.add(ParagraphStyle(
-        name='FieldValue',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor('#1f2937'),
-        spaceAfter=10,
-        leftIndent=20
-    ))
-    
+
     # Title and Header
-    elements.append(Paragraph("KANAGALA FAMILY COMMUNITY", styles['TitleStyle']))
-    elements.append(Paragraph("Official Registration Certificate", styles['SubtitleStyle']))
+    elements.append(Paragraph(text["title"], styles['TitleStyle']))
+    elements.append(Paragraph(text["subtitle"], styles['SubtitleStyle']))
     
     # Add decorative line
     elements.append(Spacer(1, 20))
     
     # Registration Info Box - FIX FOR STATUS LINE
-    reg_info = [
-        ["Registration ID:", data.get("registration_id", "N/A")],
-        ["Submission Date:", datetime.now().strftime('%d %B, %Y')],
-        ["Submission Time:", datetime.now().strftime('%I:%M %p')],
-        ["Status:", Paragraph("<b><font color='green'>PENDING APPROVAL</font></b>", styles['Normal'])]
-    ]
+    status = data.get("status") or "pending"
+
+    if status == "approved":
+        approved_at = data.get("approved_at") or datetime.now()
+        reg_info = [
+            [label("registration_id"), value("registration_id")],
+            [label("membership_id"), value("membership_id")],
+            [label("approved_on"), approved_at.strftime(date_format)],
+        ]
+    else:
+        submitted_at = data.get("submitted_at") or datetime.now()
+        reg_info = [
+            [label("registration_id"), value("registration_id")],
+            [label("submission_date"), submitted_at.strftime(date_format)],
+            [label("submission_time"), submitted_at.strftime(time_format)],
+        ]
+
+    reg_info.append([label("status"), Paragraph(STATUS_LABELS[language][status], styles['Normal'])])
     
     reg_table = Table(reg_info, colWidths=[2*inch, 3*inch])
-    reg_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#dbeafe')),
-        ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#f0f9ff')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#93c5fd')),
-        ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#1e3a8a')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    reg_table.setStyle(TABLE_STYLES['registration'])
     
     elements.append(reg_table)
     elements.append(Spacer(1, 30))
     
     # Personal Information Section - FIX FOR SURNAME AND BLOOD GROUP
-    elements.append(Paragraph("Personal Information", styles['SectionHeader']))
+    elements.append(Paragraph(text["personal"], styles['SectionHeader']))
     
     personal_data = [
-        ["Full Name:", data.get("full_name", "N/A")],
-        ["Desired Name:", data.get("desired_name", "N/A")],
-        ["Father/Husband Name:", data.get("father_or_husband_name", "N/A")],
-        ["Mother Name:", data.get("mother_name", "N/A")],
-        ["Mother’s Maiden Name:", Paragraph(f"<b>{data.get('surname', 'N/A')}</b>", styles['Normal'])],
-        ["Date of Birth:", data.get("date_of_birth", "N/A")],
-        ["Gender:", data.get("gender", "N/A")],
-        ["Marital Status:", data.get("marital_status", "N/A")],
-        ["Blood Group:", Paragraph(f"<font color='red'><b>{data.get('blood_group', 'N/A')}</b></font>", styles['Normal'])],
-        ["Gothram:", data.get("gothram", "N/A")],
-        ["Aaradhya Daiva:", data.get("aaradhya_daiva", "N/A")],
-        ["Kula Devata:", data.get("kula_devata", "N/A")],
+        [label("full_name"), value("full_name")],
+        [label("desired_name"), value("desired_name")],
+        [label("father_or_husband_name"), value("father_or_husband_name")],
+        [label("mother_name"), value("mother_name")],
+        [label("surname"), Paragraph(f"<b>{data.get('surname', 'N/A')}</b>", styles['Normal'])],
+        [label("date_of_birth"), value("date_of_birth")],
+        [label("gender"), value("gender")],
+        [label("marital_status"), value("marital_status")],
+        [label("blood_group"), Paragraph(f"<font color='red'><b>{data.get('blood_group', 'N/A')}</b></font>", styles['Normal'])],
+        [label("gothram"), value("gothram")],
+        [label("aaradhya_daiva"), value("aaradhya_daiva")],
+        [label("kula_devata"), value("kula_devata")],
     ]
     
     personal_table = Table(personal_data, colWidths=[2.5*inch, 4*inch])
-    personal_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f3f4f6')),
-        ('BACKGROUND', (1, 0), (1, -1), colors.white),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#9ca3af')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    personal_table.setStyle(TABLE_STYLES['personal'])
     
     elements.append(personal_table)
     elements.append(Spacer(1, 30))
     
     # Education & Occupation Section
-    elements.append(Paragraph("Education & Occupation", styles['SectionHeader']))
+    elements.append(Paragraph(text["education_occupation"], styles['SectionHeader']))
     
     edu_occ_data = [
-        ["Education:", data.get("education", "N/A")],
-        ["Occupation:", data.get("occupation", "N/A")],
+        [label("education"), value("education")],
+        [label("occupation"), value("occupation")],
     ]
     
     edu_occ_table = Table(edu_occ_data, colWidths=[2.5*inch, 4*inch])
-    edu_occ_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#fef3c7')),
-        ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#fffbeb')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fbbf24')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#f59e0b')),
-    ]))
+    edu_occ_table.setStyle(TABLE_STYLES['education'])
     
     elements.append(edu_occ_table)
     elements.append(Spacer(1, 30))
     
     # Address Information Section
-    elements.append(Paragraph("Current Address Details", styles['SectionHeader']))
+    elements.append(Paragraph(text["current_address"], styles['SectionHeader']))
     
     current_address_data = [
-        ["House Number:", data.get("current_house_number", "N/A")],
-        ["Village/City:", data.get("current_village_city", "N/A")],
-        ["Mandal:", data.get("current_mandal", "N/A")],
-        ["District:", data.get("current_district", "N/A")],
-        ["State:", data.get("current_state", "N/A")],
-        ["Country:", data.get("current_country", "N/A")],
-        ["PIN Code:", data.get("current_pin_code", "N/A")],
+        [label("house_number"), value("current_house_number")],
+        [label("village_city"), value("current_village_city")],
+        [label("mandal"), value("current_mandal")],
+        [label("district"), value("current_district")],
+        [label("state"), value("current_state")],
+        [label("country"), value("current_country")],
+        [label("pin_code"), value("current_pin_code")],
     ]
 
     native_address_data = [
-        ["House Number:", data.get("native_house_number", "N/A")],
-        ["Village/City:", data.get("native_village_city", "N/A")],
-        ["Mandal:", data.get("native_mandal", "N/A")],
-        ["District:", data.get("native_district", "N/A")],
-        ["State:", data.get("native_state", "N/A")],
-        ["Country:", data.get("native_country", "N/A")],
-        ["PIN Code:", data.get("native_pin_code", "N/A")],
+        [label("house_number"), value("native_house_number")],
+        [label("village_city"), value("native_village_city")],
+        [label("mandal"), value("native_mandal")],
+        [label("district"), value("native_district")],
+        [label("state"), value("native_state")],
+        [label("country"), value("native_country")],
+        [label("pin_code"), value("native_pin_code")],
     ]
     
     address_table = Table(current_address_data, colWidths=[2*inch, 4.5*inch])
-    address_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#dcfce7')),
-        ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#f0fdf4')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#86efac')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#22c55e')),
-    ]))
+    address_table.setStyle(TABLE_STYLES['current_address'])
     
     elements.append(address_table)
     elements.append(Spacer(1, 30))
 
     # Native Address Information Section
-    elements.append(Paragraph("Native Address Details", styles['SectionHeader']))
+    elements.append(Paragraph(text["native_address"], styles['SectionHeader']))
 
     native_address_table = Table(native_address_data, colWidths=[2*inch, 4.5*inch])
-    native_address_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#dcfce7')),
-        ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#f0fdf4')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#86efac')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#22c55e')),
-    ]))
+    native_address_table.setStyle(TABLE_STYLES['native_address'])
 
     elements.append(native_address_table)
     elements.append(Spacer(1, 30))
 
     # Contact Information Section
-    elements.append(Paragraph("Contact Information", styles['SectionHeader']))
+    elements.append(Paragraph(text["contact"], styles['SectionHeader']))
     
     contact_data = [
-        ["Email:", data.get("email", "N/A")],
-        ["Mobile Number:", data.get("mobile_number", "N/A")],
-        ["Referred By:", data.get("referred_by_name", "Not Specified")],
-        ["Referrer Mobile:", data.get("referred_mobile", "N/A")],
+        [label("email"), value("email")],
+        [label("mobile_number"), value("mobile_number")],
+        [label("referred_by_name"), value("referred_by_name", "Not Specified")],
+        [label("referred_mobile"), value("referred_mobile")],
     ]
     
     contact_table = Table(contact_data, colWidths=[2*inch, 4.5*inch])
-    contact_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#fae8ff')),
-        ('BACKGROUND', (1, 0), (1, -1), colors.HexColor('#fdf4ff')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e879f9')),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#c026d3')),
-    ]))
+    contact_table.setStyle(TABLE_STYLES['contact'])
     
     elements.append(contact_table)
     elements.append(Spacer(1, 30))
     
     # Feedback Section
     if data.get("feedback"):
-        elements.append(Paragraph("Member Feedback", styles['SectionHeader']))
-        feedback_style = ParagraphStyle(
-            name='FeedbackStyle',
-            parent=styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#4b5563'),
-            backColor=colors.HexColor('#f8fafc'),
-            borderColor=colors.HexColor('#cbd5e1'),
-            borderWidth=1,
-            borderPadding=10,
-            leftIndent=20,
-            rightIndent=20,
-            spaceAfter=20
-        )
-        elements.append(Paragraph(f"\"{data.get('feedback')}\"", feedback_style))
+        elements.append(Paragraph(text["feedback"], styles['SectionHeader']))
+        elements.append(Paragraph(f"\"{data.get('feedback')}\"", styles['FeedbackStyle']))
     
     # Footer Section with Important Notes
     elements.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        name='FooterStyle',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#6b7280'),
-        alignment=TA_CENTER,
-        spaceBefore=20
-    )
-    
-    footer_text = """
-    <b>IMPORTANT NOTES:</b><br/>
-    1. This is a provisional registration certificate.<br/>
-    2. Your registration will be verified by the community committee.<br/>
-    3. Keep this certificate for future reference.<br/>
-    4. Contact community office for any updates or changes.<br/>
-    5. Registration ID must be quoted in all communications.<br/><br/>
-    <i>© 2025 Kanagala Charitable Trust. All rights reserved.</i>
-    """
     
-    elements.append(Paragraph(footer_text, footer_style))
+    elements.append(Paragraph(FOOTER_NOTES[language][status], styles['FooterStyle']))
     
     # Build PDF
     doc.build(elements)
-    
-    # Return public URL
-    return f"/media/pdfs/{file_name}"
 
 
 # For backward compatibility
@@ -0,0 +1,202 @@
+# app/services/rate_limit_service.py
+
+import os
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rate_limit_bucket import RateLimitBucket
+from app.services.otp_cleanup_service import sweep_once
+from app.services.registry import get_service, service, set_service
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")  # memory | postgres | off
+RATE_LIMIT_MEMORY_MAX_KEYS = int(os.getenv("RATE_LIMIT_MEMORY_MAX_KEYS", "100000"))
+
+
+def _limit(name: str, default: str) -> tuple[float, float]:
+    """"<burst>/<seconds>" -> (bucket capacity, tokens refilled per second)."""
+    burst, seconds = os.getenv(name, default).split("/")
+    return float(burst), float(burst) / float(seconds)
+
+
+# rule -> scope -> (capacity, refill rate). A flood is turned away before
+# it costs an SMS / email, a DB query or a bcrypt hash.
+RATE_LIMITS = {
+    "send_otp": {
+        "ip": _limit("RATE_LIMIT_SEND_OTP_IP", "10/600"),
+        "id": _limit("RATE_LIMIT_SEND_OTP_ID", "5/3600"),
+    },
+    "verify_otp": {
+        "ip": _limit("RATE_LIMIT_VERIFY_OTP_IP", "30/600"),
+        "id": _limit("RATE_LIMIT_VERIFY_OTP_ID", "10/600"),
+    },
+    "admin_login": {
+        "ip": _limit("RATE_LIMIT_ADMIN_LOGIN_IP", "10/300"),
+        "id": _limit("RATE_LIMIT_ADMIN_LOGIN_ID", "5/300"),
+    },
+}
+
+
+# =========================
+# MEMORY (PER PROCESS)
+# =========================
+
+class MemoryRateLimiter:
+    """
+    Buckets in a dict: no I/O at all.
+
+    Each API process counts on its own, so the effective limit is the
+    configured one times the number of workers / replicas.
+    """
+
+    def __init__(self):
+        self._buckets = {}  # key -> (tokens, updated, full_at)
+        self._lock = threading.Lock()
+
+    async def take(self, db: AsyncSession, key: str, capacity: float, rate: float) -> float:
+        now = time.monotonic()
+
+        with self._lock:
+            if key not in self._buckets and len(self._buckets) >= RATE_LIMIT_MEMORY_MAX_KEYS:
+                self._sweep(now)
+
+            tokens, updated, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+                return (1 - tokens) / rate
+
+            tokens -= 1
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+            return 0.0
+
+    def _sweep(self, now: float) -> int:
+        # A bucket that has refilled completely is the same as no bucket
+        full = [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]
+        for key in full:
+            del self._buckets[key]
+        return len(full)
+
+    def sweep(self):
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+
+# =========================
+# POSTGRES (SHARED BY ALL REPLICAS)
+# =========================
+
+# Refill of the stored bucket `b` up to now (database clock, UTC)
+_REFILL = (
+    "LEAST(CAST(:capacity AS float8), b.tokens"
+    " + EXTRACT(EPOCH FROM ((now() AT TIME ZONE 'utc') - b.updated_at)) * CAST(:rate AS float8))"
+)
+
+# One round trip: take a token if there is one. `taken` is NULL when the
+# bucket is empty, `current` (snapshot before the upsert) then gives the wait.
+_TAKE_SQL = text(f"""
+    WITH current AS (
+        SELECT {_REFILL} AS tokens FROM rate_limit_buckets AS b WHERE b.key = :key
+    ), taken AS (
+        INSERT INTO rate_limit_buckets AS b (key, tokens, updated_at, expires_at)
+        VALUES (
+            :key,
+            CAST(:capacity AS float8) - 1,
+            now() AT TIME ZONE 'utc',
+            (now() AT TIME ZONE 'utc') + make_interval(secs => 1 / CAST(:rate AS float8))
+        )
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = {_REFILL} - 1,
+            updated_at = now() AT TIME ZONE 'utc',
+            expires_at = (now() AT TIME ZONE 'utc')
+                + make_interval(secs => (CAST(:capacity AS float8) - {_REFILL} + 1) / CAST(:rate AS float8))
+        WHERE {_REFILL} >= 1
+        RETURNING b.tokens
+    )
+    SELECT (SELECT tokens FROM taken) AS taken, (SELECT tokens FROM current) AS current
+""")
+
+
+class PostgresRateLimiter:
+    """
+    Buckets in the UNLOGGED rate_limit_buckets table, one row per key.
+
+    The upsert locks the row, so concurrent requests on one key across
+    replicas never spend the same token twice.
+    """
+
+    async def take(self, db: AsyncSession, key: str, capacity: float, rate: float) -> float:
+        row = (await db.execute(_TAKE_SQL, {"key": key, "capacity": capacity, "rate": rate})).one()
+        await db.commit()
+
+        if row.taken is not None:
+            return 0.0
+
+        return max(1 - row.current, 0) / rate
+
+    def sweep(self):
+        return sweep_once(RateLimitBucket)
+
+
+class NoRateLimiter:
+    async def take(self, db: AsyncSession, key: str, capacity: float, rate: float) -> float:
+        return 0.0
+
+    def sweep(self):
+        return 0
+
+
+# =========================
+# CHECK
+# =========================
+
+async def check_rate_limit(db: AsyncSession, rule: str, ip: str | None, identifier: str | None = None) -> float:
+    """
+    Take one token from the rule's per-IP and per-identifier buckets.
+
+    Returns 0 when the request may go on, else the seconds until it may.
+    """
+    limiter = get_rate_limiter()
+    limits = RATE_LIMITS[rule]
+
+    for scope, value in (("ip", ip), ("id", identifier)):
+        if not value:
+            continue
+
+        capacity, rate = limits[scope]
+        retry_after = await limiter.take(db, f"{rule}:{scope}:{value}", capacity, rate)
+        if retry_after:
+            return retry_after
+
+    return 0.0
+
+
+# =========================
+# PROCESS-WIDE INSTANCE
+# =========================
+
+RATE_LIMITERS = {
+    "memory": MemoryRateLimiter,
+    "postgres": PostgresRateLimiter,
+    "off": NoRateLimiter,
+}
+
+
+@service("rate_limiter")
+def _build_rate_limiter():
+    if RATE_LIMIT_BACKEND not in RATE_LIMITERS:
+        raise RuntimeError(f"RATE_LIMIT_BACKEND must be one of {', '.join(RATE_LIMITERS)}")
+
+    return RATE_LIMITERS[RATE_LIMIT_BACKEND]()
+
+
+def get_rate_limiter():
+    return get_service("rate_limiter")
+
+
+def set_rate_limiter(limiter):
+    """Swap the backend (e.g. a NoRateLimiter in tests)."""
+    set_service("rate_limiter", limiter)
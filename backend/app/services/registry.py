@@ -0,0 +1,50 @@
+# app/services/registry.py
+
+import threading
+
+# name -> factory; factories import their heavy dependency (ReportLab,
+# Brevo SDK, cloudinary, requests, passlib, Jinja2) only when called
+_factories = {}
+_instances = {}
+
+# Re-entrant: a factory may ask for another service
+_lock = threading.RLock()
+
+
+def service(name: str):
+    """Register the factory that builds `name` on its first get_service()."""
+    def register(factory):
+        _factories[name] = factory
+        return factory
+    return register
+
+
+def get_service(name: str):
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        if name not in _instances:
+            factory = _factories.get(name)
+            if factory is None:
+                raise RuntimeError(f"No service registered as {name}")
+            _instances[name] = factory()
+
+        return _instances[name]
+
+
+def set_service(name: str, instance):
+    """Swap a service (e.g. a fake in tests)."""
+    with _lock:
+        _instances[name] = instance
+
+
+def reset_service(name: str):
+    """Drop the built instance; the next get_service() builds a fresh one."""
+    with _lock:
+        _instances.pop(name, None)
+
+
+def loaded_services() -> list[str]:
+    return sorted(_instances)
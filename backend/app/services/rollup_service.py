@@ -0,0 +1,150 @@
+from datetime import date, timedelta
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.daily_status_count import DailyStatusCount
+
+ROLLUP_STATUSES = ("pending", "hold", "approved", "rejected")
+
+
+# =========================
+# WRITE PATH
+# =========================
+
+def record_transition(
+    db: Session,
+    from_status: str | None,
+    to_status: str | None,
+    count: int = 1,
+    day: date | None = None
+):
+    """
+    Move `count` users between statuses in today's rollup row.
+    Runs inside the caller's transaction, so it commits with the change.
+    """
+    if count <= 0:
+        return
+
+    day = day or date.today()
+
+    rows = []
+    if from_status:
+        rows.append({"day": day, "status": from_status, "entered": 0, "exited": count})
+    if to_status:
+        rows.append({"day": day, "status": to_status, "entered": count, "exited": 0})
+
+    stmt = insert(DailyStatusCount).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DailyStatusCount.day, DailyStatusCount.status],
+        set_={
+            "entered": DailyStatusCount.entered + stmt.excluded.entered,
+            "exited": DailyStatusCount.exited + stmt.excluded.exited,
+        }
+    )
+    db.execute(stmt)
+
+
+# =========================
+# READ PATH
+# =========================
+
+def get_status_summary(db: Session, today: date | None = None) -> dict:
+    """Current totals and today's activity per status in one query."""
+    today = today or date.today()
+
+    rows = (
+        db.query(
+            DailyStatusCount.status,
+            func.coalesce(func.sum(DailyStatusCount.entered - DailyStatusCount.exited), 0),
+            func.coalesce(
+                func.sum(DailyStatusCount.entered).filter(DailyStatusCount.day == today),
+                0
+            ),
+        )
+        .group_by(DailyStatusCount.status)
+        .all()
+    )
+
+    totals = {status: 0 for status in ROLLUP_STATUSES}
+    today_counts = {status: 0 for status in ROLLUP_STATUSES}
+
+    for status, total, entered_today in rows:
+        totals[status] = int(total)
+        today_counts[status] = int(entered_today)
+
+    return {"totals": totals, "today": today_counts}
+
+
+def get_daily_trend(db: Session, days: int, today: date | None = None) -> list[dict]:
+    """Per-day entries into each status for the last `days` days (oldest first)."""
+    today = today or date.today()
+    start = today - timedelta(days=days - 1)
+
+    rows = (
+        db.query(DailyStatusCount.day, DailyStatusCount.status, DailyStatusCount.entered)
+        .filter(DailyStatusCount.day >= start)
+        .all()
+    )
+
+    series = {
+        start + timedelta(days=offset): {status: 0 for status in ROLLUP_STATUSES}
+        for offset in range(days)
+    }
+    for day, status, entered in rows:
+        if day in series and status in series[day]:
+            series[day][status] = entered
+
+    return [
+        {
+            "date": day.isoformat(),
+            "registrations": counts["pending"],
+            "approvals": counts["approved"],
+            "rejections": counts["rejected"],
+            "holds": counts["hold"],
+        }
+        for day, counts in series.items()
+    ]
+
+
+# =========================
+# BACKFILL
+# =========================
+
+def rebuild_rollups(db: Session):
+    """
+    Recompute the rollup table from the member tables.
+
+    History of users that already moved on cannot be recovered, so the
+    rebuild books every user under the status they are in now, on the day
+    they entered it. Totals are exact afterwards; older trend days only
+    reflect the current snapshot.
+    """
+    db.query(DailyStatusCount).delete(synchronize_session=False)
+
+    db.execute(text("""
+        INSERT INTO daily_status_counts (day, status, entered, exited)
+        SELECT day, status, SUM(total), 0
+        FROM (
+            SELECT COALESCE(DATE(created_at), CURRENT_DATE) AS day,
+                   status::text AS status,
+                   COUNT(*) AS total
+            FROM users_pending
+            WHERE status IN ('pending', 'hold')
+            GROUP BY 1, 2
+
+            UNION ALL
+
+            SELECT COALESCE(DATE(approved_at), CURRENT_DATE), 'approved', COUNT(*)
+            FROM users_verified
+            GROUP BY 1
+
+            UNION ALL
+
+            SELECT COALESCE(DATE(rejected_at), CURRENT_DATE), 'rejected', COUNT(*)
+            FROM users_rejected
+            GROUP BY 1
+        ) snapshot
+        GROUP BY day, status
+    """))
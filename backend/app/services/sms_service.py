@@ -1,9 +1,17 @@
 import os
-import requests
+
+from app.services.registry import get_service, service
 
 MSG91_AUTH_KEY = os.getenv("MSG91_AUTH_KEY")
 MSG91_TEMPLATE_ID = os.getenv("MSG91_TEMPLATE_ID")
 
+@service("http")
+def _http():
+    # requests loads with the first SMS, not with the app
+    import requests
+    return requests
+
+
 def send_otp_sms(mobile_number: str, otp: str):
     url = "https://control.msg91.com/api/v5/flow/"
 
@@ -22,7 +30,7 @@ def send_otp_sms(mobile_number: str, otp: str):
         "authkey": MSG91_AUTH_KEY
     }
 
-    response = requests.post(url, json=payload, headers=headers, timeout=10)
+    response = get_service("http").post(url, json=payload, headers=headers, timeout=10)
 
     print("MSG91 STATUS:", response.status_code)
     print("MSG91 RESPONSE:", response.text)
@@ -0,0 +1,59 @@
+# app/services/template_service.py
+
+import os
+
+from app.services.registry import get_service, service
+from app.utils.language import SUPPORTED_LANGUAGES, normalize_language
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+# Every template exists once per language as <name>_<language>.html
+TEMPLATE_NAMES = (
+    "email/otp",
+    "email/approval",
+    "email/rejection",
+)
+
+
+@service("templates")
+def _build_environment():
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,      # templates only change on deploy
+        cache_size=-1,          # never evict a compiled template
+    )
+
+
+_compiled: dict = {}
+
+
+def warm_templates():
+    """Load and compile every template/language pair (called at startup)."""
+    for name in TEMPLATE_NAMES:
+        for language in SUPPORTED_LANGUAGES:
+            get_template(name, language)
+
+
+def get_template(name: str, language: str | None = None):
+    language = normalize_language(language)
+    key = (name, language)
+
+    template = _compiled.get(key)
+    if template is None:
+        template = get_service("templates").get_template(f"{name}_{language}.html")
+        _compiled[key] = template
+
+    return template
+
+
+def render_template(name: str, language: str | None = None, **context) -> str:
+    return get_template(name, language).render(**context)
+
+
+def render_many(name: str, contexts: list[dict], language: str | None = None) -> list[str]:
+    """Render one body per context with a single template lookup."""
+    render = get_template(name, language).render
+    return [render(context) for context in contexts]
@@ -0,0 +1,67 @@
+import ipaddress
+import os
+
+from fastapi import Request
+
+# Proxies allowed to set X-Forwarded-For: comma separated IPs / CIDRs,
+# e.g. "10.0.0.0/8,100.64.0.0/10", or "*" when the app is only reachable
+# through a single proxy (Railway, a load balancer): the peer is trusted
+# and the last X-Forwarded-For entry, the one it appended, is the client.
+# Empty = trust no one and use the TCP peer address.
+TRUSTED_PROXIES = os.getenv("TRUSTED_PROXIES", "")
+
+
+def parse_trusted_proxies(value: str) -> list | str:
+    value = value.strip()
+    if value == "*":
+        return "*"
+
+    return [ipaddress.ip_network(item.strip(), strict=False) for item in value.split(",") if item.strip()]
+
+
+_trusted = parse_trusted_proxies(TRUSTED_PROXIES)
+
+
+def _is_trusted(host: str | None, trusted) -> bool:
+    if trusted == "*":
+        return True
+
+    try:
+        address = ipaddress.ip_address(host)
+    except (TypeError, ValueError):
+        return False
+
+    return any(address in network for network in trusted)
+
+
+def client_ip(request: Request, trusted=None) -> str | None:
+    """
+    Address of the client that made the request.
+
+    X-Forwarded-For is read only when the direct peer is a trusted proxy.
+    Walking it from the right, trusted hops are skipped; the first one that
+    is not trusted is the client (anything left of it may be forged).
+    """
+    trusted = _trusted if trusted is None else trusted
+    peer = request.client.host if request.client else None
+
+    forwarded = [
+        hop.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for hop in header.split(",")
+        if hop.strip()
+    ]
+
+    if not _is_trusted(peer, trusted):
+        return peer
+
+    if trusted == "*":
+        # One trusted hop: only the entry the proxy appended is reliable
+        return forwarded[-1] if forwarded else peer
+
+    for hop in reversed(forwarded):
+        if not _is_trusted(hop, trusted):
+            return hop
+
+    # Every hop is a trusted proxy: the leftmost one is the closest we get
+    return forwarded[0] if forwarded else peer
@@ -0,0 +1,30 @@
+import csv
+import os
+from io import StringIO
+from typing import Iterable, Iterator
+
+CSV_CHUNK_ROWS = int(os.getenv("CSV_CHUNK_ROWS", "500"))
+
+
+def iter_csv(header: list, rows: Iterable, chunk_rows: int = CSV_CHUNK_ROWS) -> Iterator[str]:
+    """
+    Yield CSV text in chunks of `chunk_rows` rows.
+
+    Only one chunk is ever held in memory, so memory stays flat no matter
+    how many rows `rows` produces.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(header)
+
+    for index, row in enumerate(rows, start=1):
+        writer.writerow(row)
+
+        if index % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,11 @@
+SUPPORTED_LANGUAGES = ("en", "te")
+DEFAULT_LANGUAGE = "en"
+
+
+def normalize_language(language: str | None) -> str:
+    """Map any requested language to one we have templates for."""
+    if not language:
+        return DEFAULT_LANGUAGE
+
+    language = language.strip().lower()[:2]
+    return language if language in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
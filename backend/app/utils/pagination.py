@@ -0,0 +1,73 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from sqlalchemy import and_, or_, tuple_
+
+
+# =========================
+# CURSOR TOKENS
+# =========================
+
+def encode_cursor(sort_value: datetime | None, row_id) -> str:
+    raw = json.dumps([sort_value.isoformat() if sort_value is not None else None, str(row_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (datetime.fromisoformat(sort_value) if sort_value is not None else None), uuid.UUID(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+# =========================
+# KEYSET PAGINATION
+# =========================
+
+def keyset_paginate(query, sort_column, id_column, size: int, after: str | None = None, offset: int = 0):
+    """
+    Newest-first page of `query`.
+
+    With `after` the page starts right below the (sort_value, id) in the
+    cursor, so Postgres seeks instead of scanning skipped rows. Without it
+    the old offset mode is used. One extra row is fetched to know whether
+    a next page exists.
+
+    Rows without a sort value (legacy rows, the column is nullable) come
+    first, as in a backward scan of the (sort, id) index.
+    """
+    query = query.order_by(sort_column.desc().nulls_first(), id_column.desc())
+
+    if after:
+        sort_value, row_id = decode_cursor(after)
+
+        if sort_value is None:
+            # Still inside the NULL rows: the rest of them, then every dated row
+            query = query.filter(or_(
+                and_(sort_column.is_(None), id_column < row_id),
+                sort_column.is_not(None)
+            ))
+        else:
+            # NULL rows compare as unknown, so they are left behind here
+            query = query.filter(
+                tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+            )
+    elif offset:
+        query = query.offset(offset)
+
+    rows = query.limit(size + 1).all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            getattr(last, sort_column.key),
+            getattr(last, id_column.key)
+        )
+
+    return rows, next_cursor
@@ -0,0 +1,64 @@
+# migrations/env.py
+
+import os
+
+from alembic import context
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, pool
+
+# ✅ THIS IMPORT REGISTERS ALL MODELS (autogenerate compares against them)
+from app.models import Base
+
+load_dotenv()
+
+target_metadata = Base.metadata
+
+
+def _database_url() -> str:
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL is not set")
+    return url
+
+
+def run_migrations_offline():
+    # alembic upgrade head --sql: print the SQL instead of running it
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        compare_type=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_on(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    # Tests hand in their own connection (throwaway schema on search_path)
+    connection = context.config.attributes.get("connection")
+    if connection is not None:
+        _run_on(connection)
+        return
+
+    engine = create_engine(_database_url(), poolclass=pool.NullPool)
+
+    with engine.connect() as connection:
+        _run_on(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
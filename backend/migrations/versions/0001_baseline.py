@@ -0,0 +1,232 @@
+"""Baseline: the schema as create_all() built it before migrations
+
+Existing databases (created by create_all at startup) already have all of
+this: mark them with `alembic stamp 0001_baseline`, then `alembic upgrade head`.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Shared by several tables: created once up front, never by create_table
+VERIFICATION_TYPE_ENUM = postgresql.ENUM("mobile", "email", name="verification_type_enum", create_type=False)
+USER_STATUS_ENUM = postgresql.ENUM("pending", "hold", "rejected", name="user_status_enum", create_type=False)
+MARITAL_STATUS_ENUM = postgresql.ENUM("Married", "Unmarried", "Prefer not to say", name="marital_status_enum", create_type=False)
+ADMIN_ROLE_ENUM = postgresql.ENUM("super_admin", "verifier", "readonly", name="admin_role_enum", create_type=False)
+
+ENUMS = (VERIFICATION_TYPE_ENUM, USER_STATUS_ENUM, MARITAL_STATUS_ENUM, ADMIN_ROLE_ENUM)
+
+
+def upgrade():
+    bind = op.get_bind()
+    for enum in ENUMS:
+        enum.create(bind, checkfirst=True)
+
+    # Membership numbers (membership_service.generate_membership_id)
+    op.execute("CREATE SEQUENCE IF NOT EXISTS membership_id_seq START 1")
+
+    op.create_table('admin_audit_logs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('admin_id', sa.String(), nullable=False),
+        sa.Column('action', sa.String(), nullable=False),
+        sa.Column('target_type', sa.String(), nullable=False),
+        sa.Column('target_id', sa.UUID(), nullable=False),
+        sa.Column('reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table('admin_users',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('username', sa.String(length=100), nullable=False),
+        sa.Column('password_hash', sa.String(), nullable=False),
+        sa.Column('role', ADMIN_ROLE_ENUM, nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('username')
+    )
+
+    op.create_table('otp_verifications',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('identifier', sa.String(), nullable=False),
+        sa.Column('verification_type', sa.String(), nullable=False),
+        sa.Column('otp', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('verified', sa.Boolean(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_table('users_pending',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('registration_id', sa.String(length=20), nullable=False),
+        sa.Column('verification_type', VERIFICATION_TYPE_ENUM, nullable=False),
+        sa.Column('mobile_number', sa.String(length=10), nullable=True),
+        sa.Column('email', sa.String(length=150), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.Column('full_name', sa.String(length=150), nullable=False),
+        sa.Column('surname', sa.String(length=80), nullable=False),
+        sa.Column('desired_name', sa.String(length=150), nullable=False),
+        sa.Column('father_or_husband_name', sa.String(length=150), nullable=False),
+        sa.Column('mother_name', sa.String(length=150), nullable=False),
+        sa.Column('date_of_birth', sa.Date(), nullable=True),
+        sa.Column('gender', sa.String(length=20), nullable=True),
+        sa.Column('blood_group', sa.String(length=5), nullable=True),
+        sa.Column('marital_status', MARITAL_STATUS_ENUM, nullable=False),
+        sa.Column('gothram', sa.String(length=120), nullable=False),
+        sa.Column('aaradhya_daiva', sa.String(length=120), nullable=True),
+        sa.Column('kula_devata', sa.String(length=120), nullable=True),
+        sa.Column('education', sa.String(length=120), nullable=False),
+        sa.Column('occupation', sa.String(length=120), nullable=False),
+        sa.Column('current_house_number', sa.String(length=60), nullable=True),
+        sa.Column('current_village_city', sa.String(length=120), nullable=True),
+        sa.Column('current_mandal', sa.String(length=120), nullable=True),
+        sa.Column('current_district', sa.String(length=120), nullable=False),
+        sa.Column('current_state', sa.String(length=120), nullable=False),
+        sa.Column('current_country', sa.String(length=120), nullable=True),
+        sa.Column('current_pin_code', sa.String(length=10), nullable=False),
+        sa.Column('native_house_number', sa.String(length=60), nullable=False),
+        sa.Column('native_village_city', sa.String(length=120), nullable=True),
+        sa.Column('native_mandal', sa.String(length=120), nullable=True),
+        sa.Column('native_district', sa.String(length=120), nullable=False),
+        sa.Column('native_state', sa.String(length=120), nullable=False),
+        sa.Column('native_country', sa.String(length=120), nullable=True),
+        sa.Column('native_pin_code', sa.String(length=10), nullable=False),
+        sa.Column('photo_url', sa.Text(), nullable=False),
+        sa.Column('pdf_url', sa.Text(), nullable=False),
+        sa.Column('referred_by_name', sa.String(length=150), nullable=False),
+        sa.Column('referred_mobile', sa.String(length=10), nullable=False),
+        sa.Column('feedback', sa.Text(), nullable=True),
+        sa.Column('status', USER_STATUS_ENUM, nullable=True),
+        sa.Column('hold_reason', sa.Text(), nullable=True),
+        sa.Column('reject_reason', sa.Text(), nullable=True),
+        sa.Column('possible_duplicate', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email'),
+        sa.UniqueConstraint('mobile_number')
+    )
+
+    op.create_index(op.f('ix_users_pending_registration_id'), 'users_pending', ['registration_id'], unique=True)
+
+    op.create_table('users_rejected',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('original_pending_id', sa.UUID(), nullable=False),
+        sa.Column('registration_id', sa.String(length=20), nullable=True),
+        sa.Column('mobile_number', sa.String(length=15), nullable=True),
+        sa.Column('email', sa.String(length=255), nullable=True),
+        sa.Column('full_name', sa.String(length=150), nullable=False),
+        sa.Column('surname', sa.String(length=80), nullable=True),
+        sa.Column('desired_name', sa.String(length=150), nullable=True),
+        sa.Column('father_or_husband_name', sa.String(length=150), nullable=True),
+        sa.Column('mother_name', sa.String(length=150), nullable=True),
+        sa.Column('date_of_birth', sa.String(length=20), nullable=True),
+        sa.Column('gender', sa.String(length=20), nullable=True),
+        sa.Column('blood_group', sa.String(length=10), nullable=True),
+        sa.Column('marital_status', sa.String(length=30), nullable=True),
+        sa.Column('gothram', sa.String(length=120), nullable=True),
+        sa.Column('aaradhya_daiva', sa.String(length=120), nullable=True),
+        sa.Column('kula_devata', sa.String(length=120), nullable=True),
+        sa.Column('current_house_number', sa.String(length=60), nullable=True),
+        sa.Column('current_village_city', sa.String(length=120), nullable=True),
+        sa.Column('current_mandal', sa.String(length=120), nullable=True),
+        sa.Column('current_district', sa.String(length=120), nullable=True),
+        sa.Column('current_state', sa.String(length=120), nullable=True),
+        sa.Column('current_country', sa.String(length=120), nullable=True),
+        sa.Column('current_pin_code', sa.String(length=10), nullable=True),
+        sa.Column('native_house_number', sa.String(length=60), nullable=True),
+        sa.Column('native_village_city', sa.String(length=120), nullable=True),
+        sa.Column('native_mandal', sa.String(length=120), nullable=True),
+        sa.Column('native_district', sa.String(length=120), nullable=True),
+        sa.Column('native_state', sa.String(length=120), nullable=True),
+        sa.Column('native_country', sa.String(length=120), nullable=True),
+        sa.Column('native_pin_code', sa.String(length=10), nullable=True),
+        sa.Column('education', sa.String(length=120), nullable=True),
+        sa.Column('occupation', sa.String(length=120), nullable=True),
+        sa.Column('photo_url', sa.Text(), nullable=True),
+        sa.Column('referred_by_name', sa.String(length=120), nullable=True),
+        sa.Column('referred_mobile', sa.String(length=15), nullable=True),
+        sa.Column('reject_reason', sa.Text(), nullable=False),
+        sa.Column('rejected_by_admin_id', sa.UUID(), nullable=True),
+        sa.Column('rejected_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('registration_id')
+    )
+
+    op.create_index(op.f('ix_users_rejected_email'), 'users_rejected', ['email'], unique=False)
+
+    op.create_index(op.f('ix_users_rejected_mobile_number'), 'users_rejected', ['mobile_number'], unique=False)
+
+    op.create_table('users_verified',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('membership_id', sa.String(length=30), nullable=False),
+        sa.Column('registration_id', sa.String(length=20), nullable=False),
+        sa.Column('verification_type', VERIFICATION_TYPE_ENUM, nullable=False),
+        sa.Column('mobile_number', sa.String(length=10), nullable=True),
+        sa.Column('email', sa.String(length=150), nullable=True),
+        sa.Column('full_name', sa.String(length=150), nullable=False),
+        sa.Column('surname', sa.String(length=80), nullable=False),
+        sa.Column('desired_name', sa.String(length=150), nullable=False),
+        sa.Column('father_or_husband_name', sa.String(length=150), nullable=False),
+        sa.Column('mother_name', sa.String(length=150), nullable=False),
+        sa.Column('date_of_birth', sa.Date(), nullable=True),
+        sa.Column('gender', sa.String(length=20), nullable=True),
+        sa.Column('blood_group', sa.String(length=5), nullable=True),
+        sa.Column('gothram', sa.String(length=120), nullable=False),
+        sa.Column('aaradhya_daiva', sa.String(length=120), nullable=True),
+        sa.Column('kula_devata', sa.String(length=120), nullable=True),
+        sa.Column('education', sa.String(length=120), nullable=False),
+        sa.Column('occupation', sa.String(length=120), nullable=False),
+        sa.Column('marital_status', MARITAL_STATUS_ENUM, nullable=False),
+        sa.Column('current_house_number', sa.String(length=60), nullable=True),
+        sa.Column('current_village_city', sa.String(length=120), nullable=True),
+        sa.Column('current_mandal', sa.String(length=120), nullable=True),
+        sa.Column('current_district', sa.String(length=120), nullable=False),
+        sa.Column('current_state', sa.String(length=120), nullable=False),
+        sa.Column('current_country', sa.String(length=120), nullable=True),
+        sa.Column('current_pin_code', sa.String(length=10), nullable=False),
+        sa.Column('native_house_number', sa.String(length=60), nullable=False),
+        sa.Column('native_village_city', sa.String(length=120), nullable=True),
+        sa.Column('native_mandal', sa.String(length=120), nullable=True),
+        sa.Column('native_district', sa.String(length=120), nullable=False),
+        sa.Column('native_state', sa.String(length=120), nullable=False),
+        sa.Column('native_country', sa.String(length=120), nullable=True),
+        sa.Column('native_pin_code', sa.String(length=10), nullable=False),
+        sa.Column('photo_url', sa.Text(), nullable=False),
+        sa.Column('pdf_url', sa.Text(), nullable=False),
+        sa.Column('referred_by_name', sa.String(length=150), nullable=False),
+        sa.Column('referred_mobile', sa.String(length=10), nullable=False),
+        sa.Column('feedback', sa.Text(), nullable=True),
+        sa.Column('approved_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('approved_by', sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email'),
+        sa.UniqueConstraint('membership_id'),
+        sa.UniqueConstraint('mobile_number')
+    )
+
+    op.create_index(op.f('ix_users_verified_registration_id'), 'users_verified', ['registration_id'], unique=True)
+
+
+def downgrade():
+    op.drop_table("users_verified")
+    op.drop_table("users_rejected")
+    op.drop_table("users_pending")
+    op.drop_table("otp_verifications")
+    op.drop_table("admin_users")
+    op.drop_table("admin_audit_logs")
+    op.execute("DROP SEQUENCE IF EXISTS membership_id_seq")
+
+    bind = op.get_bind()
+    for enum in ENUMS:
+        enum.drop(bind, checkfirst=True)
@@ -0,0 +1,96 @@
+"""Status rollups, admin jobs and certificate columns
+
+Written to be safe on databases where create_all() or the add_pdf_*
+scripts already created some of this.
+
+Revision ID: 0002_backlog_additions
+Revises: 0001_baseline
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0002_backlog_additions"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain SQL with IF NOT EXISTS: also works for `alembic upgrade --sql`
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS daily_status_counts (
+            day DATE NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            entered INTEGER NOT NULL,
+            exited INTEGER NOT NULL,
+            PRIMARY KEY (day, status)
+        )
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS admin_jobs (
+            id UUID NOT NULL,
+            job_type VARCHAR(50) NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            payload JSONB NOT NULL,
+            total INTEGER NOT NULL,
+            processed INTEGER NOT NULL,
+            succeeded INTEGER NOT NULL,
+            failed INTEGER NOT NULL,
+            failures JSONB NOT NULL,
+            attempts INTEGER NOT NULL,
+            max_attempts INTEGER NOT NULL,
+            last_error TEXT,
+            next_run_at TIMESTAMP WITHOUT TIME ZONE,
+            created_by VARCHAR NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE,
+            started_at TIMESTAMP WITHOUT TIME ZONE,
+            updated_at TIMESTAMP WITHOUT TIME ZONE,
+            finished_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id)
+        )
+    """)
+
+    # Rows that exist already had their PDF rendered in-process, so they start as "ready"
+    op.execute("ALTER TABLE users_pending ADD COLUMN IF NOT EXISTS pdf_status VARCHAR(20) NOT NULL DEFAULT 'ready'")
+    op.execute("ALTER TABLE users_pending ALTER COLUMN pdf_status SET DEFAULT 'queued'")
+
+    op.execute("ALTER TABLE users_verified ADD COLUMN IF NOT EXISTS pdf_content_hash VARCHAR(64)")
+
+    # Seed the rollups from the member tables, or the dashboard (which only
+    # reads daily_status_counts) shows zeros until rebuild_rollups.py runs.
+    # Same snapshot as rollup_service.rebuild_rollups(); skipped when the
+    # table already has rows.
+    op.execute("""
+        INSERT INTO daily_status_counts (day, status, entered, exited)
+        SELECT day, status, SUM(total), 0
+        FROM (
+            SELECT COALESCE(DATE(created_at), CURRENT_DATE) AS day,
+                   status::text AS status,
+                   COUNT(*) AS total
+            FROM users_pending
+            WHERE status IN ('pending', 'hold')
+            GROUP BY 1, 2
+
+            UNION ALL
+
+            SELECT COALESCE(DATE(approved_at), CURRENT_DATE), 'approved', COUNT(*)
+            FROM users_verified
+            GROUP BY 1
+
+            UNION ALL
+
+            SELECT COALESCE(DATE(rejected_at), CURRENT_DATE), 'rejected', COUNT(*)
+            FROM users_rejected
+            GROUP BY 1
+        ) snapshot
+        WHERE NOT EXISTS (SELECT 1 FROM daily_status_counts)
+        GROUP BY day, status
+    """)
+
+
+def downgrade():
+    op.drop_column("users_verified", "pdf_content_hash")
+    op.drop_column("users_pending", "pdf_status")
+    op.drop_table("admin_jobs")
+    op.drop_table("daily_status_counts")
@@ -0,0 +1,49 @@
+"""Indexes for the admin filters and list ordering
+
+Trigram GIN for the ilike('%...%') filters (gothram, desired_name),
+btree for surname, state/district/mandal and the keyset list order.
+The duplicate checks on mobile_number / email are already served by
+the UNIQUE constraints of users_pending and users_verified.
+
+Built CONCURRENTLY so registrations keep writing while they build.
+
+Revision ID: 0003_admin_filter_indexes
+Revises: 0002_backlog_additions
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003_admin_filter_indexes"
+down_revision = "0002_backlog_additions"
+branch_labels = None
+depends_on = None
+
+
+# name -> (table, USING + column list); kept in sync with the models' __table_args__
+INDEXES = {
+    "ix_users_pending_status_created_at": ("users_pending", "(status, created_at, id)"),
+    "ix_users_pending_location": ("users_pending", "(current_state, current_district, current_mandal)"),
+    "ix_users_pending_surname": ("users_pending", "(surname)"),
+    "ix_users_pending_gothram_trgm": ("users_pending", "USING gin (gothram gin_trgm_ops)"),
+    "ix_users_pending_desired_name_trgm": ("users_pending", "USING gin (desired_name gin_trgm_ops)"),
+
+    "ix_users_verified_approved_at": ("users_verified", "(approved_at, id)"),
+    "ix_users_verified_location": ("users_verified", "(current_state, current_district, current_mandal)"),
+    "ix_users_verified_surname": ("users_verified", "(surname)"),
+    "ix_users_verified_gothram_trgm": ("users_verified", "USING gin (gothram gin_trgm_ops)"),
+}
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, (table, definition) in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,35 @@
+"""OTP lookup and expiry indexes
+
+The send-otp / verify-otp lookup (latest unverified OTP of an
+identifier) gets a partial index; the expired-OTP sweeper deletes by
+an expires_at range instead of scanning the table.
+
+Revision ID: 0004_otp_indexes
+Revises: 0003_admin_filter_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0004_otp_indexes"
+down_revision = "0003_admin_filter_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Kept in sync with OTPVerification.__table_args__
+INDEXES = {
+    "ix_otp_verifications_lookup": "(identifier, verification_type, created_at) WHERE verified = false",
+    "ix_otp_verifications_expires_at": "(expires_at)",
+}
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON otp_verifications {definition}")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
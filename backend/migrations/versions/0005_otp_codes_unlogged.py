@@ -0,0 +1,31 @@
+"""UNLOGGED otp_codes table for OTP_STORE=unlogged
+
+Revision ID: 0005_otp_codes_unlogged
+Revises: 0004_otp_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0005_otp_codes_unlogged"
+down_revision = "0004_otp_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS otp_codes (
+            verification_type VARCHAR NOT NULL,
+            identifier VARCHAR NOT NULL,
+            otp VARCHAR NOT NULL,
+            expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            attempts INTEGER NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (verification_type, identifier)
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_otp_codes_expires_at ON otp_codes (expires_at)")
+
+
+def downgrade():
+    op.drop_table("otp_codes")
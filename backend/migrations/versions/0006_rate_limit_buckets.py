@@ -0,0 +1,29 @@
+"""UNLOGGED rate_limit_buckets table for RATE_LIMIT_BACKEND=postgres
+
+Revision ID: 0006_rate_limit_buckets
+Revises: 0005_otp_codes_unlogged
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0006_rate_limit_buckets"
+down_revision = "0005_otp_codes_unlogged"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+            key VARCHAR NOT NULL,
+            tokens FLOAT NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            expires_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (key)
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_rate_limit_buckets_expires_at ON rate_limit_buckets (expires_at)")
+
+
+def downgrade():
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,54 @@
+"""Location indexes for district-only and mandal-only filters
+
+The admin lists and CSV export filter on state, district and mandal
+independently. ix_*_location (current_state, current_district,
+current_mandal) only serves filters that include the state, so it is
+replaced by (current_district, current_mandal), for district and
+district + mandal, and (current_mandal) for mandal alone. State on its
+own matches a large share of members and is left to the list indexes.
+
+Built CONCURRENTLY, like 0003.
+
+Revision ID: 0007_location_filter_indexes
+Revises: 0006_rate_limit_buckets
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0007_location_filter_indexes"
+down_revision = "0006_rate_limit_buckets"
+branch_labels = None
+depends_on = None
+
+
+# name -> (table, column list); kept in sync with the models' __table_args__
+INDEXES = {
+    "ix_users_pending_district_mandal": ("users_pending", "(current_district, current_mandal)"),
+    "ix_users_pending_mandal": ("users_pending", "(current_mandal)"),
+    "ix_users_verified_district_mandal": ("users_verified", "(current_district, current_mandal)"),
+    "ix_users_verified_mandal": ("users_verified", "(current_mandal)"),
+}
+
+REPLACED = {
+    "ix_users_pending_location": ("users_pending", "(current_state, current_district, current_mandal)"),
+    "ix_users_verified_location": ("users_verified", "(current_state, current_district, current_mandal)"),
+}
+
+
+def upgrade():
+    # CREATE / DROP INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, (table, definition) in INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+        for name in REPLACED:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, (table, definition) in REPLACED.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,25 @@
+"""language column on users_pending / users_verified / users_rejected
+
+Revision ID: 0008_user_language
+Revises: 0007_location_filter_indexes
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0008_user_language"
+down_revision = "0007_location_filter_indexes"
+branch_labels = None
+depends_on = None
+
+TABLES = ("users_pending", "users_verified", "users_rejected")
+
+
+def upgrade():
+    # Constant default: no table rewrite. Existing members get English emails.
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS language VARCHAR(5) NOT NULL DEFAULT 'en'")
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_column(table, "language")
@@ -0,0 +1,77 @@
+import os
+import uuid
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+# app.core.database builds its engines on import but only connects when a
+# query runs. Point it at the test database (or a placeholder), never at
+# the DATABASE_URL from a developer's .env.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql://localhost/test"
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _search_path(schema: str) -> str:
+    return f"{schema},public"
+
+
+@pytest.fixture(scope="session")
+def migrated_schema():
+    """
+    Throwaway schema built by `alembic upgrade head`, so tests see exactly
+    the tables and indexes the migrations create. Dropped at the end of
+    the run.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"options": f"-c search_path={_search_path(schema)}"})
+
+    with engine.connect() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+        connection.commit()
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+
+    try:
+        with engine.connect() as connection:
+            config.attributes["connection"] = connection
+            command.upgrade(config, "head")
+            connection.commit()
+
+        yield schema
+
+    finally:
+        with engine.connect() as connection:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            connection.commit()
+
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def migrated_engine(migrated_schema):
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"options": f"-c search_path={_search_path(migrated_schema)}"})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def migrated_async_engine(migrated_schema):
+    """asyncpg engine on the migrated schema. No pool: each test runs its own event loop."""
+    # After the DATABASE_URL override above
+    from app.core.database import _async_database_url
+
+    return create_async_engine(
+        _async_database_url(TEST_DATABASE_URL),
+        poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": _search_path(migrated_schema)}}
+    )
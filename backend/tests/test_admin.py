@@ -0,0 +1,603 @@
+"""
+Admin listing queries and the admin job queue.
+
+The job queue tests and the query-plan regression for the admin filter / duplicate check indexes
+run on a schema built by the migrations. They need a Postgres with
+pg_trgm and are skipped otherwise:
+
+    TEST_DATABASE_URL=postgresql://... python -m pytest tests/test_admin.py
+"""
+import json
+import threading
+import uuid
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg, psycopg2
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import UserPending, UserRejected, UserVerified
+from app.models.admin_job import AdminJob
+from app.services import bulk_jobs, certificate_service, job_service
+from app.services.bulk_action_service import bulk_approve_pending, bulk_reject_pending
+from app.services.certificate_content import certificate_url
+from app.services.certificate_service import certificate_query, regenerate_certificates
+from app.services.count_service import Explain
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_paginate
+
+ROWS = 20000
+
+# Every text column is high-cardinality so the filters below are selective
+PROFILE_COLUMNS = """
+    full_name, surname, desired_name, father_or_husband_name, mother_name,
+    marital_status, gothram, education, occupation,
+    current_mandal, current_district, current_state, current_pin_code,
+    native_house_number, native_district, native_state, native_pin_code,
+    photo_url, pdf_url, referred_by_name, referred_mobile
+"""
+
+PROFILE_VALUES = """
+    'Full Name ' || n, 'Surname' || (n % 2000), 'Desired Name ' || n, 'Father ' || n, 'Mother ' || n,
+    'Married'::marital_status_enum, 'Gothram' || (n % 500), 'Graduate', 'Farmer',
+    'Mandal' || (n % 1000), 'District' || (n % 100), 'State' || (n % 10), '500001',
+    '1-1', 'Native District', 'Native State', '500001',
+    'https://example.com/photo.jpg', 'media/pdfs/' || n || '.pdf', 'Referrer', '9000000000'
+"""
+
+def pending_seed(first: int, last: int) -> str:
+    return f"""
+    INSERT INTO users_pending (
+        id, registration_id, verification_type, mobile_number, email, is_verified,
+        {PROFILE_COLUMNS}, pdf_status, status, created_at
+    )
+    SELECT
+        gen_random_uuid(), 'KGC-P' || n, 'mobile'::verification_type_enum,
+        '9' || lpad(n::text, 9, '0'), 'user' || n || '@example.com', true,
+        {PROFILE_VALUES}, 'ready',
+        (ARRAY['pending', 'hold', 'rejected'])[1 + n % 3]::user_status_enum,
+        now() - n * interval '1 minute'
+    FROM generate_series({first}, {last}) AS n
+"""
+
+
+SEED_PENDING = pending_seed(1, ROWS)
+
+def verified_seed(first: int, last: int) -> str:
+    return f"""
+    INSERT INTO users_verified (
+        id, membership_id, registration_id, verification_type, mobile_number, email,
+        {PROFILE_COLUMNS}, approved_at
+    )
+    SELECT
+        gen_random_uuid(), 'MEM-' || n, 'KGC-V' || n, 'mobile'::verification_type_enum,
+        '8' || lpad(n::text, 9, '0'), 'verified' || n || '@example.com',
+        {PROFILE_VALUES},
+        now() - n * interval '1 minute'
+    FROM generate_series({first}, {last}) AS n
+"""
+
+
+SEED_VERIFIED = verified_seed(1, ROWS)
+
+SEED_REJECTED = f"""
+    INSERT INTO users_rejected (
+        id, original_pending_id, registration_id, mobile_number, email, full_name, reject_reason
+    )
+    SELECT
+        gen_random_uuid(), gen_random_uuid(), 'KGC-R' || n,
+        '7' || lpad(n::text, 9, '0'), 'rejected' || n || '@example.com', 'Full Name ' || n, 'Incomplete'
+    FROM generate_series(1, {ROWS}) AS n
+"""
+
+SEEDED_TABLES = ("users_pending", "users_verified", "users_rejected")
+
+
+@pytest.fixture(scope="module")
+def conn(migrated_engine):
+    with migrated_engine.begin() as connection:
+        connection.execute(text(SEED_PENDING))
+        connection.execute(text(SEED_VERIFIED))
+        connection.execute(text(SEED_REJECTED))
+
+    # As autovacuum would: GIN pending lists merged, planner statistics current
+    with migrated_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table in SEEDED_TABLES:
+            connection.execute(text(f"VACUUM ANALYZE {table}"))
+
+    try:
+        with migrated_engine.connect() as connection:
+            yield connection
+    finally:
+        with migrated_engine.begin() as connection:
+            for table in SEEDED_TABLES:
+                connection.execute(text(f"DELETE FROM {table}"))
+
+
+def used_indexes(conn, statement) -> set:
+    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    plan = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    found = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            found.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+
+    return found
+
+
+# Same expressions as the /admin/pending-users and /admin/approved-users filters
+@pytest.mark.parametrize("statement, index", [
+    (
+        select(UserPending.id).where(UserPending.status == "pending")
+        .order_by(UserPending.created_at.desc().nulls_first(), UserPending.id.desc()).limit(21),
+        "ix_users_pending_status_created_at",
+    ),
+    (
+        select(UserPending.id).where(UserPending.gothram.ilike("%Gothram123%")),
+        "ix_users_pending_gothram_trgm",
+    ),
+    (
+        select(UserPending.id).where(UserPending.desired_name.ilike("%Name 12345%")),
+        "ix_users_pending_desired_name_trgm",
+    ),
+    (
+        select(UserPending.id).where(UserPending.surname == "Surname42"),
+        "ix_users_pending_surname",
+    ),
+    (
+        select(UserPending.id).where(
+            UserPending.current_state == "State3",
+            UserPending.current_district == "District13",
+            UserPending.current_mandal == "Mandal413",
+        ),
+        "ix_users_pending_district_mandal",
+    ),
+    (
+        select(UserPending.id).where(UserPending.current_district == "District13"),
+        "ix_users_pending_district_mandal",
+    ),
+    (
+        select(UserPending.id).where(UserPending.current_mandal == "Mandal413"),
+        "ix_users_pending_mandal",
+    ),
+    (
+        select(UserVerified.id)
+        .order_by(UserVerified.approved_at.desc().nulls_first(), UserVerified.id.desc()).limit(21),
+        "ix_users_verified_approved_at",
+    ),
+    (
+        select(UserVerified.id).where(UserVerified.gothram.ilike("%Gothram123%")),
+        "ix_users_verified_gothram_trgm",
+    ),
+    (
+        select(UserVerified.id).where(UserVerified.surname == "Surname42"),
+        "ix_users_verified_surname",
+    ),
+    (
+        select(UserVerified.id).where(
+            UserVerified.current_state == "State3",
+            UserVerified.current_district == "District13",
+            UserVerified.current_mandal == "Mandal413",
+        ),
+        "ix_users_verified_district_mandal",
+    ),
+    (
+        select(UserVerified.id).where(UserVerified.current_district == "District13"),
+        "ix_users_verified_district_mandal",
+    ),
+    (
+        select(UserVerified.id).where(UserVerified.current_mandal == "Mandal413"),
+        "ix_users_verified_mandal",
+    ),
+    # Duplicate checks in register / send-otp: served by the UNIQUE constraints
+    (
+        select(UserPending.id).where(UserPending.mobile_number == "9000012345").limit(1),
+        "users_pending_mobile_number_key",
+    ),
+    (
+        select(UserPending.id).where(UserPending.email == "user12345@example.com").limit(1),
+        "users_pending_email_key",
+    ),
+    (
+        select(UserVerified.id).where(UserVerified.mobile_number == "8000012345").limit(1),
+        "users_verified_mobile_number_key",
+    ),
+    (
+        select(UserVerified.id).where(UserVerified.email == "verified12345@example.com").limit(1),
+        "users_verified_email_key",
+    ),
+    # users_rejected: not unique (someone can be rejected twice)
+    (
+        select(UserRejected.id).where(UserRejected.mobile_number == "7000012345").limit(1),
+        "ix_users_rejected_mobile_number",
+    ),
+    (
+        select(UserRejected.id).where(UserRejected.email == "rejected12345@example.com").limit(1),
+        "ix_users_rejected_email",
+    ),
+])
+def test_admin_filters_use_index(conn, statement, index):
+    assert index in used_indexes(conn, statement)
+
+
+# =========================
+# COUNT ESTIMATE (EXPLAIN)
+# =========================
+
+def pending_listing_query():
+    # Same filters as /admin/pending-users with status, gothram and surname set
+    return (
+        Session().query(UserPending)
+        .filter(UserPending.status == "pending")
+        .filter(UserPending.gothram.ilike("%Gothram1%"))
+        .filter(UserPending.surname == "Surname42")
+    )
+
+
+def test_explain_binds_positionally_for_asyncpg():
+    compiled = Explain(pending_listing_query().statement).compile(dialect=asyncpg.dialect())
+
+    assert compiled.string.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "$1::user_status_enum" in compiled.string
+    assert compiled.positional
+
+    # What asyncpg receives, in $1, $2, $3 order: the values, never the names
+    bound = [compiled.params[name] for name in compiled.positiontup]
+    assert bound == ["pending", "%Gothram1%", "Surname42"]
+
+
+def test_explain_binds_by_name_for_psycopg2():
+    compiled = Explain(pending_listing_query().statement).compile(dialect=psycopg2.dialect())
+
+    assert compiled.string.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert not compiled.positional
+    assert sorted(compiled.params.values()) == ["%Gothram1%", "Surname42", "pending"]
+
+
+# =========================
+# JOB QUEUE
+# =========================
+
+class FlakyHandler:
+    """Fails the first `failures` calls, then succeeds."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self, db, job):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError(f"boom {self.calls}")
+
+
+@pytest.fixture
+def job_db(migrated_engine, monkeypatch):
+    monkeypatch.setattr(job_service, "SessionLocal", sessionmaker(bind=migrated_engine))
+
+    db = job_service.SessionLocal()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.execute(delete(AdminJob))
+        db.commit()
+        db.close()
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    job_ids = []
+    monkeypatch.setattr(job_service, "_submit", job_ids.append)
+    return job_ids
+
+
+def use_handler(monkeypatch, handler):
+    monkeypatch.setitem(job_service._handlers, "test_job", handler)
+    return handler
+
+
+def new_job(db, **values) -> AdminJob:
+    job = job_service.enqueue_job(db, "test_job", {}, created_by="admin", total=0)
+
+    for name, value in values.items():
+        setattr(job, name, value)
+    db.commit()
+
+    return job
+
+
+def reload(db, job) -> AdminJob:
+    db.expire_all()
+    return db.get(AdminJob, job.id)
+
+
+def stale_time():
+    return datetime.utcnow() - timedelta(seconds=job_service.JOB_STALE_SECONDS + 60)
+
+
+def test_job_is_claimed_once(job_db, submitted):
+    job = new_job(job_db)
+
+    claimed = job_service._claim(job_db, job.id)
+    assert claimed.status == "running"
+    assert claimed.attempts == 1
+
+    assert job_service._claim(job_db, job.id) is None
+
+
+def test_exhausted_job_is_not_claimed_or_submitted(job_db, submitted):
+    job = new_job(job_db, status="retrying", attempts=3, max_attempts=3)
+
+    assert job_service._claim(job_db, job.id) is None
+
+    submitted.clear()  # enqueue_job submits once itself
+    job_service._submit_due_jobs(job_db)
+    assert job.id not in submitted
+
+
+def test_due_jobs_wait_for_their_backoff(job_db, submitted):
+    due = new_job(job_db, status="retrying", attempts=1, next_run_at=datetime.utcnow() - timedelta(seconds=1))
+    later = new_job(job_db, status="retrying", attempts=1, next_run_at=datetime.utcnow() + timedelta(minutes=5))
+
+    submitted.clear()
+    job_service._submit_due_jobs(job_db)
+
+    assert due.id in submitted
+    assert later.id not in submitted
+
+
+def test_failed_attempt_is_retried_with_backoff(job_db, submitted, monkeypatch):
+    handler = use_handler(monkeypatch, FlakyHandler(failures=2))
+    job = new_job(job_db)
+    backoff = timedelta(seconds=job_service.JOB_RETRY_BACKOFF_SECONDS)
+
+    for attempt in (1, 2):
+        started = datetime.utcnow()
+        job_service.run_job(job.id)
+
+        job = reload(job_db, job)
+        assert job.status == "retrying"
+        assert job.attempts == attempt
+        assert job.last_error == f"boom {attempt}"
+        # Backoff grows with the attempt number
+        assert started + backoff * attempt <= job.next_run_at <= datetime.utcnow() + backoff * attempt
+
+    job_service.run_job(job.id)
+
+    job = reload(job_db, job)
+    assert job.status == "completed"
+    assert job.attempts == 3
+    assert handler.calls == 3
+
+
+def test_job_fails_after_max_attempts(job_db, submitted, monkeypatch):
+    handler = use_handler(monkeypatch, FlakyHandler(failures=10))
+    job = new_job(job_db)
+
+    for _ in range(job.max_attempts + 1):
+        job_service.run_job(job.id)
+
+    job = reload(job_db, job)
+    assert job.status == "failed"
+    assert job.attempts == job.max_attempts
+    assert job.finished_at is not None
+    assert handler.calls == job.max_attempts
+
+
+def test_stale_running_job_is_requeued(job_db):
+    stale = new_job(job_db, status="running", attempts=1, updated_at=stale_time())
+    fresh = new_job(job_db, status="running", attempts=1)
+
+    job_service._requeue_stale_jobs(job_db)
+
+    stale = reload(job_db, stale)
+    assert stale.status == "retrying"
+    assert stale.last_error == job_service.STALE_JOB_ERROR
+    assert stale.next_run_at is not None
+
+    assert reload(job_db, fresh).status == "running"
+
+
+def test_stale_job_out_of_attempts_is_failed(job_db):
+    stale = new_job(job_db, status="running", attempts=3, max_attempts=3, updated_at=stale_time())
+    waiting = new_job(job_db, status="retrying", attempts=3, max_attempts=3, last_error="boom 3")
+
+    job_service._requeue_stale_jobs(job_db)
+
+    stale = reload(job_db, stale)
+    assert stale.status == "failed"
+    assert stale.finished_at is not None
+    assert stale.last_error == job_service.STALE_JOB_ERROR
+
+    waiting = reload(job_db, waiting)
+    assert waiting.status == "failed"
+    assert waiting.last_error == "boom 3"
+
+
+# =========================
+# EMAIL LANGUAGE
+# =========================
+
+LANGUAGE_USERS = (f"KGC-P{ROWS + 1}", f"KGC-P{ROWS + 2}")
+
+
+@pytest.fixture
+def te_pending(migrated_engine):
+    with migrated_engine.begin() as connection:
+        connection.execute(text(pending_seed(ROWS + 1, ROWS + 2)))
+        user_ids = connection.execute(
+            text("""
+                UPDATE users_pending SET language = 'te', status = 'pending'
+                WHERE registration_id IN :registration_ids
+                RETURNING id
+            """).bindparams(registration_ids=LANGUAGE_USERS)
+        ).scalars().all()
+
+    try:
+        yield user_ids
+    finally:
+        with migrated_engine.begin() as connection:
+            for table in SEEDED_TABLES:
+                connection.execute(
+                    text(f"DELETE FROM {table} WHERE registration_id IN :registration_ids")
+                    .bindparams(registration_ids=LANGUAGE_USERS)
+                )
+
+
+def test_bulk_moves_email_in_the_registration_language(migrated_engine, te_pending, monkeypatch):
+    approve_id, reject_id = te_pending
+    admin_id = str(uuid.uuid4())
+
+    with Session(migrated_engine) as db:
+        approved = bulk_approve_pending(db, [approve_id], admin_id)
+        rejected = bulk_reject_pending(db, [reject_id], admin_id, "Incomplete")
+        db.commit()
+
+    sent = []
+    monkeypatch.setattr(bulk_jobs, "send_approval_emails", lambda recipients: sent.extend(recipients))
+    monkeypatch.setattr(bulk_jobs, "send_rejection_emails", lambda recipients, reason: sent.extend(recipients))
+
+    assert bulk_jobs._notify_approved(approved) == []
+    assert bulk_jobs._notify_rejected("Incomplete")(rejected) == []
+
+    assert [recipient["language"] for recipient in sent] == ["te", "te"]
+
+
+# =========================
+# CERTIFICATE REGENERATION
+# =========================
+
+REGEN_USERS = tuple(f"KGC-V{n}" for n in range(ROWS + 10, ROWS + 14))
+
+
+@pytest.fixture
+def regen_users(migrated_engine):
+    with migrated_engine.begin() as connection:
+        connection.execute(text(verified_seed(ROWS + 10, ROWS + 13)))
+        user_ids = connection.execute(
+            text("SELECT id FROM users_verified WHERE registration_id IN :registration_ids")
+            .bindparams(registration_ids=REGEN_USERS)
+        ).scalars().all()
+
+    try:
+        yield user_ids
+    finally:
+        with migrated_engine.begin() as connection:
+            connection.execute(
+                text("DELETE FROM users_verified WHERE registration_id IN :registration_ids")
+                .bindparams(registration_ids=REGEN_USERS)
+            )
+
+
+def test_regeneration_in_stream_mode_writes_no_files(migrated_engine, regen_users, monkeypatch):
+    monkeypatch.setattr(certificate_service, "PDF_STORAGE", "stream")
+    monkeypatch.setattr(certificate_service, "submit_job_render", None)  # must not render
+
+    with Session(migrated_engine) as db:
+        stats = regenerate_certificates(db, certificate_query(db, regen_users))
+        urls = db.execute(
+            select(UserVerified.registration_id, UserVerified.pdf_url, UserVerified.pdf_content_hash)
+            .where(UserVerified.id.in_(regen_users))
+        ).all()
+
+        assert stats["deferred"] == stats["rendered"] == len(regen_users)
+        assert all(url == certificate_url(registration_id) and digest for registration_id, url, digest in urls)
+
+        # Hashes are stored: a second run has nothing to do
+        assert regenerate_certificates(db, certificate_query(db, regen_users))["skipped"] == len(regen_users)
+
+
+def test_regeneration_bounds_renders_in_flight(migrated_engine, regen_users, monkeypatch):
+    inflight = []
+    peak = []
+    lock = threading.Lock()
+
+    def submit_job_render(data, language):
+        future = Future()
+        with lock:
+            inflight.append(future)
+            peak.append(len(inflight))
+
+        def finish():
+            with lock:
+                inflight.remove(future)
+            future.set_result(f"/media/pdfs/{data['registration_id']}.pdf")
+
+        threading.Timer(0.02, finish).start()
+        return future
+
+    monkeypatch.setattr(certificate_service, "PDF_STORAGE", "disk")
+    monkeypatch.setattr(certificate_service, "submit_job_render", submit_job_render)
+    monkeypatch.setattr(certificate_service, "fetch", lambda digest, registration_id: None)
+    monkeypatch.setattr(certificate_service, "store", lambda digest, registration_id: None)
+
+    with Session(migrated_engine) as db:
+        stats = regenerate_certificates(db, certificate_query(db, regen_users), force=True, workers=2)
+
+    assert stats["rendered"] == len(regen_users)
+    assert max(peak) <= 2
+
+
+# =========================
+# KEYSET PAGINATION
+# =========================
+
+def test_cursor_round_trip():
+    row_id = uuid.uuid4()
+    created_at = datetime(2026, 10, 18, 9, 30, 15, 123456)
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+    assert decode_cursor(encode_cursor(None, row_id)) == (None, row_id)
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+PAGED_USERS = tuple(f"KGC-P{n}" for n in range(ROWS + 20, ROWS + 25))
+
+
+@pytest.fixture
+def paged_users(migrated_engine):
+    with migrated_engine.begin() as connection:
+        connection.execute(text(pending_seed(ROWS + 20, ROWS + 24)))
+        # Two legacy rows without created_at
+        connection.execute(
+            text("UPDATE users_pending SET created_at = NULL WHERE registration_id IN :registration_ids")
+            .bindparams(registration_ids=PAGED_USERS[:2])
+        )
+
+    try:
+        yield
+    finally:
+        with migrated_engine.begin() as connection:
+            connection.execute(
+                text("DELETE FROM users_pending WHERE registration_id IN :registration_ids")
+                .bindparams(registration_ids=PAGED_USERS)
+            )
+
+
+def test_keyset_pages_through_rows_without_a_sort_value(migrated_engine, paged_users):
+    seen = []
+
+    with Session(migrated_engine) as db:
+        query = db.query(UserPending).filter(UserPending.registration_id.in_(PAGED_USERS))
+
+        after = None
+        while True:
+            rows, after = keyset_paginate(query, UserPending.created_at, UserPending.id, 2, after=after)
+            seen.extend(rows)
+            if after is None:
+                break
+
+    assert sorted(row.registration_id for row in seen) == sorted(PAGED_USERS)
+    assert [row.created_at for row in seen[:2]] == [None, None]
+    assert [row.created_at for row in seen[2:]] == sorted((row.created_at for row in seen[2:]), reverse=True)
@@ -0,0 +1,339 @@
+"""
+Rate limiting for the OTP and admin login endpoints, the OTP stores and
+verify-otp.
+
+The postgres / unlogged OTP stores run against the migrated test schema
+and are skipped without TEST_DATABASE_URL; the memory store always runs.
+"""
+import asyncio
+import ipaddress
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.requests import Request
+
+from app.api.v1 import auth
+from app.models.otp_code import OTPCode
+from app.models.otp_verification import OTPVerification
+from app.services import otp_cleanup_service, rate_limit_service
+from app.services.otp_store import OTP_STORES, MemoryOTPStore
+from app.services.rate_limit_service import MemoryRateLimiter
+from app.utils.client_ip import client_ip, parse_trusted_proxies
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit_service, "time", clock)
+    return clock
+
+
+def take(limiter, key="send_otp:ip:1.2.3.4", capacity=3, rate=0.5):
+    return asyncio.run(limiter.take(None, key, capacity, rate))
+
+
+# =========================
+# MEMORY TOKEN BUCKET
+# =========================
+
+def test_bucket_allows_burst_then_reports_retry_after(clock):
+    limiter = MemoryRateLimiter()
+
+    assert [take(limiter) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    # Empty: one token comes back after 1 / rate seconds
+    assert take(limiter) == pytest.approx(2.0)
+
+    clock.now += 0.5
+    assert take(limiter) == pytest.approx(1.5)
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = MemoryRateLimiter()
+    for _ in range(3):
+        take(limiter)
+
+    clock.now += 2.0
+    assert take(limiter) == 0.0
+    assert take(limiter) > 0
+
+    # Never refills past capacity
+    clock.now += 3600
+    assert [take(limiter) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert take(limiter) > 0
+
+
+def test_buckets_are_per_key(clock):
+    limiter = MemoryRateLimiter()
+    for _ in range(3):
+        take(limiter, key="a")
+
+    assert take(limiter, key="a") > 0
+    assert take(limiter, key="b") == 0.0
+
+
+def test_sweep_drops_only_full_buckets(clock):
+    limiter = MemoryRateLimiter()
+    take(limiter, key="old")
+    clock.now += 10
+    take(limiter, key="new")
+
+    # "old" refilled 2s after its take, "new" needs until now + 2
+    assert limiter.sweep() == 1
+    assert take(limiter, key="new") == 0.0
+
+
+def test_check_rate_limit_checks_ip_then_identifier(clock, monkeypatch):
+    limiter = MemoryRateLimiter()
+    monkeypatch.setattr(rate_limit_service, "get_rate_limiter", lambda: limiter)
+    monkeypatch.setitem(rate_limit_service.RATE_LIMITS, "test", {"ip": (10, 1.0), "id": (1, 0.1)})
+
+    check = rate_limit_service.check_rate_limit
+    assert asyncio.run(check(None, "test", "1.2.3.4", "user@example.com")) == 0.0
+
+    # Identifier bucket is empty even from another IP
+    assert asyncio.run(check(None, "test", "5.6.7.8", "user@example.com")) == pytest.approx(10.0)
+    assert asyncio.run(check(None, "test", "5.6.7.8", "other@example.com")) == 0.0
+
+
+# =========================
+# CLIENT IP BEHIND A PROXY
+# =========================
+
+def request(peer: str, forwarded: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "headers": headers, "client": (peer, 12345)})
+
+
+def test_forwarded_for_is_ignored_without_trusted_proxies():
+    assert client_ip(request("10.0.0.2", "6.6.6.6"), trusted=[]) == "10.0.0.2"
+
+
+def test_forwarded_for_is_used_from_a_trusted_proxy():
+    trusted = parse_trusted_proxies("10.0.0.0/8")
+
+    assert client_ip(request("10.0.0.2", "203.0.113.7"), trusted) == "203.0.113.7"
+
+
+def test_forged_hops_left_of_the_client_are_ignored():
+    trusted = parse_trusted_proxies("10.0.0.0/8, 100.64.0.0/10")
+
+    # Client sent "6.6.6.6" itself; the proxies appended the real address and their own
+    forwarded = "6.6.6.6, 203.0.113.7, 100.64.0.9"
+    assert client_ip(request("10.0.0.2", forwarded), trusted) == "203.0.113.7"
+
+
+def test_untrusted_peer_cannot_spoof():
+    trusted = parse_trusted_proxies("10.0.0.0/8")
+
+    assert client_ip(request("198.51.100.1", "203.0.113.7"), trusted) == "198.51.100.1"
+
+
+def test_trust_all_takes_the_rightmost_hop():
+    assert client_ip(request("172.16.0.1", "6.6.6.6, 203.0.113.7"), "*") == "203.0.113.7"
+
+
+def test_parse_trusted_proxies():
+    assert parse_trusted_proxies("") == []
+    assert parse_trusted_proxies("*") == "*"
+    assert parse_trusted_proxies("10.0.0.1, 10.1.0.0/16") == [
+        ipaddress.ip_network("10.0.0.1/32"),
+        ipaddress.ip_network("10.1.0.0/16"),
+    ]
+
+    with pytest.raises(ValueError):
+        parse_trusted_proxies("not-an-ip")
+
+
+# =========================
+# OTP STORES (SHARED CONTRACT)
+# =========================
+
+class StoreUnderTest:
+    """Calls a store the way auth.py does: one session per request."""
+
+    def __init__(self, store, sessions=None):
+        self.store = store
+        self.sessions = sessions
+
+    async def _request(self, method: str, *args):
+        if self.sessions is None:
+            return await getattr(self.store, method)(None, *args)
+
+        async with self.sessions() as db:
+            return await getattr(self.store, method)(db, *args)
+
+    def call(self, method: str, *args):
+        return asyncio.run(self._request(method, *args))
+
+    def race(self, method: str, *args, times: int = 2) -> list:
+        """The same call from `times` concurrent requests, each on its own session."""
+        async def run():
+            return await asyncio.gather(*[self._request(method, *args) for _ in range(times)])
+
+        return asyncio.run(run())
+
+    def save(self, identifier: str, otp: str, expires_in=timedelta(minutes=5)):
+        self.call("save", "email", identifier, otp, datetime.utcnow() + expires_in)
+
+    def latest(self, identifier: str):
+        return self.call("latest", "email", identifier)
+
+
+@pytest.fixture(params=list(OTP_STORES))
+def otp_store(request, monkeypatch):
+    store = OTP_STORES[request.param]()
+
+    if request.param == "memory":
+        yield StoreUnderTest(store)
+        return
+
+    engine = request.getfixturevalue("migrated_engine")
+    async_engine = request.getfixturevalue("migrated_async_engine")
+    monkeypatch.setattr(otp_cleanup_service, "engine", engine)
+
+    try:
+        yield StoreUnderTest(store, async_sessionmaker(async_engine))
+    finally:
+        with engine.begin() as connection:
+            connection.execute(delete(OTPVerification))
+            connection.execute(delete(OTPCode))
+
+
+@pytest.fixture
+def identifier():
+    return f"{uuid.uuid4().hex}@example.com"
+
+
+def test_store_saves_and_returns_the_latest_code(otp_store, identifier):
+    assert otp_store.latest(identifier) is None
+
+    otp_store.save(identifier, "111111")
+    record = otp_store.latest(identifier)
+
+    assert record.otp == "111111"
+    assert record.attempts == 0
+    assert record.expires_at > datetime.utcnow()
+
+    otp_store.save(identifier, "222222")
+    assert otp_store.latest(identifier).otp == "222222"
+
+
+def test_store_counts_attempts(otp_store, identifier):
+    otp_store.save(identifier, "111111")
+    record = otp_store.latest(identifier)
+
+    assert otp_store.call("add_attempt", record) == 1
+    assert otp_store.call("add_attempt", record) == 2
+    assert otp_store.latest(identifier).attempts == 2
+
+
+def test_store_mark_verified_consumes_the_code(otp_store, identifier):
+    otp_store.save(identifier, "111111")
+    record = otp_store.latest(identifier)
+
+    assert otp_store.call("mark_verified", record) is True
+    assert otp_store.latest(identifier) is None
+
+    # Already used: a second verify with the same record gets nothing
+    assert otp_store.call("mark_verified", record) is False
+
+
+def test_store_concurrent_verifies_consume_the_code_once(otp_store, identifier):
+    otp_store.save(identifier, "111111")
+    record = otp_store.latest(identifier)
+
+    assert sorted(otp_store.race("mark_verified", record, times=3)) == [False, False, True]
+
+
+def test_store_mark_verified_keeps_a_newer_code(otp_store, identifier):
+    otp_store.save(identifier, "111111")
+    old = otp_store.latest(identifier)
+
+    # A new code is sent between reading the old one and verifying it
+    otp_store.save(identifier, "222222")
+    otp_store.call("mark_verified", old)
+
+    assert otp_store.latest(identifier).otp == "222222"
+
+
+def test_store_sweep_drops_only_expired_codes(otp_store, identifier):
+    expired = f"expired-{identifier}"
+    otp_store.save(expired, "111111", expires_in=timedelta(minutes=-1))
+    otp_store.save(identifier, "222222")
+
+    otp_store.store.sweep()
+
+    assert otp_store.latest(expired) is None
+    assert otp_store.latest(identifier).otp == "222222"
+
+
+# =========================
+# MEMORY OTP STORE
+# =========================
+
+def test_memory_store_sweep_reports_the_count():
+    store = StoreUnderTest(OTP_STORES["memory"]())
+    store.save("a@example.com", "111111", expires_in=timedelta(minutes=-1))
+    store.save("b@example.com", "222222", expires_in=timedelta(minutes=-1))
+    store.save("c@example.com", "333333")
+
+    assert store.store.sweep() == 2
+    assert store.store.sweep() == 0
+
+
+def test_memory_store_keys_by_type_and_identifier():
+    store = StoreUnderTest(OTP_STORES["memory"]())
+    store.save("9876543210", "111111")
+    store.call("save", "mobile", "9876543210", "222222", datetime.utcnow() + timedelta(minutes=5))
+
+    assert store.latest("9876543210").otp == "111111"
+    assert store.call("latest", "mobile", "9876543210").otp == "222222"
+
+
+# =========================
+# VERIFY OTP
+# =========================
+
+class LosingStore(MemoryOTPStore):
+    """Another request consumes the code between latest() and mark_verified()."""
+
+    async def mark_verified(self, db, record) -> bool:
+        await super().mark_verified(db, record)
+        return False
+
+
+def verify(store, monkeypatch, otp="111111"):
+    monkeypatch.setattr(auth, "get_otp_store", lambda: store)
+    payload = auth.VerifyOTPRequest(type="email", value="a@example.com", otp=otp)
+    return asyncio.run(auth.verify_otp(payload, db=None))
+
+
+def test_verify_otp_issues_a_token(monkeypatch):
+    store = MemoryOTPStore()
+    StoreUnderTest(store).save("a@example.com", "111111")
+
+    assert verify(store, monkeypatch)["verification_token"]
+
+
+def test_verify_otp_already_used_gets_no_token(monkeypatch):
+    store = LosingStore()
+    StoreUnderTest(store).save("a@example.com", "111111")
+
+    with pytest.raises(HTTPException) as error:
+        verify(store, monkeypatch)
+
+    assert error.value.status_code == 400
+    assert error.value.detail == "OTP already used"
@@ -0,0 +1,118 @@
+"""
+Registration verification tokens (/auth/verify-otp -> /users/register).
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from app.api.deps import get_current_admin
+from app.api.v1.users import _is_verified
+from app.core import security
+from app.core.security import create_access_token, create_verification_token, decode_verification_token
+from app.schemas.user import VerificationType
+
+MOBILE = "9876543210"
+EMAIL = "member@example.com"
+
+
+def registration(token: str | None, verification_type=VerificationType.mobile):
+    # _is_verified only reads these two fields of UserRegistrationRequest
+    return SimpleNamespace(verification_token=token, verification_type=verification_type)
+
+
+def admin_token() -> str:
+    return create_access_token({"sub": "admin-id", "role": "super_admin"})
+
+
+# =========================
+# decode_verification_token
+# =========================
+
+def test_verification_token_round_trip():
+    payload = decode_verification_token(create_verification_token("mobile", MOBILE))
+
+    assert payload["sub"] == MOBILE
+    assert payload["type"] == "mobile"
+
+
+def test_admin_token_is_not_a_verification_token():
+    assert decode_verification_token(admin_token()) is None
+
+
+def test_verification_token_is_not_an_admin_token():
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_verification_token("mobile", MOBILE))
+
+    with pytest.raises(HTTPException) as error:
+        get_current_admin(credentials)
+
+    assert error.value.status_code == 401
+
+
+def test_admin_token_still_works_for_admins():
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=admin_token())
+    assert get_current_admin(credentials)["sub"] == "admin-id"
+
+
+def test_expired_verification_token_is_rejected(monkeypatch):
+    monkeypatch.setattr(security, "VERIFICATION_TOKEN_EXPIRE_MINUTES", -1)
+    assert decode_verification_token(create_verification_token("mobile", MOBILE)) is None
+
+
+def test_verification_token_signed_with_another_key_is_rejected():
+    claims = jwt.get_unverified_claims(create_verification_token("mobile", MOBILE))
+    forged = jwt.encode(claims, "not-the-secret-key", algorithm=security.ALGORITHM)
+
+    assert decode_verification_token(forged) is None
+
+
+# =========================
+# _is_verified (register)
+# =========================
+
+def test_is_verified_by_mobile():
+    token = create_verification_token("mobile", MOBILE)
+    assert _is_verified(registration(token), MOBILE, None)
+
+
+def test_is_verified_by_email_ignores_case():
+    token = create_verification_token("email", "Member@Example.com")
+    assert _is_verified(registration(token, VerificationType.email), None, EMAIL)
+
+
+def test_is_verified_rejects_missing_token():
+    assert not _is_verified(registration(None), MOBILE, None)
+
+
+def test_is_verified_rejects_type_mismatch():
+    # Token for an email OTP, registration claims mobile verification
+    token = create_verification_token("email", EMAIL)
+    assert not _is_verified(registration(token), MOBILE, EMAIL)
+
+
+def test_is_verified_rejects_another_mobile():
+    token = create_verification_token("mobile", "9000000000")
+    assert not _is_verified(registration(token), MOBILE, None)
+
+
+def test_is_verified_rejects_another_email():
+    token = create_verification_token("email", "someone.else@example.com")
+    assert not _is_verified(registration(token, VerificationType.email), None, EMAIL)
+
+
+def test_is_verified_rejects_registration_without_the_verified_identifier():
+    token = create_verification_token("mobile", MOBILE)
+    assert not _is_verified(registration(token), None, EMAIL)
+
+
+def test_is_verified_rejects_admin_token():
+    assert not _is_verified(registration(admin_token()), MOBILE, None)
+
+
+def test_is_verified_rejects_expired_token(monkeypatch):
+    monkeypatch.setattr(security, "VERIFICATION_TOKEN_EXPIRE_MINUTES", -1)
+    token = create_verification_token("mobile", MOBILE)
+
+    assert not _is_verified(registration(token), MOBILE, None)